@@ -0,0 +1,107 @@
+"""Time the reference and columnar feature engines on a synthetic 1950-2026 history."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from typing import Any
+
+from benchmark_hot_paths import best_of
+from f1_strategy_data.feature_frames import next_pit_frame, pit_count_frame, pre_race_finishing_frame
+from f1_strategy_data.features import (
+    build_next_pit_features,
+    build_pit_count_features,
+    build_pre_race_finishing_features,
+)
+
+
+def synthetic_history(
+    first_season: int, last_season: int, rounds: int, drivers: int, seed: int,
+) -> dict[str, list[dict[str, str]]]:
+    """Canonical-shaped string rows, as ``csv.DictReader`` yields them."""
+    generator = random.Random(seed)
+    tables: dict[str, list[dict[str, str]]] = {"races": [], "pits": [], "stints": [], "contexts": []}
+    for season in range(first_season, last_season + 1):
+        for round_number in range(1, rounds + 1):
+            key = {"season": str(season), "round_number": str(round_number)}
+            laps = generator.randint(50, 70)
+            tables["contexts"].append({
+                **key, "circuit_key": str(generator.randint(1, 40)), "start_rainfall": str(generator.random() < 0.2),
+                "start_air_temperature_c": f"{generator.uniform(10, 35):.1f}", "winner_laps_completed": str(laps),
+                "safety_car_deployments": str(generator.randint(0, 3)),
+                "virtual_safety_car_deployments": str(generator.randint(0, 2)),
+            })
+            for position, number in enumerate(generator.sample(range(drivers * 3), drivers), start=1):
+                driver = f"driver_{number}"
+                completed = laps if generator.random() < 0.85 else generator.randint(1, laps)
+                tables["races"].append({
+                    **key, "session_key": str(season * 100 + round_number), "driver_id": driver,
+                    "constructor_id": f"team_{number % 10}", "grid_position": str(generator.randint(1, drivers)),
+                    "classified_position": str(position), "laps_completed": str(completed),
+                    "status": "Finished" if completed == laps else "Retired",
+                })
+                lap = 1
+                for stint_number in range(1, generator.randint(1, 4) + 1):
+                    end = completed if stint_number == 4 else min(completed, lap + generator.randint(10, 30))
+                    tables["stints"].append({
+                        **key, "driver_id": driver, "stint_number": str(stint_number), "compound": "MEDIUM",
+                        "lap_start": str(lap), "lap_end": str(end), "tyre_age_at_start_laps": "0",
+                    })
+                    if end < completed:
+                        tables["pits"].append({**key, "driver_id": driver, "lap_number": str(end)})
+                    lap = end + 1
+                    if lap > completed:
+                        break
+    return tables
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--first-season", type=int, default=1950)
+    parser.add_argument("--last-season", type=int, default=2026)
+    parser.add_argument("--rounds", type=int, default=20, help="Rounds per season")
+    parser.add_argument("--drivers", type=int, default=20, help="Drivers per race")
+    parser.add_argument("--holdout-season", type=int, default=2026)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    rows = synthetic_history(args.first_season, args.last_season, args.rounds, args.drivers, args.seed)
+    # Both engines start from strings, as read from the canonical CSV files.
+    frames = {name: pd.DataFrame(table, dtype=str) for name, table in rows.items()}
+    holdout = args.holdout_season
+    tasks: dict[str, tuple[Any, Any]] = {
+        "pre_race_finishing_position": (
+            lambda: build_pre_race_finishing_features(rows["races"], holdout, rows["contexts"]),
+            lambda: pre_race_finishing_frame(frames["races"], holdout, frames["contexts"]),
+        ),
+        "pre_race_pit_stop_count": (
+            lambda: build_pit_count_features(rows["races"], rows["pits"], rows["stints"], holdout, rows["contexts"]),
+            lambda: pit_count_frame(frames["races"], frames["pits"], frames["stints"], holdout, frames["contexts"]),
+        ),
+        "live_next_pit": (
+            lambda: build_next_pit_features(rows["races"], rows["pits"], rows["stints"], holdout),
+            lambda: next_pit_frame(frames["races"], frames["pits"], frames["stints"], holdout),
+        ),
+    }
+    results = []
+    for table, (python_engine, pandas_engine) in tasks.items():
+        python_seconds = best_of(args.repeat, python_engine)
+        pandas_seconds = best_of(args.repeat, pandas_engine)
+        results.append({
+            "table": table,
+            "race_driver_rows": len(rows["races"]),
+            "feature_rows": len(pandas_engine()),
+            "python_seconds": round(python_seconds, 6),
+            "pandas_seconds": round(pandas_seconds, 6),
+            "speedup": round(python_seconds / pandas_seconds, 2),
+        })
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
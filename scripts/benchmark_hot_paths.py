@@ -0,0 +1,100 @@
+"""Time the normalization hot paths on synthetic sessions of growing size."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from f1_strategy_data.normalize import WeatherTimeline, count_shared_stint_boundaries, normalize_stints
+
+
+SESSION_START = datetime(2024, 3, 2, 13, tzinfo=UTC)
+
+
+def synthetic_stints(drivers: int, stints: int, seed: int) -> list[dict[str, Any]]:
+    """OpenF1-shaped stints with shared boundary laps and zero-lap records."""
+    generator = random.Random(seed)
+    rows: list[dict[str, Any]] = []
+    for driver_number in range(1, drivers + 1):
+        lap = 1
+        for stint_number in range(1, stints + 1):
+            length = generator.randint(1, 4)
+            if generator.random() < 0.1:
+                rows.append(_stint(driver_number, stint_number, lap, lap - 1))
+                continue
+            rows.append(_stint(driver_number, stint_number, lap, lap + length))
+            lap += length + (generator.random() < 0.5)
+    return rows
+
+
+def _stint(driver_number: int, stint_number: int, lap_start: int, lap_end: int) -> dict[str, Any]:
+    return {
+        "session_key": 1, "driver_number": driver_number, "stint_number": stint_number,
+        "compound": "MEDIUM", "lap_start": lap_start, "lap_end": lap_end, "tyre_age_at_start": 0,
+    }
+
+
+def synthetic_weather(minutes: int) -> list[dict[str, Any]]:
+    """Minute-level OpenF1-shaped weather rows, newest first like a raw response."""
+    return [
+        {"session_key": 1, "date": (SESSION_START + timedelta(minutes=minute)).isoformat(), "air_temperature": 20.0}
+        for minute in reversed(range(minutes))
+    ]
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drivers", type=int, default=20)
+    parser.add_argument("--stints", type=int, nargs="+", default=[10, 100, 1000], help="Stints per driver")
+    parser.add_argument("--weather-minutes", type=int, default=240, help="Minute-level weather rows")
+    parser.add_argument("--lookups", type=int, default=1000, help="Per-lap weather lookups to time")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    identifiers = {number: f"driver-{number}" for number in range(1, args.drivers + 1)}
+    results = []
+    for stints in args.stints:
+        rows = synthetic_stints(args.drivers, stints, args.seed)
+        results.append({
+            "stints_per_driver": stints,
+            "source_rows": len(rows),
+            "normalize_stints_seconds": round(best_of(args.repeat, lambda: normalize_stints(
+                [dict(row) for row in rows], identifiers, 2024, 1, "synthetic", "synthetic"
+            )), 6),
+            "count_shared_stint_boundaries_seconds": round(
+                best_of(args.repeat, lambda: count_shared_stint_boundaries(rows, identifiers)), 6
+            ),
+        })
+    weather = synthetic_weather(args.weather_minutes)
+    timeline = WeatherTimeline(weather)
+    step = timedelta(minutes=args.weather_minutes) / max(args.lookups, 1)
+    moments = [SESSION_START + step * index for index in range(args.lookups)]
+    results.append({
+        "weather_rows": len(weather),
+        "lookups": len(moments),
+        "weather_timeline_build_seconds": round(best_of(args.repeat, lambda: WeatherTimeline(weather)), 6),
+        "weather_lookups_seconds": round(best_of(args.repeat, lambda: [
+            timeline.nearest(moment, timedelta(minutes=15)) for moment in moments
+        ]), 6),
+    })
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""Benchmark season builds against replayed source responses with no network."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from f1_strategy_data import sources
+from f1_strategy_data.batch import build_seasons
+from f1_strategy_data.ratelimit import HostBudget, TokenBucketLimiter
+from f1_strategy_data.replay import Cassette, FaultPlan, ReplayServer, replaying
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--data-root", type=Path, help="Replay the raw/ snapshots under this data root")
+    source.add_argument("--cassette", type=Path, help="Replay a recorded cassette file")
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument("--end-year", type=int, required=True)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--prefetch", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--rate-limited", type=float, default=0.0, help="Probability of answering 429")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="Probability of answering 503")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--live-rate-limits", action="store_true",
+        help="Keep the production per-host rate limits instead of removing them",
+    )
+    parser.add_argument("--save-cassette", type=Path, help="Write the replayed responses as a cassette")
+    args = parser.parse_args()
+
+    cassette = Cassette.load(args.cassette) if args.cassette else Cassette.from_raw(args.data_root)
+    if args.save_cassette:
+        cassette.save(args.save_cassette)
+    if not args.live_rate_limits:
+        sources.set_rate_limiter(TokenBucketLimiter({}, HostBudget.from_interval(0)))
+    faults = FaultPlan(args.latency, args.rate_limited, args.server_errors, seed=args.seed)
+    with tempfile.TemporaryDirectory() as output, ReplayServer(cassette, faults) as server, replaying(server):
+        started = time.perf_counter()
+        manifest = build_seasons(
+            args.start_year, args.end_year, Path(output), workers=args.workers, prefetch=args.prefetch
+        )
+        elapsed = time.perf_counter() - started
+    races = sum(manifest["summary"].values())
+    print(json.dumps({
+        "interactions": len(cassette.interactions),
+        "elapsed_seconds": round(elapsed, 3),
+        "races_per_second": round(races / elapsed, 3) if elapsed else None,
+        "summary": manifest["summary"],
+        "responses_by_status": dict(sorted(server.counts.items())),
+    }, indent=2))
+    for host, stats in sorted(sources.request_stats().items()):
+        print(
+            f"{host}: {stats.requests} requests, {stats.network_seconds:.1f}s on the network, "
+            f"{stats.throttled_seconds:.1f}s throttled"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,45 @@
+"""Print pre-race features for the grid of an upcoming race."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+from pathlib import Path
+
+from f1_strategy_data.feature_service import PreRaceFeatureService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--grid", type=Path, required=True, help="race_drivers-shaped CSV for the upcoming race")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--round", type=int, required=True)
+    parser.add_argument("--race-context", type=Path, help="race_context CSV containing the upcoming race")
+    parser.add_argument("--finishing-features", type=Path,
+                        default=Path("data/features/pre_race_finishing_position.csv"),
+                        help="Incrementally built finishing-position features")
+    parser.add_argument("--pit-count-features", type=Path,
+                        default=Path("data/features/pre_race_pit_stop_count.csv"),
+                        help="Incrementally built pit-stop-count features")
+    args = parser.parse_args()
+
+    service = PreRaceFeatureService.load(args.finishing_features, args.pit_count_features)
+    with args.grid.open(encoding="utf-8", newline="") as handle:
+        grid = list(csv.DictReader(handle))
+    context = None
+    if args.race_context is not None:
+        with args.race_context.open(encoding="utf-8", newline="") as handle:
+            context = next((
+                row for row in csv.DictReader(handle)
+                if (int(row["season"]), int(row["round_number"])) == (args.season, args.round)
+            ), None)
+    print(json.dumps({
+        "pre_race_finishing_position": service.finishing_features(grid, args.season, args.round, context),
+        "pre_race_pit_stop_count": service.pit_count_features(grid, args.season, args.round, context),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from f1_strategy_data.features import build_next_pit_feature_file
+from f1_strategy_data.features import FEATURE_ENGINES, build_next_pit_feature_file
 
 
 def main() -> int:
@@ -15,9 +15,13 @@ def main() -> int:
     parser.add_argument("--stints", type=Path, required=True)
     parser.add_argument("--output", type=Path, default=Path("data/features/live_next_pit.csv"))
     parser.add_argument("--holdout-season", type=int)
+    parser.add_argument("--engine", choices=FEATURE_ENGINES, default="python",
+                        help="Row-by-row reference builder or the columnar pandas engine")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only races after the checkpoint saved next to --output")
     args = parser.parse_args()
     count = build_next_pit_feature_file(
-        args.race_drivers, args.pit_events, args.stints, args.output, args.holdout_season
+        args.race_drivers, args.pit_events, args.stints, args.output, args.holdout_season, args.engine, args.incremental
     )
     print(f"Wrote {count} leakage-safe lap rows to {args.output}")
     return 0
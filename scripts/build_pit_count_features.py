@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from f1_strategy_data.features import build_pit_count_feature_file
+from f1_strategy_data.features import FEATURE_ENGINES, build_pit_count_feature_file
 
 
 def main() -> int:
@@ -16,10 +16,14 @@ def main() -> int:
     parser.add_argument("--output", type=Path, default=Path("data/features/pre_race_pit_stop_count.csv"))
     parser.add_argument("--holdout-season", type=int)
     parser.add_argument("--race-context", type=Path)
+    parser.add_argument("--engine", choices=FEATURE_ENGINES, default="python",
+                        help="Row-by-row reference builder or the columnar pandas engine")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only races after the checkpoint saved next to --output")
     args = parser.parse_args()
     count = build_pit_count_feature_file(
         args.race_drivers, args.pit_events, args.stints, args.output,
-        args.holdout_season, args.race_context
+        args.holdout_season, args.race_context, args.engine, args.incremental
     )
     print(f"Wrote {count} leakage-safe rows to {args.output}")
     return 0
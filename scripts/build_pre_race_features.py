@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from f1_strategy_data.features import build_pre_race_feature_file
+from f1_strategy_data.features import FEATURE_ENGINES, build_pre_race_feature_file
 
 
 def main() -> int:
@@ -14,8 +14,13 @@ def main() -> int:
     parser.add_argument("--output", type=Path, default=Path("data/features/pre_race_finishing_position.csv"))
     parser.add_argument("--holdout-season", type=int, help="This season and later are marked as test")
     parser.add_argument("--race-context", type=Path)
+    parser.add_argument("--engine", choices=FEATURE_ENGINES, default="python",
+                        help="Row-by-row reference builder or the columnar pandas engine")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only races after the checkpoint saved next to --output")
     args = parser.parse_args()
-    count = build_pre_race_feature_file(args.input, args.output, args.holdout_season, args.race_context)
+    count = build_pre_race_feature_file(args.input, args.output, args.holdout_season, args.race_context,
+                                        args.engine, args.incremental)
     print(f"Wrote {count} leakage-safe rows to {args.output}")
     return 0
 
@@ -6,7 +6,10 @@ import argparse
 import json
 from pathlib import Path
 
+from f1_strategy_data import sources
 from f1_strategy_data.batch import build_seasons
+from f1_strategy_data.columnar import export_parquet
+from f1_strategy_data.ratelimit import FileRateLimiter
 
 
 def main() -> int:
@@ -16,9 +19,43 @@ def main() -> int:
     parser.add_argument("--data-root", type=Path, default=Path("data"))
     parser.add_argument("--fail-fast", action="store_true")
     parser.add_argument("--refresh", action="store_true", help="Ignore cached raw source snapshots")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Build races concurrently; source requests still share per-host rate limits",
+    )
+    parser.add_argument(
+        "--rate-limit-file", type=Path,
+        help="Share per-host request budgets with other build processes through this lock file",
+    )
+    parser.add_argument(
+        "--response-cache-mb", type=int, default=sources.DEFAULT_RESPONSE_CACHE_BYTES // (1024 * 1024),
+        help="Memory for reusing identical source responses within this run (0 disables reuse)",
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true",
+        help="Request each OpenF1 endpoint once per season and split it into per-race snapshots",
+    )
+    parser.add_argument(
+        "--parquet", action="store_true",
+        help="Also write typed Parquet copies of processed and consolidated tables (requires pyarrow)",
+    )
     args = parser.parse_args()
-    manifest = build_seasons(args.start_year, args.end_year, args.data_root, not args.fail_fast, args.refresh)
+    if args.rate_limit_file:
+        limiter = sources.default_rate_limiter()
+        sources.set_rate_limiter(FileRateLimiter(args.rate_limit_file, limiter.budgets, limiter.default))
+    manifest = build_seasons(
+        args.start_year, args.end_year, args.data_root, not args.fail_fast, args.refresh, args.workers,
+        args.prefetch, args.response_cache_mb * 1024 * 1024,
+    )
     print(json.dumps({"summary": manifest["summary"], "consolidated_rows": manifest["consolidated_rows"]}, indent=2))
+    if args.parquet:
+        written = export_parquet(args.data_root, args.start_year, args.end_year)
+        print(f"Wrote {written} Parquet tables")
+    for host, stats in sorted(sources.request_stats().items()):
+        print(
+            f"{host}: {stats.requests} requests, {stats.network_seconds:.1f}s on the network, "
+            f"{stats.throttled_seconds:.1f}s throttled, {stats.cache_hits} served from memory"
+        )
     failed_runs = [run for run in manifest["runs"] if run.get("status") == "failed"]
     if failed_runs:
         print("\nFailed race builds:")
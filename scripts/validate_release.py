@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 from pathlib import Path
 
+from f1_strategy_data.frame_validation import read_table, table_issues
+from f1_strategy_data.validation import (
+    ValidationIssue, cross_table_issues, pit_stop_issues, stint_issues, weather_issues,
+)
+
 
 REQUIRED_TABLES = (
     "race_context", "race_drivers", "stints", "pit_events", "weather_observations"
 )
+ROW_VALIDATORS = {"pit_events": pit_stop_issues, "stints": stint_issues, "weather_observations": weather_issues}
 
 
 def validate_manifest(path: Path) -> list[str]:
@@ -27,11 +34,61 @@ def validate_manifest(path: Path) -> list[str]:
     return errors
 
 
+def consolidated_table_errors(path: Path) -> list[str]:
+    """Re-run the field-level and cross-table rules over consolidated tables.
+
+    Field rules use the columnar validators when pandas is installed; their
+    results are identical to the row validators, which are the fallback.
+    """
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    directory = path.parent / f"consolidated_{manifest['start_year']}_{manifest['end_year']}"
+    errors: list[str] = []
+    for table in REQUIRED_TABLES:
+        table_path = directory / f"{table}.csv"
+        if not table_path.exists():
+            continue
+        issues = [issue for issue in _table_issues(table, table_path) if issue.severity == "error"]
+        if issues:
+            codes = sorted({issue.code for issue in issues})
+            errors.append(f"consolidated table {table} has {len(issues)} error(s): {', '.join(codes)}")
+    paths = {table: directory / f"{table}.csv" for table in ("race_drivers", "stints", "pit_events")}
+    if all(path.exists() for path in paths.values()):
+        with (
+            paths["race_drivers"].open(encoding="utf-8", newline="") as drivers,
+            paths["stints"].open(encoding="utf-8", newline="") as stints,
+            paths["pit_events"].open(encoding="utf-8", newline="") as pit_events,
+        ):
+            cross_table = cross_table_issues(csv.DictReader(drivers), csv.DictReader(stints), csv.DictReader(pit_events))
+        for table, table_issues in cross_table.items():
+            issues = [issue for issue in table_issues if issue.severity == "error"]
+            if issues:
+                errors.append(f"consolidated table {table} has {len(issues)} row(s) whose driver is missing from race_drivers")
+    return errors
+
+
+def _table_issues(table: str, path: Path) -> list[ValidationIssue]:
+    try:
+        import pandas  # noqa: F401 - only needed by the columnar validators
+    except ImportError:
+        validator = ROW_VALIDATORS.get(table)
+        if validator is None:
+            return []
+        with path.open(encoding="utf-8", newline="") as handle:
+            return validator(list(csv.DictReader(handle)))
+    return table_issues(table, read_table(path))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("manifest", type=Path)
+    parser.add_argument(
+        "--check-tables", action="store_true",
+        help="Also re-validate the consolidated tables and their driver references",
+    )
     args = parser.parse_args()
     errors = validate_manifest(args.manifest)
+    if args.check_tables:
+        errors.extend(consolidated_table_errors(args.manifest))
     if errors:
         print("Release validation failed:")
         for error in errors:
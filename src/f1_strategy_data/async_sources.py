@@ -0,0 +1,209 @@
+"""Asyncio source client that reuses keep-alive connections per host.
+
+The synchronous functions in :mod:`sources` open a new connection for every
+request. A long backfill therefore pays for thousands of TLS handshakes. This
+client keeps a small pool of persistent HTTP/1.1 connections per host while
+sharing the same throttle, retry rules, URLs, and ``(payload, provenance)``
+return shape as the synchronous clients.
+
+The standard library has no asynchronous HTTP client, so each blocking
+``http.client`` exchange runs in a worker thread and the event loop only
+coordinates pooling, throttling, and retry delays.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import time
+from collections.abc import Mapping
+from email.message import Message
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+from . import sources
+
+
+_Origin = tuple[str, str, int]
+
+
+class AsyncSourceClient:
+    """Fetch source snapshots over pooled persistent connections.
+
+    ``origins`` optionally maps a canonical origin such as
+    ``"https://api.openf1.org"`` to another origin that serves the same paths,
+    which keeps provenance pointing at the canonical URL while tests talk to a
+    local server.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 2,
+        timeout: float = 60,
+        attempts: int = 8,
+        origins: Mapping[str, str] | None = None,
+    ) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.attempts = attempts
+        self.origins = {key.rstrip("/"): value.rstrip("/") for key, value in (origins or {}).items()}
+        self.connections_opened = 0
+        self._idle: dict[_Origin, list[http.client.HTTPConnection]] = {}
+        self._slots: dict[_Origin, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> AsyncSourceClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+    async def jolpica_results(self, season: int, round_number: int) -> tuple[dict[str, Any], dict[str, str]]:
+        return await self.get_json(sources._jolpica_results_url(season, round_number))
+
+    async def jolpica_pit_stops(self, season: int, round_number: int) -> tuple[dict[str, Any], dict[str, str]]:
+        return await self.get_json(sources._jolpica_pit_stops_url(season, round_number))
+
+    async def jolpica_season_results(self, season: int) -> tuple[dict[str, Any], dict[str, str]]:
+        return await self.get_json(sources._jolpica_season_results_url(season))
+
+    async def jolpica_season_full_results(self, season: int) -> tuple[dict[str, Any], dict[str, str]]:
+        return await self._get_paginated_races(sources._jolpica_season_full_results_url(season), "Results")
+
+    async def openf1(self, endpoint: str, **filters: object) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        return await self.get_json(sources._openf1_url(endpoint, **filters))
+
+    async def openf1_session_range(
+        self, endpoint: str, first_session_key: int, last_session_key: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        return await self.get_json(sources._openf1_range_url(endpoint, first_session_key, last_session_key))
+
+    async def get_json(self, url: str) -> tuple[Any, dict[str, str]]:
+        """Fetch one JSON document with the synchronous client's retry semantics."""
+        attempt = 0
+        conditional_headers = sources._conditional_headers()
+        while True:
+            await _wait(url, sources._reserve_slot(url))
+            started = time.monotonic()
+            try:
+                status, headers, body = await self._exchange(url, conditional_headers)
+            except _StaleConnection:
+                continue
+            except TimeoutError:
+                sources._record(url, network=time.monotonic() - started)
+                if attempt == self.attempts - 1:
+                    raise
+                await _wait(url, sources._retry_delay(attempt))
+                attempt += 1
+                continue
+            except (OSError, http.client.HTTPException) as error:
+                sources._record(url, network=time.monotonic() - started)
+                # Match urllib, which surfaces connection failures as URLError.
+                if attempt == self.attempts - 1:
+                    raise URLError(error) from error
+                await _wait(url, sources._retry_delay(attempt))
+                attempt += 1
+                continue
+            sources._record(url, network=time.monotonic() - started)
+            if status == 304:
+                raise sources.NotModified(url)
+            if status < 400:
+                return json.loads(body), sources._provenance(url, headers)
+            error = _http_error(url, status, headers)
+            if not sources._is_retryable(status) or attempt == self.attempts - 1:
+                raise error
+            await _wait(url, sources._retry_delay(attempt, headers.get("Retry-After")))
+            attempt += 1
+
+    async def _get_paginated_races(self, base_url: str, row_key: str) -> tuple[dict[str, Any], dict[str, str]]:
+        """Fetch the first page, then the rest concurrently, as :mod:`sources` does."""
+        races_by_round: dict[int, dict[str, Any]] = {}
+        payload, provenance = await self._get_page(base_url, 0)
+        total, offset = sources._merge_race_page(races_by_round, payload, row_key)
+        exhausted = offset == 0
+        offsets = [] if exhausted else sources._page_offsets(offset, total)
+        if offsets:
+            pages = await asyncio.gather(*(self._get_page(base_url, item) for item in offsets))
+            offset, total, exhausted = sources._merge_pages(
+                races_by_round, [page for page, _ in pages], row_key, offset, total
+            )
+        while not exhausted and offset < total:
+            payload, _ = await self._get_page(base_url, offset)
+            total, page_count = sources._merge_race_page(races_by_round, payload, row_key)
+            exhausted = page_count == 0
+            offset += page_count
+        return sources._combined_races(races_by_round, offset, total), provenance
+
+    async def _get_page(self, base_url: str, offset: int) -> tuple[dict[str, Any], dict[str, str]]:
+        with sources.conditional(None):
+            payload, provenance = await self.get_json(sources._page_url(base_url, offset))
+        return payload, sources._without_validators(provenance)
+
+    async def _exchange(self, url: str, extra_headers: Mapping[str, str]) -> tuple[int, Message, bytes]:
+        target = urlsplit(self._rewrite(url))
+        origin: _Origin = (target.scheme, target.hostname or "", target.port or (443 if target.scheme == "https" else 80))
+        path = target.path + (f"?{target.query}" if target.query else "")
+        slots = self._slots.setdefault(origin, asyncio.Semaphore(self.max_connections_per_host))
+        async with slots:
+            idle = self._idle.setdefault(origin, [])
+            reused = bool(idle)
+            connection = idle.pop() if idle else self._connect(origin)
+            try:
+                status, headers, body, reusable = await asyncio.to_thread(_round_trip, connection, path, extra_headers)
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                # A keep-alive socket the server already closed is not a source
+                # failure; retry once on a fresh connection without backing off.
+                if reused and isinstance(error, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+                    raise _StaleConnection() from error
+                raise
+            if reusable:
+                idle.append(connection)
+            else:
+                connection.close()
+        return status, headers, body
+
+    def _connect(self, origin: _Origin) -> http.client.HTTPConnection:
+        scheme, host, port = origin
+        self.connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _rewrite(self, url: str) -> str:
+        for canonical, replacement in self.origins.items():
+            if url.startswith(canonical + "/"):
+                return replacement + url[len(canonical):]
+        return url
+
+
+async def _wait(url: str, delay: float) -> None:
+    if delay > 0:
+        await asyncio.sleep(delay)
+        sources._record(url, throttled=delay)
+
+
+class _StaleConnection(ConnectionError):
+    """A pooled connection was closed by the server between requests."""
+
+
+def _round_trip(
+    connection: http.client.HTTPConnection, path: str, extra_headers: Mapping[str, str],
+) -> tuple[int, Message, bytes, bool]:
+    connection.request(
+        "GET", path, headers={"User-Agent": sources.USER_AGENT, "Connection": "keep-alive", **extra_headers}
+    )
+    response = connection.getresponse()
+    body = response.read()
+    return response.status, response.headers, body, not response.will_close
+
+
+def _http_error(url: str, status: int, headers: Message) -> HTTPError:
+    return HTTPError(url, status, http.client.responses.get(status, ""), headers, None)
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import csv
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, BinaryIO, Iterable, Iterator, TextIO
 
-from .discovery import discover_completed_races
-from .pipeline import build_historical_season, build_reference_race
+from .checksums import sha256_file
+from .discovery import RaceRef, discover_completed_races
+from .pipeline import build_historical_season, build_reference_race, prefetch_openf1_season
+from .sources import DEFAULT_RESPONSE_CACHE_BYTES, response_cache
 
 
 TABLES = ("race_context", "race_drivers", "stints", "pit_events", "weather_observations")
+SEGMENT_INDEX = "segments.json"
 
 
 def build_seasons(
@@ -21,58 +26,46 @@ def build_seasons(
     root: Path,
     continue_on_error: bool = True,
     refresh: bool = False,
+    workers: int = 1,
+    prefetch: bool = False,
+    response_cache_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES,
 ) -> dict[str, Any]:
-    runs: list[dict[str, Any]] = []
-    for season in range(start_year, end_year + 1):
-        print(f"Building season {season} ({season - start_year + 1}/{end_year - start_year + 1})", flush=True)
-        if season < 2023:
-            try:
-                reports = build_historical_season(season, root, refresh=refresh)
-                runs.extend({
-                    "season": season,
-                    "round_number": report["round_number"],
-                    "race_name": report.get("race_name", ""),
-                    "race_date": report.get("race_date", ""),
-                    "detailed_source_status": "historical_results_only",
-                    "status": report["status"],
-                    "table_rows": report["table_rows"],
-                    "issues": report["issues"],
-                } for report in reports)
-            except Exception as error:
-                runs.append({
-                    "season": season, "round_number": 0,
-                    "status": "failed", "reason": f"{type(error).__name__}: {error}",
-                })
-                if not continue_on_error:
-                    raise
-            continue
-        try:
-            completed_races = discover_completed_races(season)
-        except Exception as error:
-            runs.append({
-                "season": season,
-                "round_number": 0,
-                "race_name": "season discovery",
-                "status": "failed",
-                "reason": f"{type(error).__name__}: {error}",
-            })
-            if not continue_on_error:
-                raise
-            continue
-        for race in completed_races:
-            record = race.as_dict()
-            if race.session_key is None:
-                record.update(status="unavailable", reason="OpenF1 detailed session coverage is unavailable; FastF1 backfill required")
-                runs.append(record)
-                continue
-            try:
-                report = build_reference_race(season, race.round_number, race.session_key, root, refresh=refresh)
-                record.update(status=report["status"], table_rows=report["table_rows"], issues=report["issues"])
-            except Exception as error:
-                record.update(status="failed", reason=f"{type(error).__name__}: {error}")
-                if not continue_on_error:
-                    raise
-            runs.append(record)
+    """Build every completed race in a season range and consolidate the result.
+
+    With ``workers > 1`` historical seasons, season discovery, and individual
+    race builds run on a thread pool. Source requests still pass through the
+    shared per-host throttle, and runs are collected in season/round order so
+    the manifest matches a serial build.
+
+    With ``prefetch`` each OpenF1 endpoint is requested once per season and
+    split into per-race snapshots before the races are built.
+
+    Season discovery is cached under ``root / "discovery"``; ``refresh``
+    rediscovers every season.
+
+    Source responses are memoized for the run, up to ``response_cache_bytes``,
+    so a URL needed by both discovery and a race build is fetched once.
+    """
+    seasons = range(start_year, end_year + 1)
+    with response_cache(response_cache_bytes):
+        if workers > 1:
+            runs = _build_concurrently(seasons, root, continue_on_error, refresh, workers, prefetch)
+        else:
+            runs = []
+            for season in seasons:
+                print(f"Building season {season} ({season - start_year + 1}/{len(seasons)})", flush=True)
+                if season < 2023:
+                    runs.extend(_historical_runs(season, root, continue_on_error, refresh))
+                    continue
+                races, failure = _discover(season, root, continue_on_error, refresh)
+                if failure is not None:
+                    runs.append(failure)
+                    continue
+                prefetched = _prefetch(season, races, root, refresh) if prefetch else {}
+                runs.extend(
+                    _race_run(race, root, continue_on_error, refresh, prefetched.get(race.session_key, frozenset()))
+                    for race in races
+                )
 
     consolidated = consolidate(root, start_year, end_year)
     manifest = {
@@ -94,46 +87,277 @@ def consolidate(
     start_year: int,
     end_year: int,
     allowed_statuses: tuple[str, ...] = ("verified",),
+    incremental: bool = True,
 ) -> dict[str, int]:
     """Combine publication-safe tables independently.
 
     A defect in telemetry must not delete an independently valid official race
     result. A table is excluded only when that table has an error-level issue.
+
+    The destination keeps a segment index recording where each race's rows
+    sit in every consolidated file. When ``incremental`` is true, races whose
+    per-race CSV checksum is unchanged are copied byte-for-byte from the
+    previous output and only changed races are parsed again.
     """
     destination = root / "processed" / f"consolidated_{start_year}_{end_year}"
     destination.mkdir(parents=True, exist_ok=True)
+    index_path = destination / SEGMENT_INDEX
+    previous = _read_segment_index(index_path) if incremental else {}
+    admitted: dict[str, list[Path]] = {table: [] for table in TABLES}
+    race_dirs = sorted((root / "processed").glob("????/round-??"))
+    for race_dir in race_dirs:
+        if not start_year <= int(race_dir.parent.name) <= end_year:
+            continue
+        report_path = race_dir / "validation_report.json"
+        if not report_path.exists():
+            continue
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        if report.get("status") == "failed":
+            continue
+        error_tables = {
+            issue.get("table") for issue in report.get("issues", [])
+            if issue.get("severity") == "error"
+        }
+        for table in TABLES:
+            path = race_dir / f"{table}.csv"
+            if table not in error_tables and path.exists():
+                admitted[table].append(path)
+
     counts: dict[str, int] = {}
+    index: dict[str, Any] = {}
     for table in TABLES:
-        paths = sorted((root / "processed").glob("????/round-??/" + table + ".csv"))
-        paths = [path for path in paths if start_year <= int(path.parts[-3]) <= end_year]
-        rows: list[dict[str, str]] = []
-        for path in paths:
-            report_path = path.parent / "validation_report.json"
-            if not report_path.exists():
-                continue
-            report = json.loads(report_path.read_text(encoding="utf-8"))
-            if report.get("status") == "failed":
-                continue
-            table_errors = [
-                issue for issue in report.get("issues", [])
-                if issue.get("severity") == "error" and issue.get("table") == table
-            ]
-            if table_errors:
-                continue
-            with path.open("r", encoding="utf-8", newline="") as handle:
-                rows.extend(csv.DictReader(handle))
-        counts[table] = len(rows)
         output = destination / f"{table}.csv"
-        if rows:
-            with output.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
-                writer.writeheader()
-                writer.writerows(rows)
-        elif output.exists():
+        if not admitted[table]:
+            counts[table] = 0
+            if output.exists():
+                output.unlink()
+            continue
+        entry = _write_segments(output, admitted[table], previous.get(table))
+        counts[table] = sum(segment["rows"] for segment in entry["segments"])
+        if counts[table]:
+            index[table] = entry
+        else:
             output.unlink()
+    _write_segment_index(index_path, index)
     return counts
 
 
+def _write_segments(
+    output: Path, paths: list[Path], previous: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Stream one consolidated table to disk and return its segment index entry.
+
+    Only header lines are read up front to build the union of columns. Rows
+    then flow from each per-race file straight into the output, so memory use
+    does not grow with the number of races.
+    """
+    headers = {path: _header(path) for path in paths}
+    fieldnames = list(dict.fromkeys(name for header in headers.values() for name in header))
+    reusable: dict[str, dict[str, Any]] = {}
+    if previous and previous.get("fieldnames") == fieldnames and output.exists():
+        stat = output.stat()
+        if stat.st_size == previous.get("size") and stat.st_mtime_ns == previous.get("mtime_ns"):
+            reusable = {segment["race"]: segment for segment in previous["segments"]}
+    staging = output.with_name(output.name + ".tmp")
+    segments: list[dict[str, Any]] = []
+    with ExitStack() as stack:
+        handle = stack.enter_context(staging.open("w", encoding="utf-8", newline=""))
+        old = stack.enter_context(output.open("rb")) if reusable else None
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        for path in paths:
+            race = f"{path.parts[-3]}/{path.parts[-2]}"
+            checksum = sha256_file(path)
+            handle.flush()
+            offset = handle.buffer.tell()
+            cached = reusable.get(race)
+            if old is not None and cached is not None and cached["sha256"] == checksum:
+                _copy_range(old, handle.buffer, cached["offset"], cached["length"])
+                rows = cached["rows"]
+            elif headers[path] == fieldnames:
+                rows = _copy_rows(path, handle)
+            else:
+                rows = _render_segment(path, writer)
+            handle.flush()
+            segments.append({
+                "race": race, "sha256": checksum, "offset": offset,
+                "length": handle.buffer.tell() - offset, "rows": rows,
+            })
+    staging.replace(output)
+    stat = output.stat()
+    return {"fieldnames": fieldnames, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "segments": segments}
+
+
+def _header(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return next(csv.reader(handle), [])
+
+
+def _copy_rows(path: Path, handle: TextIO) -> int:
+    """Copy a per-race CSV body verbatim, counting records as lines pass through."""
+    with path.open("r", encoding="utf-8", newline="") as source:
+        next(csv.reader(source), None)
+        last_line = "\n"
+
+        def echo() -> Iterator[str]:
+            nonlocal last_line
+            for line in source:
+                handle.write(line)
+                last_line = line
+                yield line
+
+        rows = sum(1 for _ in csv.reader(echo()))
+        if not last_line.endswith("\n"):
+            handle.write("\r\n")
+    return rows
+
+
+def _render_segment(path: Path, writer: csv.DictWriter) -> int:
+    """Re-serialize a per-race CSV whose columns differ from the unified header."""
+    rows = 0
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            writer.writerow(row)
+            rows += 1
+    return rows
+
+
+def _copy_range(source: BinaryIO, target: BinaryIO, offset: int, length: int, chunk_size: int = 1 << 20) -> None:
+    source.seek(offset)
+    while length > 0:
+        chunk = source.read(min(chunk_size, length))
+        if not chunk:
+            raise ValueError("Consolidated output is shorter than its segment index")
+        target.write(chunk)
+        length -= len(chunk)
+
+
+def _read_segment_index(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    index = json.loads(path.read_text(encoding="utf-8"))
+    return index.get("tables", {}) if index.get("version") == 1 else {}
+
+
+def _write_segment_index(path: Path, tables: dict[str, Any]) -> None:
+    path.write_text(json.dumps({"version": 1, "tables": tables}, indent=2) + "\n", encoding="utf-8")
+
+
+def _build_concurrently(
+    seasons: range, root: Path, continue_on_error: bool, refresh: bool, workers: int, prefetch: bool,
+) -> list[dict[str, Any]]:
+    """Schedule season and race jobs on a pool while preserving serial order."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="f1-build") as executor:
+        try:
+            season_jobs: list[tuple[int, Future[Any]]] = []
+            for season in seasons:
+                print(f"Scheduling season {season} ({season - seasons.start + 1}/{len(seasons)})", flush=True)
+                season_jobs.append((season, (
+                    executor.submit(_historical_runs, season, root, continue_on_error, refresh)
+                    if season < 2023 else
+                    executor.submit(_discover, season, root, continue_on_error, refresh)
+                )))
+            # Race builds are queued as soon as their season is discovered, so
+            # one slow discovery never idles workers on already known races.
+            ordered: list[Future[Any] | list[dict[str, Any]]] = []
+            for season, job in season_jobs:
+                if season < 2023:
+                    ordered.append(job)
+                    continue
+                races, failure = job.result()
+                if failure is not None:
+                    ordered.append([failure])
+                    continue
+                prefetched = _prefetch(season, races, root, refresh) if prefetch else {}
+                ordered.extend(
+                    executor.submit(
+                        _race_run, race, root, continue_on_error, refresh,
+                        prefetched.get(race.session_key, frozenset()),
+                    )
+                    for race in races
+                )
+            runs: list[dict[str, Any]] = []
+            for item in ordered:
+                result = item if isinstance(item, list) else item.result()
+                runs.extend(result if isinstance(result, list) else [result])
+            return runs
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _historical_runs(
+    season: int, root: Path, continue_on_error: bool, refresh: bool,
+) -> list[dict[str, Any]]:
+    try:
+        reports = build_historical_season(season, root, refresh=refresh)
+    except Exception as error:
+        if not continue_on_error:
+            raise
+        return [{
+            "season": season, "round_number": 0,
+            "status": "failed", "reason": f"{type(error).__name__}: {error}",
+        }]
+    return [{
+        "season": season,
+        "round_number": report["round_number"],
+        "race_name": report.get("race_name", ""),
+        "race_date": report.get("race_date", ""),
+        "detailed_source_status": "historical_results_only",
+        "status": report["status"],
+        "table_rows": report["table_rows"],
+        "issues": report["issues"],
+    } for report in reports]
+
+
+def _discover(
+    season: int, root: Path, continue_on_error: bool, refresh: bool,
+) -> tuple[list[RaceRef], dict[str, Any] | None]:
+    try:
+        return discover_completed_races(season, cache_dir=root / "discovery", refresh=refresh), None
+    except Exception as error:
+        if not continue_on_error:
+            raise
+        return [], {
+            "season": season,
+            "round_number": 0,
+            "race_name": "season discovery",
+            "status": "failed",
+            "reason": f"{type(error).__name__}: {error}",
+        }
+
+
+def _prefetch(season: int, races: list[RaceRef], root: Path, refresh: bool) -> dict[int, frozenset[str]]:
+    """Bulk-store a season's OpenF1 snapshots; on failure races fetch their own."""
+    sessions = {race.round_number: race.session_key for race in races if race.session_key is not None}
+    if not sessions:
+        return {}
+    try:
+        return prefetch_openf1_season(season, sessions, root, refresh)
+    except Exception as error:
+        print(f"OpenF1 prefetch for {season} failed ({type(error).__name__}: {error}); fetching per race", flush=True)
+        return {}
+
+
+def _race_run(
+    race: RaceRef, root: Path, continue_on_error: bool, refresh: bool, prefetched: frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    record = race.as_dict()
+    if race.session_key is None:
+        record.update(status="unavailable", reason="OpenF1 detailed session coverage is unavailable; FastF1 backfill required")
+        return record
+    try:
+        report = build_reference_race(
+            race.season, race.round_number, race.session_key, root, refresh=refresh, prefetched=prefetched
+        )
+        record.update(status=report["status"], table_rows=report["table_rows"], issues=report["issues"])
+    except Exception as error:
+        record.update(status="failed", reason=f"{type(error).__name__}: {error}")
+        if not continue_on_error:
+            raise
+    return record
+
+
 def _summary(runs: Iterable[dict[str, Any]]) -> dict[str, int]:
     summary: dict[str, int] = {}
     for run in runs:
@@ -0,0 +1,81 @@
+"""Streaming SHA-256 checksums cached per directory.
+
+Every directory that holds hashed files gets a ``.sha256.json`` sidecar
+mapping file names to ``{size, mtime_ns, sha256}``. A file is read again only
+when its size or modification time changes, and repeat lookups within one
+process are answered from memory without touching the sidecar.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+
+CACHE_NAME = ".sha256.json"
+_CHUNK_BYTES = 1024 * 1024
+
+_lock = threading.Lock()
+_memo: dict[tuple[str, int, int], str] = {}
+
+
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 of ``path``, hashing it only after it changes."""
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _lock:
+        digest = _memo.get(key)
+        if digest is not None:
+            return digest
+        cache = _read_cache(path.parent)
+        entry = cache.get(path.name)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            digest = entry["sha256"]
+        else:
+            digest = _stream_sha256(path)
+            cache[path.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+            _write_cache(path.parent, cache)
+        _memo[key] = digest
+        return digest
+
+
+def clear_memo() -> None:
+    """Forget in-process results; the on-disk sidecars are kept."""
+    with _lock:
+        _memo.clear()
+
+
+def _stream_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_cache(directory: Path) -> dict[str, Any]:
+    try:
+        cache = json.loads((directory / CACHE_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(directory: Path, cache: dict[str, Any]) -> None:
+    # The sidecar is only an accelerator: a read-only directory or a failed
+    # write means the file is hashed again next time, never a failed build.
+    try:
+        handle, staging = tempfile.mkstemp(dir=directory, prefix=f"{CACHE_NAME}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(cache, stream, sort_keys=True)
+        os.replace(staging, directory / CACHE_NAME)
+    except OSError:
+        Path(staging).unlink(missing_ok=True)
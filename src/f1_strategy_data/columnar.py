@@ -0,0 +1,186 @@
+"""Optional typed Parquet storage for canonical and feature tables.
+
+CSV remains the canonical, publication format. Parquet copies carry the
+column types declared in ``schemas/*.schema.json`` so readers no longer
+re-infer types, and they are written with one row group per season so
+season-filtered reads skip everything else.
+
+Requires ``pyarrow`` (``pip install -e ".[parquet]"``); it is imported only
+when a Parquet file is actually written or read.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+SCHEMA_ROOT = Path(__file__).resolve().parents[2] / "schemas"
+_ARROW_TYPES = {"integer": "int64", "number": "float64", "boolean": "bool", "string": "string"}
+_TRUE = {"true", "1", "yes"}
+_FALSE = {"false", "0", "no"}
+
+
+def column_types(table: str, schema_root: Path = SCHEMA_ROOT) -> dict[str, str]:
+    """Map each declared column to an Arrow type name from its JSON Schema."""
+    schema = json.loads((schema_root / f"{table}.schema.json").read_text(encoding="utf-8"))
+    types: dict[str, str] = {}
+    for name, definition in schema["properties"].items():
+        declared = definition.get("type", "string")
+        options = [declared] if isinstance(declared, str) else list(declared)
+        concrete = [option for option in options if option != "null"]
+        types[name] = _ARROW_TYPES.get(concrete[0] if concrete else "string", "string")
+    return types
+
+
+def write_parquet(
+    rows: Iterable[Mapping[str, object]],
+    path: Path,
+    table: str,
+    columns: Sequence[str] | None = None,
+    schema_root: Path = SCHEMA_ROOT,
+) -> int:
+    """Write rows with schema-declared types, starting a row group per season.
+
+    ``rows`` is consumed as a stream; only one season is buffered at a time.
+    Values may be Python objects or the strings produced by ``csv``.
+    Nullability is not enforced here: it is the validators' responsibility,
+    and historical rows legitimately carry nulls in some modern-era columns.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None and not columns:
+        raise ValueError(f"Refusing to write empty columnar table: {path.name}")
+    names = list(columns or first or ())
+    declared = column_types(table, schema_root)
+    schema = pa.schema([pa.field(name, _arrow_type(declared.get(name, "string"))) for name in names])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    count = 0
+    with pq.ParquetWriter(staging, schema) as writer:
+        batch: list[Mapping[str, object]] = []
+        season: object = None
+        for row in _chain(first, iterator) if first is not None else ():
+            if batch and row.get("season") != season:
+                writer.write_table(_to_arrow(batch, schema))
+                batch = []
+            season = row.get("season")
+            batch.append(row)
+            count += 1
+        writer.write_table(_to_arrow(batch, schema))
+    staging.replace(path)
+    return count
+
+
+def csv_to_parquet(
+    source: Path, path: Path, table: str, schema_root: Path = SCHEMA_ROOT,
+) -> int:
+    """Convert one CSV file to Parquet without loading it all into memory."""
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        return write_parquet(reader, path, table, reader.fieldnames, schema_root)
+
+
+def export_parquet(root: Path, start_year: int, end_year: int, schema_root: Path = SCHEMA_ROOT) -> int:
+    """Mirror per-race and consolidated CSV tables as Parquet next to each CSV.
+
+    A Parquet copy newer than its CSV is left alone, so repeated exports only
+    convert races that were rebuilt. Returns the number of files written.
+    """
+    processed = root / "processed"
+    sources = [
+        path for path in sorted(processed.glob("????/round-??/*.csv"))
+        if start_year <= int(path.parts[-3]) <= end_year
+    ]
+    sources.extend(sorted((processed / f"consolidated_{start_year}_{end_year}").glob("*.csv")))
+    written = 0
+    for source in sources:
+        if not (schema_root / f"{source.stem}.schema.json").exists():
+            continue
+        target = source.with_suffix(".parquet")
+        if target.exists() and target.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+            continue
+        csv_to_parquet(source, target, source.stem, schema_root)
+        written += 1
+    return written
+
+
+def read_parquet(
+    path: Path, columns: Sequence[str] | None = None, seasons: Iterable[int] | None = None,
+) -> pa.Table:
+    """Read selected columns, skipping row groups outside ``seasons``.
+
+    Every row group written by :func:`write_parquet` holds a single season,
+    so its min/max statistics decide whether it is read at all.
+    """
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    groups = list(range(parquet.num_row_groups))
+    if seasons is not None:
+        wanted = set(seasons)
+        season_index = parquet.schema_arrow.get_field_index("season")
+        groups = [
+            group for group in groups
+            if _may_contain(parquet.metadata.row_group(group).column(season_index).statistics, wanted)
+        ]
+    return parquet.read_row_groups(groups, columns=list(columns) if columns is not None else None)
+
+
+def _may_contain(statistics: Any, seasons: set[int]) -> bool:
+    if statistics is None or not statistics.has_min_max:
+        return True
+    return any(statistics.min <= season <= statistics.max for season in seasons)
+
+
+def _arrow_type(name: str) -> pa.DataType:
+    import pyarrow as pa
+
+    return {"int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_()}.get(name, pa.string())
+
+
+def _to_arrow(rows: list[Mapping[str, object]], schema: pa.Schema) -> pa.Table:
+    import pyarrow as pa
+
+    return pa.table({
+        field.name: pa.array([_coerce(row.get(field.name), str(field.type)) for row in rows], type=field.type)
+        for field in schema
+    }, schema=schema)
+
+
+def _coerce(value: object, arrow_type: str) -> object:
+    if value is None or value == "":
+        return None
+    if arrow_type == "int64":
+        if isinstance(value, int):
+            return value
+        number = float(str(value))
+        if not number.is_integer():
+            raise ValueError(f"Expected an integer, received {value!r}")
+        return int(number)
+    if arrow_type == "double":
+        return float(str(value))
+    if arrow_type == "bool":
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(f"Expected a boolean, received {value!r}")
+    return str(value)
+
+
+def _chain(first: Mapping[str, object], rest: Iterable[Mapping[str, object]]) -> Iterable[Mapping[str, object]]:
+    yield first
+    yield from rest
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import json
+from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 from .sources import jolpica_season_results, openf1
 
 
+DISCOVERY_CACHE_VERSION = 1
+# Reuse window while a season's next result is unknown or not yet published.
+PROVISIONAL_TTL = timedelta(hours=6)
+
+
 @dataclass(frozen=True)
 class RaceRef:
     season: int
@@ -22,24 +31,52 @@ class RaceRef:
         return asdict(self)
 
 
-def discover_completed_races(season: int, as_of: datetime | None = None) -> list[RaceRef]:
+def discover_completed_races(
+    season: int,
+    as_of: datetime | None = None,
+    cache_dir: Path | None = None,
+    refresh: bool = False,
+) -> list[RaceRef]:
+    """List a season's completed races and their OpenF1 race sessions.
+
+    With ``cache_dir`` the result is kept in ``<cache_dir>/<season>.json``. A
+    closed season is reused indefinitely. The current season is reused until
+    the next scheduled race session has ended, or for
+    :data:`PROVISIONAL_TTL` when no session is scheduled or a finished session
+    has no published results yet. ``refresh`` ignores any cached result.
+    """
     as_of = as_of or datetime.now(UTC)
+    path = cache_dir / f"{season}.json" if cache_dir is not None else None
+    if path is not None and not refresh:
+        cached = _read_cache(path, as_of)
+        if cached is not None:
+            return cached
+    refs, sessions, sessions_known = _discover(season, as_of)
+    if path is not None and sessions_known:
+        _write_cache(path, refs, as_of, _expiry(season, refs, sessions, as_of))
+    return refs
+
+
+def _discover(season: int, as_of: datetime) -> tuple[list[RaceRef], list[dict[str, Any]], bool]:
     results_payload, _ = jolpica_season_results(season)
     races = results_payload.get("MRData", {}).get("RaceTable", {}).get("Races", [])
     sessions: list[dict[str, Any]] = []
+    sessions_known = season < 2023
     if season >= 2023:
         try:
             sessions, _ = openf1("sessions", year=season, session_name="Race")
+            sessions_known = True
         except Exception:
             sessions = []
     completed_sessions = [
         row for row in sessions
         if not row.get("is_cancelled", False) and _parse_time(row["date_end"]) <= as_of
     ]
+    sessions_by_day = _index_sessions(completed_sessions)
     refs: list[RaceRef] = []
     for race in races:
         race_date = race["date"]
-        session = _match_session_date(race_date, completed_sessions)
+        session = _match_session_date(race_date, sessions_by_day)
         refs.append(RaceRef(
             season=season,
             round_number=int(race["round"]),
@@ -48,24 +85,75 @@ def discover_completed_races(season: int, as_of: datetime | None = None) -> list
             session_key=int(session["session_key"]) if session else None,
             detailed_source_status="available" if session else "unavailable",
         ))
-    return refs
+    return refs, sessions, sessions_known
+
+
+def _expiry(
+    season: int, refs: list[RaceRef], sessions: list[dict[str, Any]], as_of: datetime,
+) -> datetime | None:
+    """When a discovery result may change; ``None`` means never."""
+    scheduled = [
+        (_parse_time(row["date_end"]), int(row["session_key"]))
+        for row in sessions if not row.get("is_cancelled", False)
+    ]
+    upcoming = [end for end, _ in scheduled if end > as_of]
+    matched = {ref.session_key for ref in refs if ref.session_key is not None}
+    awaiting_results = any(key not in matched for end, key in scheduled if end <= as_of)
+    if awaiting_results:
+        return as_of + PROVISIONAL_TTL
+    if upcoming:
+        return min(upcoming)
+    if season < as_of.year:
+        return None
+    return as_of + PROVISIONAL_TTL
+
+
+def _read_cache(path: Path, as_of: datetime) -> list[RaceRef] | None:
+    if not path.exists():
+        return None
+    cached = json.loads(path.read_text(encoding="utf-8"))
+    if cached.get("version") != DISCOVERY_CACHE_VERSION:
+        return None
+    expires = cached.get("expires_at_utc")
+    if expires is not None and _parse_time(expires) <= as_of:
+        return None
+    return [RaceRef(**race) for race in cached["races"]]
+
+
+def _write_cache(path: Path, refs: list[RaceRef], as_of: datetime, expires: datetime | None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    staging.write_text(json.dumps({
+        "version": DISCOVERY_CACHE_VERSION,
+        "discovered_at_utc": as_of.isoformat(),
+        "expires_at_utc": expires.isoformat() if expires is not None else None,
+        "races": [ref.as_dict() for ref in refs],
+    }, indent=2) + "\n", encoding="utf-8")
+    staging.replace(path)
 
 
 def _parse_time(value: str) -> datetime:
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
+def _index_sessions(sessions: list[dict[str, Any]]) -> dict[date, list[dict[str, Any]]]:
+    """Group sessions by UTC start date, parsing each timestamp once."""
+    sessions_by_day: dict[date, list[dict[str, Any]]] = defaultdict(list)
+    for row in sessions:
+        sessions_by_day[_parse_time(row["date_start"]).date()].append(row)
+    return sessions_by_day
+
+
 def _match_session_date(
-    local_race_date: str, sessions: list[dict[str, Any]],
+    local_race_date: str, sessions_by_day: Mapping[date, list[dict[str, Any]]],
 ) -> dict[str, Any] | None:
     """Match local calendar dates while allowing a race to cross midnight UTC."""
-    race_day = datetime.fromisoformat(local_race_date).date()
-    exact = [row for row in sessions if _parse_time(row["date_start"]).date() == race_day]
+    race_day = date.fromisoformat(local_race_date)
+    exact = sessions_by_day.get(race_day, [])
     if len(exact) == 1:
         return exact[0]
     adjacent = [
-        row for row in sessions
-        if abs((_parse_time(row["date_start"]).date() - race_day).days) == 1
+        *sessions_by_day.get(race_day - timedelta(days=1), []),
+        *sessions_by_day.get(race_day + timedelta(days=1), []),
     ]
     return adjacent[0] if not exact and len(adjacent) == 1 else None
-
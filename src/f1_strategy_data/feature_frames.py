@@ -0,0 +1,437 @@
+"""Columnar feature engine for the three prediction tables.
+
+The functions here build the same rows as the reference builders in
+:mod:`f1_strategy_data.features`, with the same columns and values, from
+pandas DataFrames such as those returned by
+:func:`f1_strategy_data.frame_validation.read_table`. Each history is a set
+of prefix sums over records sorted by group and race. A row's prior features
+are differences between the prefix sums at its group's first record and at
+its race, and recent-form features use the last :data:`RECENT_WINDOW` records
+before that race. Text is parsed once per distinct value with the reference
+parsers, so unusual spellings and invalid values behave identically.
+
+Averages of whole-number fields, which covers every history field in the
+canonical tables, are exact and match the reference path bit for bit.
+
+pandas is optional and imported lazily, like pyarrow in :mod:`columnar`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from .features import (
+    NEXT_PIT_COLUMNS,
+    PIT_COUNT_COLUMNS,
+    PRE_RACE_COLUMNS,
+    RECENT_WINDOW,
+    _is_classified_finish,
+    _optional_bool,
+    _optional_float,
+    _optional_int,
+)
+from .frame_validation import _column, read_table
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+CONTEXT_FLOAT_COLUMNS = (
+    "start_air_temperature_c", "start_track_temperature_c", "start_humidity_pct",
+    "start_pressure_mbar",
+)
+
+
+def pre_race_finishing_frame(
+    races: pd.DataFrame, holdout_season: int | None = None, contexts: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Columnar :func:`~f1_strategy_data.features.build_pre_race_finishing_features`."""
+    import numpy as np
+
+    races, race_index = _in_race_order(races)
+    finish = _required_positive_ints(_column(races, "classified_position"), "classified_position")
+    grid, grid_present = _parsed(_column(races, "grid_position"), _optional_int, 0, np.int64)
+    valid_grid = grid_present & (grid > 0)
+    status = _column(races, "status").fillna("").astype(str)
+    records = {
+        "finish": (finish.astype(float), None),
+        "grid": (grid.astype(float), valid_grid),
+        "positions_gained": ((grid - finish).astype(float), valid_grid),
+        "dnf": (np.where(status.map(_is_classified_finish).to_numpy(dtype=bool), 0.0, 1.0), None),
+    }
+    driver = _driver_history(races, race_index)
+    constructor = _constructor_history(races, race_index)
+    columns: dict[str, Any] = _identity_columns(races, race_index)
+    columns.update({
+        "driver_prior_starts": driver.count(),
+        "driver_prior_avg_finish": driver.average(*records["finish"]),
+        "driver_prior_avg_grid": driver.average(*records["grid"]),
+        "driver_prior_dnf_rate": driver.average(*records["dnf"]),
+        "driver_prior_avg_positions_gained": driver.average(*records["positions_gained"]),
+        "driver_recent5_avg_finish": driver.average(*records["finish"], recent=True),
+        "driver_recent5_avg_grid": driver.average(*records["grid"], recent=True),
+        "constructor_prior_starts": constructor.count(),
+        "constructor_prior_avg_finish": constructor.average(*records["finish"]),
+        "constructor_prior_dnf_rate": constructor.average(*records["dnf"]),
+        "constructor_recent5_avg_finish": constructor.average(*records["finish"], recent=True),
+        **_context_columns(races, race_index, contexts),
+        "classified_position": finish,
+        "dataset_split": _dataset_split(races, holdout_season),
+    })
+    return _frame(columns, PRE_RACE_COLUMNS)
+
+
+def pit_count_frame(
+    races: pd.DataFrame,
+    pits: pd.DataFrame,
+    stints: pd.DataFrame,
+    holdout_season: int | None = None,
+    contexts: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Columnar :func:`~f1_strategy_data.features.build_pit_count_features`."""
+    import numpy as np
+
+    races, race_index = _in_race_order(races)
+    codes = _driver_race_codes(races, pits, stints)
+    size = int(max((part.max(initial=-1) for part in codes), default=-1)) + 1
+    stops = np.bincount(codes[1], minlength=size)[codes[0]]
+    stint_counts = np.bincount(codes[2], minlength=size)[codes[0]]
+    driver = _driver_history(races, race_index)
+    constructor = _constructor_history(races, race_index)
+    stops_float = stops.astype(float)
+    columns: dict[str, Any] = _identity_columns(races, race_index)
+    columns.update({
+        "driver_prior_races": driver.count(),
+        "driver_prior_avg_pit_stops": driver.average(stops_float),
+        "driver_recent5_avg_pit_stops": driver.average(stops_float, recent=True),
+        "driver_prior_zero_stop_rate": driver.average((stops == 0).astype(float)),
+        "driver_prior_two_plus_stop_rate": driver.average((stops >= 2).astype(float)),
+        "driver_prior_avg_stints": driver.average(stint_counts.astype(float), stint_counts > 0),
+        "constructor_prior_driver_races": constructor.count(),
+        "constructor_prior_avg_pit_stops": constructor.average(stops_float),
+        "constructor_recent5_avg_pit_stops": constructor.average(stops_float, recent=True),
+        **_context_columns(races, race_index, contexts),
+        "pit_stop_count": stops,
+        "dataset_split": _dataset_split(races, holdout_season),
+    })
+    return _frame(columns, PIT_COUNT_COLUMNS)
+
+
+def next_pit_frame(
+    races: pd.DataFrame, pits: pd.DataFrame, stints: pd.DataFrame, holdout_season: int | None = None,
+) -> pd.DataFrame:
+    """Columnar :func:`~f1_strategy_data.features.build_next_pit_features`."""
+    import numpy as np
+    import pandas as pd
+
+    pit_laps = _required_positive_ints(_column(pits, "lap_number"), "lap_number")
+    stint_numbers = _required_positive_ints(_column(stints, "stint_number"), "stint_number")
+    compounds = np.array([value or None for value in _column(stints, "compound").tolist()], dtype=object)
+    lap_starts = _required_positive_ints(_column(stints, "lap_start"), "lap_start")
+    lap_ends = _required_positive_ints(_column(stints, "lap_end"), "lap_end")
+    base_ages, base_present = _parsed(_column(stints, "tyre_age_at_start_laps"), _optional_int, 0, np.int64)
+
+    races, _ = _in_race_order(races)
+    race_codes, pit_codes, stint_codes = _driver_race_codes(races, pits, stints)
+    completed, completed_present = _parsed(_column(races, "laps_completed"), _optional_int, 0, np.int64)
+    # Only driver-races with completed laps and a stint can produce rows.
+    units = np.flatnonzero(completed_present & (completed > 0) & np.isin(race_codes, stint_codes))
+    unit_codes, unit_laps = race_codes[units], completed[units]
+    span = int(max(unit_laps.max(initial=0), pit_laps.max(initial=0), lap_ends.max(initial=0))) + 1
+
+    # Expand each stint over its laps; sorting by stint number then input
+    # position leaves the reference path's winner first on every lap.
+    cap = np.zeros(int(max(part.max(initial=-1) for part in (race_codes, pit_codes, stint_codes))) + 1, dtype=np.int64)
+    np.maximum.at(cap, unit_codes, unit_laps)
+    first = lap_starts
+    last = np.minimum(lap_ends, cap[stint_codes]) if len(stint_codes) else lap_ends
+    lengths = np.clip(last - first + 1, 0, None)
+    stint_rows = np.repeat(np.arange(len(first)), lengths)
+    stint_keys = stint_codes[stint_rows] * span + first[stint_rows] + _offsets(lengths)
+    order = np.lexsort((stint_rows, stint_numbers[stint_rows], stint_keys))
+    stint_keys, first_of_key = np.unique(stint_keys[order], return_index=True)
+    stint_rows = stint_rows[order][first_of_key]
+
+    lap_units = np.repeat(np.arange(len(units)), unit_laps)
+    laps = _offsets(unit_laps) + 1
+    bases = unit_codes[lap_units] * span
+    located = np.searchsorted(stint_keys, bases + laps)
+    covered = located < len(stint_keys)
+    covered[covered] = stint_keys[located[covered]] == (bases + laps)[covered]
+    lap_units, laps, bases = lap_units[covered], laps[covered], bases[covered]
+    stint = stint_rows[located[covered]]
+
+    pit_keys = np.unique(pit_codes * span + pit_laps)
+    after = np.searchsorted(pit_keys, bases + laps)
+    before = after - np.searchsorted(pit_keys, bases)
+    following = pit_keys[np.minimum(after, len(pit_keys) - 1)] - bases if len(pit_keys) else np.zeros_like(laps)
+    has_next = (after < len(pit_keys)) & (following <= unit_laps[lap_units])
+    previous = pit_keys[np.maximum(after - 1, 0)] - bases if len(pit_keys) else np.zeros_like(laps)
+
+    rows = units[lap_units]
+    seasons = _ints(races["season"])[rows]
+    session_keys, session_present = _parsed(_column(races, "session_key"), _optional_int, 0, np.int64)
+    columns: dict[str, Any] = {
+        "season": seasons,
+        "round_number": _ints(races["round_number"])[rows],
+        "session_key": _nullable(session_keys[rows], session_present[rows]),
+        "driver_id": races["driver_id"].to_numpy(dtype=object)[rows],
+        "lap_number": laps,
+        "current_stint_number": stint_numbers[stint],
+        "current_compound": compounds[stint],
+        "tyre_age_laps": _nullable(base_ages[stint] + laps - lap_starts[stint], base_present[stint]),
+        "pit_stops_completed": before,
+        "laps_since_last_pit": np.where(before > 0, laps - previous, laps - 1),
+        "pit_this_lap": has_next & (following == laps),
+        "next_pit_lap": _nullable(following, has_next),
+        "laps_until_next_pit": _nullable(following - laps, has_next),
+        "event_observed": has_next,
+        "dataset_split": _splits(seasons, holdout_season),
+    }
+    return _frame(columns, NEXT_PIT_COLUMNS)
+
+
+def read_inputs(*paths: Path | None) -> list[pd.DataFrame | None]:
+    """Read input tables as strings, like the reference path; ``None`` stays ``None``."""
+    return [read_table(path) if path is not None else None for path in paths]
+
+
+def records(frame: pd.DataFrame) -> list[dict[str, object]]:
+    """Feature rows as dictionaries of Python values, with ``None`` for missing."""
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+class _History:
+    """Prefix sums over one kind of history, such as every driver's races."""
+
+    def __init__(self, groups: np.ndarray, race_index: np.ndarray, members: np.ndarray) -> None:
+        import numpy as np
+
+        # Each row is a query; rows in ``members`` are also history records.
+        # Records are ordered by group, then race, then row order, which is
+        # the order the reference path appends them.
+        self._order = members[np.lexsort((members, race_index[members], groups[members]))]
+        races = int(race_index.max(initial=0)) + 1
+        keys = groups[self._order] * races + race_index[self._order]
+        self._start = np.where(groups >= 0, np.searchsorted(keys, groups * races), 0)
+        self._end = np.where(groups >= 0, np.searchsorted(keys, groups * races + race_index), 0)
+
+    def count(self) -> np.ndarray:
+        return self._end - self._start
+
+    def average(self, values: np.ndarray, present: np.ndarray | None = None, recent: bool = False) -> np.ndarray:
+        import numpy as np
+
+        present = np.ones(len(values), dtype=bool) if present is None else present
+        start = np.maximum(self._start, self._end - RECENT_WINDOW) if recent else self._start
+        totals = _prefix(np.where(present, values, 0.0)[self._order])
+        counts = _prefix(present[self._order].astype(np.int64))
+        found = counts[self._end] - counts[start]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(found > 0, (totals[self._end] - totals[start]) / found, np.nan)
+        return _round(means)
+
+
+def _in_race_order(races: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    """Sort rows like the reference path and number races chronologically."""
+    import numpy as np
+    import pandas as pd
+
+    seasons = _ints(races["season"])
+    rounds = _ints(races["round_number"])
+    drivers = pd.factorize(races["driver_id"], sort=True)[0]
+    order = np.lexsort((np.arange(len(races)), drivers, rounds, seasons))
+    races = races.iloc[order].reset_index(drop=True)
+    _, race_index = np.unique(np.stack([seasons[order], rounds[order]], axis=1), axis=0, return_inverse=True)
+    return races, race_index.reshape(-1).astype(np.int64)
+
+
+def _driver_history(races: pd.DataFrame, race_index: np.ndarray) -> _History:
+    import numpy as np
+    import pandas as pd
+
+    groups = pd.factorize(races["driver_id"])[0].astype(np.int64)
+    return _History(groups, race_index, np.arange(len(races)))
+
+
+def _constructor_history(races: pd.DataFrame, race_index: np.ndarray) -> _History:
+    """Rows without a constructor neither see nor add constructor history."""
+    import numpy as np
+    import pandas as pd
+
+    constructors = _column(races, "constructor_id")
+    groups = pd.factorize(constructors.mask(constructors.eq(""), None))[0].astype(np.int64)
+    return _History(groups, race_index, np.flatnonzero(groups >= 0))
+
+
+def _context_columns(races: pd.DataFrame, race_index: np.ndarray, contexts: pd.DataFrame | None) -> dict[str, Any]:
+    """Start conditions and circuit history, computed per race and broadcast to rows."""
+    import numpy as np
+    import pandas as pd
+
+    race_count = int(race_index.max(initial=-1)) + 1
+    first_rows = np.unique(race_index, return_index=True)[1]
+    by_race = pd.DataFrame({
+        "season": _ints(races["season"])[first_rows], "round_number": _ints(races["round_number"])[first_rows],
+    })
+    if contexts is not None and len(contexts):
+        # As in the reference path, the last context row for a race wins.
+        keyed = pd.DataFrame({
+            "season": _ints(contexts["season"]), "round_number": _ints(contexts["round_number"]),
+        }).join(contexts.drop(columns=["season", "round_number"]).reset_index(drop=True))
+        by_race = by_race.merge(
+            keyed.drop_duplicates(["season", "round_number"], keep="last"), how="left", on=["season", "round_number"],
+        )
+    circuit_text = _column(by_race, "circuit_key")
+    circuit_text = circuit_text.mask(circuit_text.eq(""), None)
+    circuits = pd.factorize(circuit_text)[0].astype(np.int64)
+    history = _History(circuits, np.arange(race_count), np.flatnonzero(circuits >= 0))
+    circuit_keys, circuit_present = _parsed(circuit_text, _optional_int, 0, np.int64)
+    rainfall, rainfall_present = _parsed(_column(by_race, "start_rainfall"), _optional_bool, False, bool)
+    per_race: dict[str, Any] = {"circuit_key": _nullable(circuit_keys, circuit_present)}
+    for name in CONTEXT_FLOAT_COLUMNS:
+        per_race[name] = _floats(_column(by_race, name))
+    per_race["start_rainfall"] = np.array([
+        bool(value) if known else None for value, known in zip(rainfall.tolist(), rainfall_present.tolist())
+    ], dtype=object)
+    per_race["start_wind_speed_ms"] = _floats(_column(by_race, "start_wind_speed_ms"))
+    per_race.update({
+        "circuit_prior_races": history.count(),
+        "circuit_prior_avg_winner_laps": history.average(*_float_values(_column(by_race, "winner_laps_completed"))),
+        "circuit_prior_avg_safety_cars": history.average(*_float_values(_column(by_race, "safety_car_deployments"))),
+        "circuit_prior_avg_virtual_safety_cars": history.average(
+            *_float_values(_column(by_race, "virtual_safety_car_deployments"))
+        ),
+        "circuit_prior_rain_rate": history.average((rainfall & rainfall_present).astype(float)),
+    })
+    return {name: values[race_index] for name, values in per_race.items()}
+
+
+def _identity_columns(races: pd.DataFrame, race_index: np.ndarray) -> dict[str, Any]:
+    import numpy as np
+
+    session_keys, session_present = _parsed(_column(races, "session_key"), _optional_int, 0, np.int64)
+    grid, grid_present = _parsed(_column(races, "grid_position"), _optional_int, 0, np.int64)
+    constructors = _column(races, "constructor_id").to_numpy(dtype=object)
+    return {
+        "season": _ints(races["season"]),
+        "round_number": _ints(races["round_number"]),
+        "session_key": _nullable(session_keys, session_present),
+        "driver_id": races["driver_id"].to_numpy(dtype=object),
+        "constructor_id": np.array([value or None for value in constructors.tolist()], dtype=object),
+        "grid_position": _nullable(grid, grid_present),
+    }
+
+
+def _driver_race_codes(*frames: pd.DataFrame) -> list[np.ndarray]:
+    """Shared codes for ``(season, round_number, driver_id)`` across frames."""
+    import numpy as np
+    import pandas as pd
+
+    keys = pd.concat([
+        pd.DataFrame({
+            "season": _ints(frame["season"]) if len(frame) else np.zeros(0, dtype=np.int64),
+            "round_number": _ints(frame["round_number"]) if len(frame) else np.zeros(0, dtype=np.int64),
+            "driver_id": frame["driver_id"].astype(object) if len(frame) else pd.Series([], dtype=object),
+        })
+        for frame in frames
+    ], ignore_index=True)
+    codes = keys.groupby(["season", "round_number", "driver_id"], sort=False, dropna=False).ngroup().to_numpy()
+    bounds = np.cumsum([0, *(len(frame) for frame in frames)])
+    return [codes[start:stop].astype(np.int64) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _dataset_split(races: pd.DataFrame, holdout_season: int | None) -> np.ndarray:
+    return _splits(_ints(races["season"]), holdout_season)
+
+
+def _splits(seasons: np.ndarray, holdout_season: int | None) -> np.ndarray:
+    import numpy as np
+
+    if holdout_season is None:
+        return np.full(len(seasons), "train", dtype=object)
+    return np.array(["train", "test"], dtype=object)[(seasons >= holdout_season).astype(np.int64)]
+
+
+def _parsed(
+    series: pd.Series, parse: Callable[[Any], Any], fill: Any, dtype: Any,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parse each distinct value once; returns filled values and a presence mask."""
+    import numpy as np
+    import pandas as pd
+
+    codes, distinct = pd.factorize(series)
+    parsed = [parse(value) for value in distinct.tolist()]
+    # factorize codes missing values as -1, which indexes the trailing slot.
+    parsed.append(parse(None) if (codes < 0).any() else None)
+    values = np.array([fill if value is None else value for value in parsed], dtype=dtype)
+    present = np.array([value is not None for value in parsed], dtype=bool)
+    return values[codes], present[codes]
+
+
+def _ints(series: pd.Series) -> np.ndarray:
+    import numpy as np
+
+    return _parsed(series, lambda value: int(str(value)), 0, np.int64)[0]
+
+
+def _required_positive_ints(series: pd.Series, field: str) -> np.ndarray:
+    import numpy as np
+
+    values, present = _parsed(series, _optional_int, 0, np.int64)
+    if not (present & (values >= 1)).all():
+        raise ValueError(f"{field} must be a positive integer")
+    return values
+
+
+def _float_values(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    return _parsed(series, _optional_float, 0.0, float)
+
+
+def _floats(series: pd.Series) -> np.ndarray:
+    import numpy as np
+
+    values, present = _float_values(series)
+    return np.where(present, values, np.nan)
+
+
+def _nullable(values: np.ndarray, present: np.ndarray) -> pd.arrays.IntegerArray:
+    import pandas as pd
+
+    return pd.arrays.IntegerArray(values.astype("int64"), ~present)
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    return np.concatenate([np.zeros(1, dtype=values.dtype), np.cumsum(values)])
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    """``0, 1, ..., n - 1`` for each length ``n``, concatenated."""
+    import numpy as np
+
+    total = int(lengths.sum())
+    return np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    """Python's ``round(value, 6)``, which can differ from ``numpy.round``."""
+    import numpy as np
+
+    distinct, positions = np.unique(values, return_inverse=True)
+    return np.array([round(value, 6) for value in distinct.tolist()], dtype=float)[positions.reshape(-1)]
+
+
+def _frame(columns: dict[str, Any], order: tuple[str, ...]) -> pd.DataFrame:
+    import pandas as pd
+
+    # Object arrays stay object columns instead of being inferred as strings.
+    return pd.DataFrame({
+        name: pd.Series(columns[name], dtype=object) if getattr(columns[name], "dtype", None) == object else columns[name]
+        for name in order
+    })
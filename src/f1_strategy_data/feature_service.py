@@ -0,0 +1,106 @@
+"""Pre-race features for an upcoming race from saved feature checkpoints."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from .features import (
+    PIT_STOP_FLAGS,
+    FeatureState,
+    feature_state_path,
+    pit_count_row,
+    pre_race_row,
+    race_context_features,
+)
+
+
+FINISHING_TABLE = "pre_race_finishing_position"
+PIT_COUNT_TABLE = "pre_race_pit_stop_count"
+
+
+class PreRaceFeatureService:
+    """Build feature rows for a race that has not been run yet.
+
+    The service reads the driver, constructor, and circuit histories of two
+    incremental builds once, from checkpoints written by
+    ``build_pre_race_features.py --incremental`` and
+    ``build_pit_count_features.py --incremental``. Each request then only
+    looks up the histories of the drivers on the grid, and never changes
+    them. Target columns are ``None`` because the race has no result yet.
+    """
+
+    def __init__(
+        self,
+        finishing: FeatureState,
+        pit_count: FeatureState,
+        holdout_season: int | None = None,
+    ) -> None:
+        self.finishing = finishing
+        self.pit_count = pit_count
+        self.holdout_season = holdout_season
+
+    @classmethod
+    def load(cls, finishing_output: Path, pit_count_output: Path) -> PreRaceFeatureService:
+        """Load the checkpoints saved next to the two incremental feature files."""
+        finishing, holdout_season = _load_checkpoint(feature_state_path(finishing_output), FINISHING_TABLE)
+        pit_count, pit_holdout_season = _load_checkpoint(feature_state_path(pit_count_output), PIT_COUNT_TABLE)
+        if holdout_season != pit_holdout_season:
+            raise ValueError(
+                f"Checkpoints use different holdout seasons: {holdout_season!r} and {pit_holdout_season!r}"
+            )
+        return cls(finishing, pit_count, holdout_season)
+
+    def finishing_features(
+        self,
+        grid: Iterable[Mapping[str, object]],
+        season: int,
+        round_number: int,
+        context: Mapping[str, object] | None = None,
+    ) -> list[dict[str, object]]:
+        """``PRE_RACE_COLUMNS`` rows for ``grid``, in grid order.
+
+        Grid rows use the ``race_drivers`` fields ``driver_id``,
+        ``constructor_id``, ``grid_position``, and ``session_key``; ``context``
+        is a ``race_context`` row for the same race.
+        """
+        race_key = self._upcoming(self.finishing, season, round_number)
+        race_context = race_context_features(context, self.finishing)
+        return [
+            pre_race_row(row, race_key, self.finishing, race_context, self.holdout_season, None)
+            for row in grid
+        ]
+
+    def pit_count_features(
+        self,
+        grid: Iterable[Mapping[str, object]],
+        season: int,
+        round_number: int,
+        context: Mapping[str, object] | None = None,
+    ) -> list[dict[str, object]]:
+        """``PIT_COUNT_COLUMNS`` rows for ``grid``, as in :meth:`finishing_features`."""
+        race_key = self._upcoming(self.pit_count, season, round_number)
+        race_context = race_context_features(context, self.pit_count)
+        return [
+            pit_count_row(row, race_key, self.pit_count, race_context, self.holdout_season, None)
+            for row in grid
+        ]
+
+    @staticmethod
+    def _upcoming(state: FeatureState, season: int, round_number: int) -> tuple[int, int]:
+        race_key = (int(season), int(round_number))
+        if not state.is_new(race_key):
+            raise ValueError(
+                f"Race {race_key} is not after the last processed race {state.last_race}; "
+                "its features would include its own result"
+            )
+        return race_key
+
+
+def _load_checkpoint(path: Path, table: str) -> tuple[FeatureState, int | None]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("table") != table:
+        raise ValueError(f"{path} is a {document.get('table')!r} checkpoint, expected {table!r}")
+    flags = PIT_STOP_FLAGS if table == PIT_COUNT_TABLE else None
+    return FeatureState.from_dict(document, flags), document.get("holdout_season")
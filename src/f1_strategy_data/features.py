@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import csv
-from collections import defaultdict
+import json
+import math
+from collections import defaultdict, deque
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from statistics import fmean
-from typing import Iterable
+from typing import Any, Iterable
 
 
 PRE_RACE_COLUMNS = (
@@ -45,46 +48,168 @@ NEXT_PIT_COLUMNS = (
     "next_pit_lap", "laps_until_next_pit", "event_observed", "dataset_split",
 )
 
+# "pandas" selects the columnar engine in :mod:`f1_strategy_data.feature_frames`.
+FEATURE_ENGINES = ("python", "pandas")
+
+RECENT_WINDOW = 5
+FEATURE_STATE_VERSION = 1
+PIT_STOP_FLAGS: dict[str, Callable[[Mapping[str, object]], bool]] = {
+    "zero_stops": lambda record: int(record["pit_stops"]) == 0,  # type: ignore[call-overload]
+    "two_plus_stops": lambda record: int(record["pit_stops"]) >= 2,  # type: ignore[call-overload]
+}
+
+
+class RunningHistory:
+    """Running aggregates over the completed races of one driver, team, or circuit.
+
+    Each field's sum is kept as exact partials (Shewchuk's algorithm, as in
+    ``math.fsum``). :meth:`average` is therefore bit-identical to
+    ``round(fmean(values), 6)`` over the whole history without revisiting it.
+    The last :data:`RECENT_WINDOW` records sit in a ring buffer for the
+    recent-form features, and ``flags`` count records matching a predicate.
+    """
+
+    def __init__(
+        self,
+        flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None = None,
+        recent: int = RECENT_WINDOW,
+    ) -> None:
+        self.count = 0
+        self.recent: deque[Mapping[str, object]] = deque(maxlen=recent)
+        self._partials: dict[str, list[float]] = defaultdict(list)
+        self._present: dict[str, int] = defaultdict(int)
+        self._flags = dict(flags or {})
+        self._flag_counts = dict.fromkeys(self._flags, 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, record: Mapping[str, object]) -> None:
+        self.count += 1
+        for field, value in record.items():
+            if value is not None:
+                _add_exact(self._partials[field], float(value))  # type: ignore[arg-type]
+                self._present[field] += 1
+        for name, flag in self._flags.items():
+            self._flag_counts[name] += bool(flag(record))
+        self.recent.append(record)
+
+    def average(self, field: str) -> float | None:
+        present = self._present.get(field, 0)
+        return round(math.fsum(self._partials[field]) / present, 6) if present else None
+
+    def recent_average(self, field: str) -> float | None:
+        return _average(self.recent, field)
+
+    def rate(self, flag: str) -> float | None:
+        return round(self._flag_counts[flag] / self.count, 6) if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "recent": [dict(record) for record in self.recent],
+            "partials": {field: list(partials) for field, partials in self._partials.items()},
+            "present": dict(self._present),
+            "flags": dict(self._flag_counts),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None = None,
+    ) -> RunningHistory:
+        """Restore :meth:`as_dict` output; ``flags`` must be the predicates it was built with."""
+        history = cls(flags)
+        history.count = int(data["count"])
+        history.recent.extend(data["recent"])
+        for field, partials in data["partials"].items():
+            history._partials[field] = [float(partial) for partial in partials]
+        history._present.update(data["present"])
+        if set(data["flags"]) != set(history._flag_counts):
+            raise ValueError(f"History flags {sorted(data['flags'])} do not match {sorted(history._flag_counts)}")
+        history._flag_counts.update(data["flags"])
+        return history
+
+
+class FeatureState:
+    """Driver, constructor, and circuit histories after the last processed race.
+
+    Passing a state to a feature builder skips races up to and including
+    :attr:`last_race` and updates the state in place, so a saved state lets a
+    later build compute only the races added since.
+    """
+
+    def __init__(self, driver_flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None = None) -> None:
+        self.driver_flags = dict(driver_flags or {})
+        self.drivers: dict[str, RunningHistory] = defaultdict(lambda: RunningHistory(self.driver_flags))
+        self.constructors: dict[str, RunningHistory] = defaultdict(RunningHistory)
+        self.circuits: dict[str, RunningHistory] = defaultdict(RunningHistory)
+        self.last_race: tuple[int, int] | None = None
+
+    def is_new(self, race_key: tuple[int, int]) -> bool:
+        return self.last_race is None or race_key > self.last_race
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "version": FEATURE_STATE_VERSION,
+            "last_race": list(self.last_race) if self.last_race is not None else None,
+            "drivers": {key: history.as_dict() for key, history in self.drivers.items()},
+            "constructors": {key: history.as_dict() for key, history in self.constructors.items()},
+            "circuits": {key: history.as_dict() for key, history in self.circuits.items()},
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        driver_flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None = None,
+    ) -> FeatureState:
+        if data.get("version") != FEATURE_STATE_VERSION:
+            raise ValueError(f"Unsupported feature state version: {data.get('version')!r}")
+        state = cls(driver_flags)
+        if data["last_race"] is not None:
+            season, round_number = data["last_race"]
+            state.last_race = (int(season), int(round_number))
+        for key, history in data["drivers"].items():
+            state.drivers[key] = RunningHistory.from_dict(history, state.driver_flags)
+        for key, history in data["constructors"].items():
+            state.constructors[key] = RunningHistory.from_dict(history)
+        for key, history in data["circuits"].items():
+            state.circuits[key] = RunningHistory.from_dict(history)
+        return state
+
 
 def build_pre_race_finishing_features(
     rows: Iterable[dict[str, str]], holdout_season: int | None = None,
     context_rows: Iterable[dict[str, str]] = (),
+    state: FeatureState | None = None,
 ) -> list[dict[str, object]]:
-    """Build rolling features using completed races strictly before each row's race."""
+    """Build rolling features using completed races strictly before each row's race.
+
+    With ``state``, only races after ``state.last_race`` are built, from and
+    into the histories it holds.
+    """
     ordered = sorted(rows, key=lambda row: (
         int(row["season"]), int(row["round_number"]), row["driver_id"]
     ))
-    driver_history: dict[str, list[dict[str, object]]] = defaultdict(list)
-    constructor_history: dict[str, list[dict[str, object]]] = defaultdict(list)
+    state = state if state is not None else FeatureState()
+    driver_history = state.drivers
+    constructor_history = state.constructors
     contexts = _context_by_race(context_rows)
-    circuit_history: dict[str, list[dict[str, object]]] = defaultdict(list)
+    circuit_history = state.circuits
     output: list[dict[str, object]] = []
 
     for race_rows in _group_races(ordered):
         race_key = (int(race_rows[0]["season"]), int(race_rows[0]["round_number"]))
+        if not state.is_new(race_key):
+            continue
         context = contexts.get(race_key)
         context_features = _context_features(context, circuit_history)
         pending: list[tuple[dict[str, str], dict[str, object]]] = []
         for row in race_rows:
             finish = _required_positive_int(row.get("classified_position"), "classified_position")
-            driver = driver_history[row["driver_id"]]
-            constructor_id = row.get("constructor_id", "")
-            constructor = constructor_history[constructor_id] if constructor_id else []
-            season = int(row["season"])
-            feature_row: dict[str, object] = {
-                "season": season,
-                "round_number": int(row["round_number"]),
-                "session_key": _optional_int(row.get("session_key")),
-                "driver_id": row["driver_id"],
-                "constructor_id": constructor_id or None,
-                "grid_position": _optional_int(row.get("grid_position")),
-                **_history_features("driver", driver),
-                **_history_features("constructor", constructor, recent_grid=False, positions_gained=False),
-                **context_features,
-                "classified_position": finish,
-                "dataset_split": "test" if holdout_season is not None and season >= holdout_season else "train",
-            }
-            output.append(feature_row)
+            output.append(pre_race_row(row, race_key, state, context_features, holdout_season, finish))
             pending.append((row, _history_record(row, finish)))
 
         # Update only after every driver in this race has received their features.
@@ -94,21 +219,28 @@ def build_pre_race_finishing_features(
             if constructor_id:
                 constructor_history[constructor_id].append(record)
         _update_circuit_history(context, circuit_history)
+        state.last_race = race_key
     return output
 
 
 def build_pre_race_feature_file(input_path: Path, output_path: Path, holdout_season: int | None = None,
-                                context_path: Path | None = None) -> int:
-    with input_path.open(encoding="utf-8", newline="") as handle:
-        rows = list(csv.DictReader(handle))
-    contexts = _read_optional_csv(context_path)
-    features = build_pre_race_finishing_features(rows, holdout_season, contexts)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(PRE_RACE_COLUMNS))
-        writer.writeheader()
-        writer.writerows(features)
-    return len(features)
+                                context_path: Path | None = None, engine: str = "python",
+                                incremental: bool = False) -> int:
+    _check_engine(engine, incremental)
+    if engine == "pandas":
+        from .feature_frames import pre_race_finishing_frame, read_inputs, records
+
+        races, contexts_frame = read_inputs(input_path, context_path)
+        features = records(pre_race_finishing_frame(races, holdout_season, contexts_frame))
+        _write_features(output_path, "pre_race_finishing_position", PRE_RACE_COLUMNS, features)
+        return len(features)
+    return _write_feature_file(
+        output_path, "pre_race_finishing_position", PRE_RACE_COLUMNS, holdout_season, incremental, None,
+        lambda state: build_pre_race_finishing_features(
+            _read_csv(input_path, state.last_race), holdout_season,
+            _read_optional_csv(context_path, state.last_race), state,
+        ),
+    )
 
 
 def build_pit_count_features(
@@ -117,20 +249,28 @@ def build_pit_count_features(
     stint_rows: Iterable[dict[str, str]],
     holdout_season: int | None = None,
     context_rows: Iterable[dict[str, str]] = (),
+    state: FeatureState | None = None,
 ) -> list[dict[str, object]]:
-    """Build pre-race pit-count features and observed stop-count targets."""
+    """Build pre-race pit-count features and observed stop-count targets.
+
+    ``state`` works as in :func:`build_pre_race_finishing_features` and must
+    be created with :data:`PIT_STOP_FLAGS`.
+    """
     pit_counts = _counts_by_driver_race(pit_rows)
     stint_counts = _counts_by_driver_race(stint_rows)
     ordered = sorted(race_rows, key=lambda row: (
         int(row["season"]), int(row["round_number"]), row["driver_id"]
     ))
-    driver_history: dict[str, list[dict[str, object]]] = defaultdict(list)
-    constructor_history: dict[str, list[dict[str, object]]] = defaultdict(list)
+    state = state if state is not None else FeatureState(PIT_STOP_FLAGS)
+    driver_history = state.drivers
+    constructor_history = state.constructors
     contexts = _context_by_race(context_rows)
-    circuit_history: dict[str, list[dict[str, object]]] = defaultdict(list)
+    circuit_history = state.circuits
     output: list[dict[str, object]] = []
     for current_race in _group_races(ordered):
         race_key = (int(current_race[0]["season"]), int(current_race[0]["round_number"]))
+        if not state.is_new(race_key):
+            continue
         context = contexts.get(race_key)
         context_features = _context_features(context, circuit_history)
         pending: list[tuple[dict[str, str], dict[str, object]]] = []
@@ -138,23 +278,7 @@ def build_pit_count_features(
             key = _driver_race_key(row)
             stops = pit_counts.get(key, 0)
             stints = stint_counts.get(key)
-            driver = driver_history[row["driver_id"]]
-            constructor_id = row.get("constructor_id", "")
-            constructor = constructor_history[constructor_id] if constructor_id else []
-            season = int(row["season"])
-            output.append({
-                "season": season,
-                "round_number": int(row["round_number"]),
-                "session_key": _optional_int(row.get("session_key")),
-                "driver_id": row["driver_id"],
-                "constructor_id": constructor_id or None,
-                "grid_position": _optional_int(row.get("grid_position")),
-                **_pit_history_features("driver", driver),
-                **_pit_history_features("constructor", constructor),
-                **context_features,
-                "pit_stop_count": stops,
-                "dataset_split": "test" if holdout_season is not None and season >= holdout_season else "train",
-            })
+            output.append(pit_count_row(row, race_key, state, context_features, holdout_season, stops))
             pending.append((row, {"pit_stops": stops, "stints": stints}))
         for row, record in pending:
             driver_history[row["driver_id"]].append(record)
@@ -162,6 +286,7 @@ def build_pit_count_features(
             if constructor_id:
                 constructor_history[constructor_id].append(record)
         _update_circuit_history(context, circuit_history)
+        state.last_race = race_key
     return output
 
 
@@ -169,20 +294,24 @@ def build_pit_count_feature_file(
     race_path: Path, pit_path: Path, stint_path: Path, output_path: Path,
     holdout_season: int | None = None,
     context_path: Path | None = None,
+    engine: str = "python",
+    incremental: bool = False,
 ) -> int:
-    inputs = []
-    for path in (race_path, pit_path, stint_path):
-        with path.open(encoding="utf-8", newline="") as handle:
-            inputs.append(list(csv.DictReader(handle)))
-    features = build_pit_count_features(
-        *inputs, holdout_season=holdout_season, context_rows=_read_optional_csv(context_path)
+    _check_engine(engine, incremental)
+    if engine == "pandas":
+        from .feature_frames import pit_count_frame, read_inputs, records
+
+        races, pits, stints, contexts = read_inputs(race_path, pit_path, stint_path, context_path)
+        features = records(pit_count_frame(races, pits, stints, holdout_season, contexts))
+        _write_features(output_path, "pre_race_pit_stop_count", PIT_COUNT_COLUMNS, features)
+        return len(features)
+    return _write_feature_file(
+        output_path, "pre_race_pit_stop_count", PIT_COUNT_COLUMNS, holdout_season, incremental, PIT_STOP_FLAGS,
+        lambda state: build_pit_count_features(
+            *(_read_csv(path, state.last_race) for path in (race_path, pit_path, stint_path)), holdout_season,
+            _read_optional_csv(context_path, state.last_race), state,
+        ),
     )
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(PIT_COUNT_COLUMNS))
-        writer.writeheader()
-        writer.writerows(features)
-    return len(features)
 
 
 def build_next_pit_features(
@@ -190,8 +319,13 @@ def build_next_pit_features(
     pit_rows: Iterable[dict[str, str]],
     stint_rows: Iterable[dict[str, str]],
     holdout_season: int | None = None,
+    state: FeatureState | None = None,
 ) -> list[dict[str, object]]:
-    """Build recurrent lap-level rows for next-pit classification or survival models."""
+    """Build recurrent lap-level rows for next-pit classification or survival models.
+
+    Rows depend only on their own race, so ``state`` just skips races up to
+    ``state.last_race`` and records the last race built.
+    """
     pits_by_race: dict[tuple[int, int, str], list[int]] = defaultdict(list)
     for row in pit_rows:
         pits_by_race[_driver_race_key(row)].append(
@@ -206,24 +340,32 @@ def build_next_pit_features(
             "lap_end": _required_positive_int(row.get("lap_end"), "lap_end"),
             "tyre_age_at_start": _optional_int(row.get("tyre_age_at_start_laps")),
         })
+    state = state if state is not None else FeatureState()
+    resume_after = state.last_race
     output: list[dict[str, object]] = []
     for race in sorted(race_rows, key=lambda row: (
         int(row["season"]), int(row["round_number"]), row["driver_id"]
     )):
         key = _driver_race_key(race)
+        if resume_after is not None and key[:2] <= resume_after:
+            continue
+        state.last_race = key[:2]
         completed_laps = _optional_int(race.get("laps_completed"))
         if completed_laps is None or completed_laps <= 0:
             continue
         pit_laps = sorted(set(lap for lap in pits_by_race.get(key, []) if lap <= completed_laps))
         stints = sorted(stints_by_race.get(key, []), key=lambda row: int(row["stint_number"]))
+        stint_by_lap = _stints_by_lap(stints, completed_laps)
         season = int(race["season"])
+        pits_before = 0
         for lap in range(1, completed_laps + 1):
-            stint = _stint_for_lap(stints, lap)
+            # Laps only increase, so the count of earlier pits only advances.
+            while pits_before < len(pit_laps) and pit_laps[pits_before] < lap:
+                pits_before += 1
+            stint = stint_by_lap[lap]
             if stint is None:
                 continue
-            previous_pits = [pit for pit in pit_laps if pit < lap]
-            future_pits = [pit for pit in pit_laps if pit >= lap]
-            next_pit = future_pits[0] if future_pits else None
+            next_pit = pit_laps[pits_before] if pits_before < len(pit_laps) else None
             base_age = stint["tyre_age_at_start"]
             output.append({
                 "season": season,
@@ -237,8 +379,8 @@ def build_next_pit_features(
                     int(base_age) + lap - int(stint["lap_start"])
                     if base_age is not None else None
                 ),
-                "pit_stops_completed": len(previous_pits),
-                "laps_since_last_pit": lap - previous_pits[-1] if previous_pits else lap - 1,
+                "pit_stops_completed": pits_before,
+                "laps_since_last_pit": lap - pit_laps[pits_before - 1] if pits_before else lap - 1,
                 "pit_this_lap": next_pit == lap,
                 "next_pit_lap": next_pit,
                 "laps_until_next_pit": next_pit - lap if next_pit is not None else None,
@@ -251,18 +393,98 @@ def build_next_pit_features(
 def build_next_pit_feature_file(
     race_path: Path, pit_path: Path, stint_path: Path, output_path: Path,
     holdout_season: int | None = None,
+    engine: str = "python",
+    incremental: bool = False,
 ) -> int:
-    inputs = []
-    for path in (race_path, pit_path, stint_path):
-        with path.open(encoding="utf-8", newline="") as handle:
-            inputs.append(list(csv.DictReader(handle)))
-    features = build_next_pit_features(*inputs, holdout_season=holdout_season)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(NEXT_PIT_COLUMNS))
-        writer.writeheader()
-        writer.writerows(features)
-    return len(features)
+    _check_engine(engine, incremental)
+    if engine == "pandas":
+        from .feature_frames import next_pit_frame, read_inputs, records
+
+        features = records(next_pit_frame(*read_inputs(race_path, pit_path, stint_path), holdout_season))
+        _write_features(output_path, "live_next_pit", NEXT_PIT_COLUMNS, features)
+        return len(features)
+    return _write_feature_file(
+        output_path, "live_next_pit", NEXT_PIT_COLUMNS, holdout_season, incremental, None,
+        lambda state: build_next_pit_features(
+            *(_read_csv(path, state.last_race) for path in (race_path, pit_path, stint_path)), holdout_season, state,
+        ),
+    )
+
+
+def feature_state_path(output_path: Path) -> Path:
+    """Checkpoint kept next to an incrementally built feature file."""
+    return output_path.with_suffix(".state.json")
+
+
+def pre_race_row(
+    row: Mapping[str, object],
+    race_key: tuple[int, int],
+    state: FeatureState,
+    context_features: Mapping[str, object],
+    holdout_season: int | None,
+    classified_position: int | None,
+) -> dict[str, object]:
+    """One :data:`PRE_RACE_COLUMNS` row from the histories in ``state``.
+
+    The state is only read, so it must end before ``race_key``.
+    """
+    driver, constructor = _row_histories(row, state)
+    return {
+        **_row_identity(row, race_key),
+        **_history_features("driver", driver),
+        **_history_features("constructor", constructor, recent_grid=False, positions_gained=False),
+        **context_features,
+        "classified_position": classified_position,
+        "dataset_split": _dataset_split(race_key[0], holdout_season),
+    }
+
+
+def pit_count_row(
+    row: Mapping[str, object],
+    race_key: tuple[int, int],
+    state: FeatureState,
+    context_features: Mapping[str, object],
+    holdout_season: int | None,
+    pit_stop_count: int | None,
+) -> dict[str, object]:
+    """One :data:`PIT_COUNT_COLUMNS` row; ``state`` is read as in :func:`pre_race_row`."""
+    driver, constructor = _row_histories(row, state)
+    return {
+        **_row_identity(row, race_key),
+        **_pit_history_features("driver", driver),
+        **_pit_history_features("constructor", constructor),
+        **context_features,
+        "pit_stop_count": pit_stop_count,
+        "dataset_split": _dataset_split(race_key[0], holdout_season),
+    }
+
+
+def race_context_features(context: Mapping[str, object] | None, state: FeatureState) -> dict[str, object]:
+    """Start conditions and prior circuit history for one race."""
+    return _context_features(context, state.circuits)
+
+
+def _row_identity(row: Mapping[str, object], race_key: tuple[int, int]) -> dict[str, object]:
+    return {
+        "season": race_key[0],
+        "round_number": race_key[1],
+        "session_key": _optional_int(row.get("session_key")),
+        "driver_id": row["driver_id"],
+        "constructor_id": row.get("constructor_id", "") or None,
+        "grid_position": _optional_int(row.get("grid_position")),
+    }
+
+
+def _row_histories(row: Mapping[str, object], state: FeatureState) -> tuple[RunningHistory, RunningHistory]:
+    """Histories for a row's driver and constructor, without creating new entries."""
+    driver = state.drivers.get(row["driver_id"]) or RunningHistory(state.driver_flags)  # type: ignore[call-overload]
+    constructor_id = row.get("constructor_id", "")
+    constructor = state.constructors.get(constructor_id) if constructor_id else None  # type: ignore[call-overload]
+    return driver, constructor or RunningHistory()
+
+
+def _dataset_split(season: int, holdout_season: int | None) -> str:
+    return "test" if holdout_season is not None and season >= holdout_season else "train"
 
 
 def _group_races(rows: list[dict[str, str]]) -> Iterable[list[dict[str, str]]]:
@@ -281,47 +503,52 @@ def _group_races(rows: list[dict[str, str]]) -> Iterable[list[dict[str, str]]]:
 
 def _history_features(
     prefix: str,
-    history: list[dict[str, object]],
+    history: RunningHistory,
     recent_grid: bool = True,
     positions_gained: bool = True,
 ) -> dict[str, object]:
-    recent = history[-5:]
     values: dict[str, object] = {
         f"{prefix}_prior_starts": len(history),
-        f"{prefix}_prior_avg_finish": _average(history, "finish"),
+        f"{prefix}_prior_avg_finish": history.average("finish"),
     }
     if recent_grid:
-        values[f"{prefix}_prior_avg_grid"] = _average(history, "grid")
-    values[f"{prefix}_prior_dnf_rate"] = _average(history, "dnf")
+        values[f"{prefix}_prior_avg_grid"] = history.average("grid")
+    values[f"{prefix}_prior_dnf_rate"] = history.average("dnf")
     if positions_gained:
-        values[f"{prefix}_prior_avg_positions_gained"] = _average(history, "positions_gained")
-    values[f"{prefix}_recent5_avg_finish"] = _average(recent, "finish")
+        values[f"{prefix}_prior_avg_positions_gained"] = history.average("positions_gained")
+    values[f"{prefix}_recent5_avg_finish"] = history.recent_average("finish")
     if recent_grid:
-        values[f"{prefix}_recent5_avg_grid"] = _average(recent, "grid")
+        values[f"{prefix}_recent5_avg_grid"] = history.recent_average("grid")
     return values
 
 
-def _pit_history_features(prefix: str, history: list[dict[str, object]]) -> dict[str, object]:
-    recent = history[-5:]
+def _pit_history_features(prefix: str, history: RunningHistory) -> dict[str, object]:
     if prefix == "driver":
         return {
             "driver_prior_races": len(history),
-            "driver_prior_avg_pit_stops": _average(history, "pit_stops"),
-            "driver_recent5_avg_pit_stops": _average(recent, "pit_stops"),
-            "driver_prior_zero_stop_rate": _rate(history, lambda value: value == 0),
-            "driver_prior_two_plus_stop_rate": _rate(history, lambda value: value >= 2),
-            "driver_prior_avg_stints": _average(history, "stints"),
+            "driver_prior_avg_pit_stops": history.average("pit_stops"),
+            "driver_recent5_avg_pit_stops": history.recent_average("pit_stops"),
+            "driver_prior_zero_stop_rate": history.rate("zero_stops"),
+            "driver_prior_two_plus_stop_rate": history.rate("two_plus_stops"),
+            "driver_prior_avg_stints": history.average("stints"),
         }
     return {
         "constructor_prior_driver_races": len(history),
-        "constructor_prior_avg_pit_stops": _average(history, "pit_stops"),
-        "constructor_recent5_avg_pit_stops": _average(recent, "pit_stops"),
+        "constructor_prior_avg_pit_stops": history.average("pit_stops"),
+        "constructor_recent5_avg_pit_stops": history.recent_average("pit_stops"),
     }
 
 
-def _stint_for_lap(stints: list[dict[str, object]], lap: int) -> dict[str, object] | None:
-    return next((stint for stint in stints
-                 if int(stint["lap_start"]) <= lap <= int(stint["lap_end"])), None)
+def _stints_by_lap(stints: list[dict[str, object]], laps: int) -> list[dict[str, object] | None]:
+    """Index ``laps`` + 1 slots by lap number with the first stint covering each lap."""
+    by_lap: list[dict[str, object] | None] = [None] * (laps + 1)
+    # Fill in reverse so that, where stints overlap, the earliest one wins.
+    for stint in reversed(stints):
+        first = max(int(stint["lap_start"]), 1)  # type: ignore[call-overload]
+        last = min(int(stint["lap_end"]), laps)  # type: ignore[call-overload]
+        if first <= last:
+            by_lap[first:last + 1] = [stint] * (last - first + 1)
+    return by_lap
 
 
 def _counts_by_driver_race(rows: Iterable[dict[str, str]]) -> dict[tuple[int, int, str], int]:
@@ -335,13 +562,6 @@ def _driver_race_key(row: dict[str, str]) -> tuple[int, int, str]:
     return int(row["season"]), int(row["round_number"]), row["driver_id"]
 
 
-def _rate(history: list[dict[str, object]], predicate: object) -> float | None:
-    if not history:
-        return None
-    matches = sum(bool(predicate(int(row["pit_stops"]))) for row in history)  # type: ignore[operator]
-    return round(matches / len(history), 6)
-
-
 def _history_record(row: dict[str, str], finish: int) -> dict[str, object]:
     grid = _optional_int(row.get("grid_position"))
     valid_grid = grid if grid is not None and grid > 0 else None
@@ -358,11 +578,26 @@ def _is_classified_finish(status: str) -> bool:
     return normalized == "finished" or normalized.startswith("+")
 
 
-def _average(rows: Iterable[dict[str, object]], field: str) -> float | None:
-    values = [float(row[field]) for row in rows if row.get(field) is not None]
+def _average(rows: Iterable[Mapping[str, object]], field: str) -> float | None:
+    values = [float(row[field]) for row in rows if row.get(field) is not None]  # type: ignore[arg-type]
     return round(fmean(values), 6) if values else None
 
 
+def _add_exact(partials: list[float], value: float) -> None:
+    """Add ``value`` to non-overlapping partials whose exact sum is the total."""
+    index = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[index] = low
+            index += 1
+        value = high
+    partials[index:] = [value]
+
+
 def _optional_int(value: object) -> int | None:
     return int(str(value)) if value not in (None, "") else None
 
@@ -374,11 +609,120 @@ def _required_positive_int(value: object, field: str) -> int:
     return result
 
 
-def _read_optional_csv(path: Path | None) -> list[dict[str, str]]:
-    if path is None:
-        return []
+def _write_features(
+    path: Path, table: str, columns: tuple[str, ...], features: list[dict[str, object]],
+) -> None:
+    """Write feature rows as CSV, or as typed Parquet for a ``.parquet`` path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        from .columnar import write_parquet
+
+        write_parquet(features, path, table, columns)
+        return
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(columns))
+        writer.writeheader()
+        writer.writerows(features)
+
+
+def _check_engine(engine: str, incremental: bool) -> None:
+    if engine not in FEATURE_ENGINES:
+        raise ValueError(f"Unknown feature engine: {engine!r}")
+    if incremental and engine != "python":
+        raise ValueError("Incremental feature builds use the python engine")
+
+
+def _write_feature_file(
+    output_path: Path,
+    table: str,
+    columns: tuple[str, ...],
+    holdout_season: int | None,
+    incremental: bool,
+    driver_flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None,
+    build: Callable[[FeatureState], list[dict[str, object]]],
+) -> int:
+    """Write a feature table, or append its new races to an incremental build.
+
+    An incremental build resumes from the checkpoint at
+    :func:`feature_state_path` when it matches the table, holdout season and
+    current output file, and otherwise rebuilds from scratch. Races up to the
+    checkpoint are assumed unchanged; delete the checkpoint after correcting
+    an earlier race. Returns the number of rows written.
+    """
+    if not incremental:
+        features = build(FeatureState(driver_flags))
+        _write_features(output_path, table, columns, features)
+        return len(features)
+    if output_path.suffix != ".csv":
+        raise ValueError("Incremental feature builds append to a .csv output")
+    state_path = feature_state_path(output_path)
+    state = _read_feature_state(state_path, output_path, table, holdout_season, driver_flags)
+    if state is None:
+        state = FeatureState(driver_flags)
+        features = build(state)
+        _write_features(output_path, table, columns, features)
+    else:
+        features = build(state)
+        with output_path.open("a", encoding="utf-8", newline="") as handle:
+            csv.DictWriter(handle, fieldnames=list(columns)).writerows(features)
+    staging = state_path.with_name(state_path.name + ".tmp")
+    staging.write_text(json.dumps({
+        **state.as_dict(),
+        "table": table,
+        "holdout_season": holdout_season,
+        "output_bytes": output_path.stat().st_size,
+    }) + "\n", encoding="utf-8")
+    staging.replace(state_path)
+    return len(features)
+
+
+def _read_feature_state(
+    state_path: Path,
+    output_path: Path,
+    table: str,
+    holdout_season: int | None,
+    driver_flags: Mapping[str, Callable[[Mapping[str, object]], bool]] | None,
+) -> FeatureState | None:
+    if not state_path.exists() or not output_path.exists():
+        return None
+    document = json.loads(state_path.read_text(encoding="utf-8"))
+    # A size mismatch means the output changed after the checkpoint was saved.
+    if (
+        document.get("version") != FEATURE_STATE_VERSION
+        or document.get("table") != table
+        or document.get("holdout_season") != holdout_season
+        or document.get("output_bytes") != output_path.stat().st_size
+    ):
+        return None
+    return FeatureState.from_dict(document, driver_flags)
+
+
+def _read_csv(path: Path, after: tuple[int, int] | None = None) -> list[dict[str, str]]:
+    """Read CSV rows, keeping only races after ``after`` when it is given."""
     with path.open(encoding="utf-8", newline="") as handle:
-        return list(csv.DictReader(handle))
+        reader = csv.DictReader(handle)
+        if after is None:
+            return list(reader)
+        fields = reader.fieldnames or []
+        if "season" not in fields or "round_number" not in fields:
+            return list(reader)
+        # Decide per race rather than per row, and build dicts only for rows kept.
+        season, round_number = fields.index("season"), fields.index("round_number")
+        is_new: dict[tuple[str, str], bool] = {}
+        rows = []
+        for values in reader.reader:
+            if not values:
+                continue
+            key = (values[season], values[round_number])
+            if key not in is_new:
+                is_new[key] = (int(key[0]), int(key[1])) > after
+            if is_new[key]:
+                rows.append(dict(zip(fields, values)))
+        return rows
+
+
+def _read_optional_csv(path: Path | None, after: tuple[int, int] | None = None) -> list[dict[str, str]]:
+    return _read_csv(path, after) if path is not None else []
 
 
 def _context_by_race(rows: Iterable[dict[str, str]]) -> dict[tuple[int, int], dict[str, str]]:
@@ -386,11 +730,12 @@ def _context_by_race(rows: Iterable[dict[str, str]]) -> dict[tuple[int, int], di
 
 
 def _context_features(
-    context: dict[str, str] | None,
-    histories: dict[str, list[dict[str, object]]],
+    context: Mapping[str, object] | None,
+    histories: Mapping[str, RunningHistory],
 ) -> dict[str, object]:
     circuit_key = context.get("circuit_key") if context else None
-    history = histories.get(str(circuit_key), []) if circuit_key not in (None, "") else []
+    history = histories.get(str(circuit_key)) if circuit_key not in (None, "") else None
+    history = history or RunningHistory()
     return {
         "circuit_key": _optional_int(circuit_key),
         "start_air_temperature_c": _optional_float(context.get("start_air_temperature_c") if context else None),
@@ -400,16 +745,16 @@ def _context_features(
         "start_rainfall": _optional_bool(context.get("start_rainfall") if context else None),
         "start_wind_speed_ms": _optional_float(context.get("start_wind_speed_ms") if context else None),
         "circuit_prior_races": len(history),
-        "circuit_prior_avg_winner_laps": _average(history, "winner_laps"),
-        "circuit_prior_avg_safety_cars": _average(history, "safety_cars"),
-        "circuit_prior_avg_virtual_safety_cars": _average(history, "virtual_safety_cars"),
-        "circuit_prior_rain_rate": _average(history, "rain"),
+        "circuit_prior_avg_winner_laps": history.average("winner_laps"),
+        "circuit_prior_avg_safety_cars": history.average("safety_cars"),
+        "circuit_prior_avg_virtual_safety_cars": history.average("virtual_safety_cars"),
+        "circuit_prior_rain_rate": history.average("rain"),
     }
 
 
 def _update_circuit_history(
     context: dict[str, str] | None,
-    histories: dict[str, list[dict[str, object]]],
+    histories: dict[str, RunningHistory],
 ) -> None:
     if not context or context.get("circuit_key") in (None, ""):
         return
@@ -0,0 +1,240 @@
+"""Columnar versions of the row validators for large consolidated tables.
+
+The functions here apply the rules of :mod:`f1_strategy_data.validation` to
+pandas DataFrames, for example consolidated multi-season CSV or Parquet
+tables. Their output, including issue order and messages, is identical to the
+row-by-row validators for the same rows. Missing values may be ``None``,
+``NaN``, or empty strings. Numeric text is parsed once per distinct value, and
+timestamps the vectorized check cannot confirm are rechecked with the row
+validators' own helper.
+
+pandas is optional and imported lazily, like pyarrow in :mod:`columnar`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from .validation import ValidationIssue, _is_utc_timestamp, _number
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+ESTIMATED_WEATHER_SOURCES = ("open_meteo", "open-meteo", "estimated")
+# UTC timestamps whose validity reduces to a valid calendar date.
+_UTC_TIMESTAMP = r"^\d{4}-\d{2}-\d{2}[T ](?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?(?:Z|\+00:00)$"
+
+
+def read_table(path: Path) -> pd.DataFrame:
+    """Read a canonical CSV or Parquet table for the columnar validators.
+
+    CSV values are kept as strings, as :class:`csv.DictReader` would return
+    them, so validation results match the row validators on the same file.
+    """
+    import pandas as pd
+
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def table_issues(table: str, frame: pd.DataFrame) -> list[ValidationIssue]:
+    """Run the field-level rules for ``table``; tables without rules yield none."""
+    validator = FRAME_VALIDATORS.get(table)
+    return validator(frame) if validator is not None else []
+
+
+def weather_issues(frame: pd.DataFrame) -> list[ValidationIssue]:
+    import numpy as np
+
+    found: list[tuple[int, int, ValidationIssue]] = []
+    _, track_present = _numbers(_column(frame, "track_temperature_c"))
+    estimated = _column(frame, "weather_source").isin(ESTIMATED_WEATHER_SOURCES).to_numpy()
+    for position in _positions(track_present & estimated):
+        found.append((position, 0, ValidationIssue(
+            "error", "estimated_track_temperature", "Track temperature must come from trackside timing data", position + 2,
+        )))
+    humidity, present = _numbers(_column(frame, "humidity_pct"))
+    with np.errstate(invalid="ignore"):
+        invalid = present & ~((humidity >= 0) & (humidity <= 100))
+    for position in _positions(invalid):
+        found.append((position, 1, ValidationIssue(
+            "error", "invalid_humidity", f"Humidity is {humidity[position].item()}", position + 2,
+        )))
+    wind_speed, present = _numbers(_column(frame, "wind_speed_ms"))
+    with np.errstate(invalid="ignore"):
+        invalid = present & (wind_speed < 0)
+    for position in _positions(invalid):
+        found.append((position, 2, ValidationIssue(
+            "error", "invalid_wind_speed", f"Wind speed is {wind_speed[position].item()}", position + 2,
+        )))
+    for position in _positions(~_utc_timestamps(_column(frame, "observed_at_utc"))):
+        found.append((position, 3, ValidationIssue(
+            "error", "invalid_weather_timestamp", "Weather timestamp must be ISO-8601 UTC", position + 2,
+        )))
+    return _in_row_order(found)
+
+
+def pit_stop_issues(frame: pd.DataFrame) -> list[ValidationIssue]:
+    found: list[tuple[int, int, ValidationIssue]] = []
+    lap, lap_present = _integers(_column(frame, "lap_number"))
+    completed, completed_present = _integers(_column(frame, "driver_laps_completed"))
+    for position in _positions(lap_present & (lap < 1)):
+        found.append((position, 0, ValidationIssue(
+            "error", "invalid_pit_lap", f"Pit lap is {int(lap[position])}", position + 2,
+        )))
+    for position in _positions(lap_present & completed_present & (lap > completed)):
+        found.append((position, 1, ValidationIssue(
+            "error", "pit_after_retirement",
+            f"Pit lap {int(lap[position])} exceeds {int(completed[position])} completed laps", position + 2,
+        )))
+    return _in_row_order(found)
+
+
+def stint_issues(frame: pd.DataFrame) -> list[ValidationIssue]:
+    import numpy as np
+    import pandas as pd
+
+    found: list[tuple[int, int, ValidationIssue]] = []
+    start, start_present = _integers(_column(frame, "lap_start"))
+    end, end_present = _integers(_column(frame, "lap_end"))
+    bounded = start_present & end_present
+    for position in _positions(~bounded):
+        found.append((position, 0, ValidationIssue(
+            "error", "missing_stint_boundary", "Stint boundaries are required", position + 2,
+        )))
+    for position in _positions(bounded & (end < start)):
+        found.append((position, 0, ValidationIssue(
+            "error", "invalid_stint_boundary",
+            f"Stint ends on lap {int(end[position])} before lap {int(start[position])}", position + 2,
+        )))
+    issues = _in_row_order(found)
+
+    positions = np.flatnonzero(bounded)
+    if not len(positions):
+        return issues
+    session_keys = _column(frame, "session_key").iloc[positions].tolist()
+    driver_ids = _column(frame, "driver_id").iloc[positions].tolist()
+    # Group codes follow first appearance, like the row validator's dict.
+    groups = pd.DataFrame({"session_key": session_keys, "driver_id": driver_ids}).groupby(
+        ["session_key", "driver_id"], sort=False, dropna=False,
+    ).ngroup().to_numpy()
+    _, first_rows = np.unique(groups, return_index=True)
+    keys = [(session_keys[row], driver_ids[row]) for row in first_rows.tolist()]
+    starts = start[positions].astype(np.int64)
+    ends = end[positions].astype(np.int64)
+    order = np.lexsort((positions, ends, starts, groups))
+    groups, starts, ends, positions = groups[order], starts[order], ends[order], positions[order]
+    first = np.ones(len(groups), dtype=bool)
+    first[1:] = groups[1:] != groups[:-1]
+    running = pd.Series(ends).groupby(groups).cummax().to_numpy()
+    previous_end = np.empty_like(running)
+    previous_end[1:] = running[:-1]
+    overlapping = ~first & (starts <= previous_end)
+    # The row validator restarts its running maximum after a lap-0 end, which
+    # only differs from cummax when a later stint ends on a negative lap.
+    for group in np.unique(groups[ends < 0]):
+        members = np.flatnonzero(groups == group)
+        overlapping[members] = _overlaps(starts[members].tolist(), ends[members].tolist())
+    issues.extend(
+        ValidationIssue("error", "overlapping_stints", f"Overlapping stint for {keys[group]!r}", position + 2)
+        for group, position in zip(groups[overlapping].tolist(), positions[overlapping].tolist())
+    )
+    return issues
+
+
+FRAME_VALIDATORS: dict[str, Callable[[pd.DataFrame], list[ValidationIssue]]] = {
+    "pit_events": pit_stop_issues,
+    "stints": stint_issues,
+    "weather_observations": weather_issues,
+}
+
+
+def _column(frame: pd.DataFrame, name: str) -> pd.Series:
+    import pandas as pd
+
+    if name in frame.columns:
+        return frame[name].reset_index(drop=True)
+    return pd.Series([None] * len(frame), dtype=object)
+
+
+def _missing(series: pd.Series) -> np.ndarray:
+    missing = series.isna().to_numpy(dtype=bool)
+    if series.dtype.kind not in "biufmM":
+        missing = missing | series.eq("").to_numpy(dtype=bool, na_value=False)
+    return missing
+
+
+def _numbers(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``validation._number``: float values and a presence mask.
+
+    Text columns are parsed once per distinct value with ``_number`` itself,
+    so unusual spellings such as ``"nan"`` or ``" 7 "`` behave identically.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if series.dtype.kind in "biuf":
+        return series.to_numpy(dtype=float, na_value=np.nan), ~series.isna().to_numpy(dtype=bool)
+    codes, distinct = pd.factorize(series)
+    parsed = [_number(value) for value in distinct.tolist()]
+    distinct_values = np.array([np.nan if number is None else number for number in parsed] + [np.nan], dtype=float)
+    distinct_present = np.array([number is not None for number in parsed] + [False], dtype=bool)
+    # factorize codes missing values as -1, which indexes the trailing slot.
+    return distinct_values[codes], distinct_present[codes]
+
+
+def _integers(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``validation._integer``: whole-number floats and a presence mask."""
+    import numpy as np
+
+    values, present = _numbers(series)
+    with np.errstate(invalid="ignore"):
+        whole = present & np.isfinite(values) & (values == np.floor(values))
+    return np.where(whole, values, 0.0), whole
+
+
+def _utc_timestamps(series: pd.Series) -> np.ndarray:
+    """True where a timestamp is absent or valid, as in ``weather_issues``."""
+    import numpy as np
+    import pandas as pd
+
+    valid = _missing(series)
+    if series.dtype.kind not in "biufmM":
+        # The pattern checks the time of day; only the calendar date remains.
+        canonical = np.flatnonzero(series.str.match(_UTC_TIMESTAMP, na=False).to_numpy(dtype=bool))
+        if len(canonical):
+            dates = pd.to_datetime(series.iloc[canonical].str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+            valid[canonical[dates.notna().to_numpy(dtype=bool)]] = True
+    unresolved = np.flatnonzero(~valid)
+    if len(unresolved):
+        text = [str(value) for value in series.iloc[unresolved].tolist()]
+        valid[unresolved] = _per_distinct(text, _is_utc_timestamp)
+    return valid
+
+
+def _positions(mask: np.ndarray) -> list[int]:
+    import numpy as np
+
+    return np.flatnonzero(mask).tolist()
+
+
+def _per_distinct(values: list[Any], parse: Callable[[Any], Any]) -> list[Any]:
+    cache: dict[Any, Any] = {}
+    return [cache[value] if value in cache else cache.setdefault(value, parse(value)) for value in values]
+
+
+def _overlaps(starts: list[int], ends: list[int]) -> list[bool]:
+    flags: list[bool] = []
+    previous_end: int | None = None
+    for start, end in zip(starts, ends):
+        flags.append(previous_end is not None and start <= previous_end)
+        previous_end = max(previous_end or end, end)
+    return flags
+
+
+def _in_row_order(found: list[tuple[int, int, ValidationIssue]]) -> list[ValidationIssue]:
+    return [issue for _, _, issue in sorted(found, key=lambda item: (item[0], item[1]))]
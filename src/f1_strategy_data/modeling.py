@@ -183,11 +183,11 @@ def evaluate_task(task: str, frame: pd.DataFrame) -> dict[str, Any]:
 
 
 def evaluate_files(paths: dict[str, Path], output: Path | None = None) -> dict[str, Any]:
-    """Evaluate feature CSVs and optionally persist one JSON report."""
+    """Evaluate feature CSV or Parquet files and optionally persist one JSON report."""
     missing_tasks = sorted(set(TASKS) - set(paths))
     if missing_tasks:
         raise ValueError(f"Missing task paths: {', '.join(missing_tasks)}")
-    reports = {task: evaluate_task(task, pd.read_csv(paths[task])) for task in TASKS}
+    reports = {task: evaluate_task(task, _read_features(paths[task])) for task in TASKS}
     result = {
         "methodology": "chronological holdout; every train season precedes every test season",
         "tasks": reports,
@@ -198,6 +198,12 @@ def evaluate_files(paths: dict[str, Path], output: Path | None = None) -> dict[s
     return result
 
 
+def _read_features(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
 def _split_metadata(train: pd.DataFrame, test: pd.DataFrame, features: list[str]) -> dict[str, Any]:
     return {
         "features": features,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Iterable
 
@@ -102,26 +104,25 @@ def normalize_stints(
     rows: list[dict[str, Any]] = []
     for driver_rows in by_driver.values():
         ordered = sorted(driver_rows, key=lambda row: (row["stint_number"], row["lap_start"]))
+        # Start laps of stints covering at least one lap, kept current as
+        # shared boundaries are moved so replacement checks are O(1).
+        covering_starts = Counter(row["lap_start"] for row in ordered if row["lap_end"] >= row["lap_start"])
         previous_end: int | None = None
         for current in ordered:
             start = current["lap_start"]
             end = current["lap_end"]
-            has_replacement = any(
-                other is not current
-                and other["lap_start"] == start
-                and other["lap_end"] >= start
-                for other in ordered
-            )
             # OpenF1 sometimes emits a tyre record that covered no completed
             # racing lap (for example 1-0 before the actual starting stint).
             # It cannot be represented by our inclusive completed-lap schema.
-            if end == start - 1 and has_replacement:
+            if end == start - 1 and covering_starts[start]:
                 continue
             if previous_end is not None and start == previous_end:
                 start += 1
                 if start > end:
                     continue
                 current["lap_start"] = start
+                covering_starts[start - 1] -= 1
+                covering_starts[start] += 1
             rows.append(current)
             previous_end = max(previous_end or end, end)
     return rows
@@ -160,11 +161,11 @@ def count_shared_stint_boundaries(
             by_driver.setdefault(key, []).append(
                 (int(row["stint_number"]), int(row["lap_start"]), int(row["lap_end"]))
             )
-    return sum(
-        current[1] == previous[2]
-        for spans in by_driver.values()
-        for previous, current in zip(sorted(spans), sorted(spans)[1:])
-    )
+    shared = 0
+    for spans in by_driver.values():
+        spans.sort()
+        shared += sum(current[1] == previous[2] for previous, current in zip(spans, spans[1:]))
+    return shared
 
 
 def normalize_pit_events(
@@ -361,14 +362,46 @@ def normalize_historical_race_context(
     }]
 
 
+class WeatherTimeline:
+    """Weather observations parsed once and sorted by observation time.
+
+    Rows sharing a timestamp keep their source order, so lookups resolve ties
+    to the earliest source row.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]]) -> None:
+        ordered = sorted(
+            ((_parse_datetime(row["date"]), index, row) for index, row in enumerate(rows)),
+            key=lambda item: (item[0], item[1]),
+        )
+        self.times = [observed for observed, _, _ in ordered]
+        self._indices = [index for _, index, _ in ordered]
+        self.rows = [row for _, _, row in ordered]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def nearest(self, at: datetime, tolerance: timedelta) -> dict[str, Any] | None:
+        """Return the observation closest to ``at`` within ``tolerance``, if any."""
+        position = bisect_left(self.times, at)
+        candidates = []
+        if position > 0:
+            # First row of the latest timestamp before ``at``.
+            candidates.append(bisect_left(self.times, self.times[position - 1], hi=position))
+        if position < len(self.times):
+            candidates.append(position)
+        matches = [
+            (abs(self.times[candidate] - at), self._indices[candidate], self.rows[candidate])
+            for candidate in candidates
+            if abs(self.times[candidate] - at) <= tolerance
+        ]
+        return min(matches, key=lambda match: (match[0], match[1]))[2] if matches else None
+
+
 def _closest_start_weather(
     rows: Iterable[dict[str, Any]], start: datetime
 ) -> dict[str, Any] | None:
-    candidates = [
-        row for row in rows
-        if abs(_parse_datetime(row["date"]) - start) <= timedelta(minutes=15)
-    ]
-    return min(candidates, key=lambda row: abs(_parse_datetime(row["date"]) - start), default=None)
+    return WeatherTimeline(rows).nearest(start, timedelta(minutes=15))
 
 
 def _parse_datetime(value: object) -> datetime:
@@ -5,10 +5,14 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Collection, Iterable, Mapping
 from urllib.error import HTTPError
 
+from . import __version__
+from .checksums import sha256_file
 from .normalize import (
     completed_laps_for_pit_validation,
     count_shared_stint_boundaries,
@@ -22,12 +26,31 @@ from .normalize import (
     normalize_stints,
     normalize_weather,
 )
+from .rawstore import RawStore
 from .sources import (
-    jolpica_pit_stops, jolpica_results, jolpica_season_full_results, openf1,
+    VALIDATOR_HEADERS, NotModified, conditional,
+    jolpica_pit_stops, jolpica_results, jolpica_season_full_results, openf1, openf1_session_range,
 )
-from .validation import duplicate_key_issues, pit_stop_issues, stint_issues, weather_issues
+from .validation import cross_table_issues, duplicate_key_issues, pit_stop_issues, stint_issues, weather_issues
 
 
+# Bump when a canonical table gains, loses, or reinterprets a column so that
+# unchanged raw snapshots are still rebuilt into the new layout.
+CANONICAL_SCHEMA_VERSION = 1
+
+# Provenance sidecar field naming the stored payload object.
+PAYLOAD_HASH_FIELD = "payload_sha256"
+
+# Raw snapshot name -> OpenF1 endpoint for the per-race detailed sources.
+OPENF1_SNAPSHOTS = {
+    "openf1_results": "session_result",
+    "openf1_session": "sessions",
+    "openf1_race_control": "race_control",
+    "openf1_stints": "stints",
+    "openf1_pits": "pit",
+    "openf1_weather": "weather",
+}
+
 TABLE_KEYS = {
     "race_context": ("season", "round_number"),
     "race_drivers": ("season", "round_number", "driver_id", "car_number"),
@@ -41,32 +64,43 @@ def build_historical_season(
     season: int, root: Path, refresh: bool = False
 ) -> list[dict[str, Any]]:
     """Build pre-OpenF1 races from two immutable season-level Jolpica snapshots."""
+    store = RawStore(root / "raw")
     raw_dir = root / "raw" / str(season)
     raw_dir.mkdir(parents=True, exist_ok=True)
     results_payload, results_provenance = _load_or_fetch(
-        raw_dir, "jolpica_season_results", lambda: jolpica_season_full_results(season), refresh
+        raw_dir, "jolpica_season_results", lambda: jolpica_season_full_results(season), refresh, store
     )
     races = results_payload.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+    season_checksums = _snapshot_checksums(raw_dir, ["jolpica_season_results"])
     reports: list[dict[str, Any]] = []
     for race in races:
         round_number = int(race["round"])
         processed_dir = root / "processed" / str(season) / f"round-{round_number:02d}"
         processed_dir.mkdir(parents=True, exist_ok=True)
-        race_drivers, _ = normalize_race_drivers(
-            race, [], None, **results_provenance
-        )
-        completed_laps = completed_laps_for_pit_validation(race_drivers)
+        race_raw_dir = raw_dir / f"round-{round_number:02d}"
         if season >= 2011:
-            race_raw_dir = raw_dir / f"round-{round_number:02d}"
             race_raw_dir.mkdir(parents=True, exist_ok=True)
             pit_wrapper, pits_provenance = _load_or_fetch(
                 race_raw_dir, "jolpica_pits",
                 lambda round_number=round_number: jolpica_pit_stops(season, round_number),
-                refresh,
+                refresh, store,
             )
         else:
             pit_wrapper = {"MRData": {"RaceTable": {"Races": []}}}
             pits_provenance = results_provenance
+        checksums = {
+            **season_checksums,
+            **(_snapshot_checksums(race_raw_dir, ["jolpica_pits"]) if season >= 2011 else {}),
+        }
+        fingerprint = _build_fingerprint(checksums)
+        unchanged = _unchanged_report(processed_dir, fingerprint)
+        if unchanged is not None:
+            reports.append(unchanged)
+            continue
+        race_drivers, _ = normalize_race_drivers(
+            race, [], None, **results_provenance
+        )
+        completed_laps = completed_laps_for_pit_validation(race_drivers)
         pit_events = normalize_jolpica_pit_events(
             pit_wrapper, [], {}, completed_laps, season, round_number, None, **pits_provenance
         )
@@ -92,6 +126,8 @@ def build_historical_season(
                 for issue in duplicate_key_issues(rows, TABLE_KEYS[table])
             )
         issues.extend(issue.__dict__ | {"table": "pit_events"} for issue in pit_stop_issues(pit_events))
+        for table, table_issues in cross_table_issues(race_drivers, [], pit_events).items():
+            issues.extend(issue.__dict__ | {"table": table} for issue in table_issues)
         for name, rows in tables.items():
             if rows:
                 _write_csv(processed_dir / f"{name}.csv", rows)
@@ -106,13 +142,8 @@ def build_historical_season(
             "race_date": race.get("date", ""),
             "session_key": None,
             "table_rows": {name: len(rows) for name, rows in tables.items()},
-            "source_checksums_sha256": {
-                "jolpica_season_results": _sha256(raw_dir / "jolpica_season_results.json"),
-                **({"jolpica_pits": _sha256(
-                    raw_dir / f"round-{round_number:02d}" / "jolpica_pits.json"
-                )}
-                   if season >= 2011 else {}),
-            },
+            "source_checksums_sha256": checksums,
+            "build_fingerprint": fingerprint,
             "issues": issues,
             "status": "quarantined" if any(item["severity"] == "error" for item in issues) else "verified",
         }
@@ -127,7 +158,14 @@ def build_reference_race(
     session_key: int,
     root: Path,
     refresh: bool = False,
+    prefetched: Collection[str] = frozenset(),
 ) -> dict[str, Any]:
+    """Build one OpenF1-era race from its Jolpica and OpenF1 snapshots.
+
+    ``prefetched`` names OpenF1 snapshots that :func:`prefetch_openf1_season`
+    just stored for this race; a refresh does not download them again.
+    """
+    store = RawStore(root / "raw")
     raw_dir = root / "raw" / str(season) / f"round-{round_number:02d}"
     processed_dir = root / "processed" / str(season) / f"round-{round_number:02d}"
     raw_dir.mkdir(parents=True, exist_ok=True)
@@ -140,25 +178,34 @@ def build_reference_race(
         "jolpica_pits": lambda: jolpica_pit_stops(season, round_number),
     }
     optional_loaders = {
-        "openf1_results": lambda: openf1("session_result", session_key=session_key),
-        "openf1_session": lambda: openf1("sessions", session_key=session_key),
-        "openf1_race_control": lambda: openf1("race_control", session_key=session_key),
-        "openf1_stints": lambda: openf1("stints", session_key=session_key),
-        "openf1_pits": lambda: openf1("pit", session_key=session_key),
-        "openf1_weather": lambda: openf1("weather", session_key=session_key),
+        name: lambda endpoint=endpoint: openf1(endpoint, session_key=session_key)
+        for name, endpoint in OPENF1_SNAPSHOTS.items()
     }
+    if not refresh:
+        unchanged = _unchanged_report(processed_dir, _build_fingerprint(
+            _snapshot_checksums(raw_dir, [*required_loaders, *optional_loaders])
+        ))
+        if unchanged is not None:
+            return unchanged
     for name, loader in required_loaders.items():
-        payloads[name], provenance[name] = _load_or_fetch(raw_dir, name, loader, refresh)
+        payloads[name], provenance[name] = _load_or_fetch(raw_dir, name, loader, refresh, store)
     unavailable_sources: list[str] = []
     for name, loader in optional_loaders.items():
         try:
-            payloads[name], provenance[name] = _load_or_fetch(raw_dir, name, loader, refresh)
+            payloads[name], provenance[name] = _load_or_fetch(
+                raw_dir, name, loader, refresh and name not in prefetched, store
+            )
         except HTTPError as error:
             if error.code != 404:
                 raise
             payloads[name] = []
             provenance[name] = provenance["jolpica_results"]
             unavailable_sources.append(name)
+    checksums = _snapshot_checksums(raw_dir, payloads)
+    fingerprint = _build_fingerprint(checksums)
+    unchanged = _unchanged_report(processed_dir, fingerprint)
+    if unchanged is not None:
+        return unchanged
 
     race = jolpica_race(payloads["jolpica_results"])
     identifiers = driver_number_map(race)
@@ -229,6 +276,9 @@ def build_reference_race(
     issue_records.extend(issue.__dict__ | {"table": "pit_events"} for issue in pit_stop_issues(tables["pit_events"]))
     issue_records.extend(issue.__dict__ | {"table": "stints"} for issue in stint_issues(tables["stints"]))
     issue_records.extend(issue.__dict__ | {"table": "weather_observations"} for issue in weather_issues(tables["weather_observations"]))
+    cross_table = cross_table_issues(tables["race_drivers"], tables["stints"], tables["pit_events"])
+    for table, table_issues in cross_table.items():
+        issue_records.extend(issue.__dict__ | {"table": table} for issue in table_issues)
     issue_records.extend({"severity": "warning", "code": "result_position_mismatch", "table": "race_drivers", **item} for item in result_mismatches)
     openf1_pits = normalize_pit_events(
         payloads["openf1_pits"], identifiers, completed_laps, season, round_number,
@@ -249,10 +299,8 @@ def build_reference_race(
         "round_number": round_number,
         "session_key": session_key,
         "table_rows": {name: len(rows) for name, rows in tables.items()},
-        "source_checksums_sha256": {
-            name: _sha256(raw_dir / f"{name}.json")
-            for name in payloads if (raw_dir / f"{name}.json").exists()
-        },
+        "source_checksums_sha256": checksums,
+        "build_fingerprint": fingerprint,
         "issues": issue_records,
         "status": (
             "quarantined" if any(issue["severity"] == "error" for issue in issue_records)
@@ -264,18 +312,150 @@ def build_reference_race(
     return report
 
 
-def _load_or_fetch(raw_dir: Path, name: str, loader: Any, refresh: bool) -> tuple[Any, dict[str, str]]:
-    payload_path = raw_dir / f"{name}.json"
+def prefetch_openf1_season(
+    season: int, sessions: Mapping[int, int], root: Path, refresh: bool = False,
+) -> dict[int, frozenset[str]]:
+    """Store per-race OpenF1 snapshots using one request per endpoint per season.
+
+    ``sessions`` maps round numbers to race session keys. Each endpoint is
+    requested once for the whole range of session keys and its rows are
+    partitioned into the usual per-race snapshots; rows from other sessions
+    in that range, such as practice, are discarded. A race with no rows gets no
+    snapshot, so its build still fetches that endpoint and records a 404 as
+    before. Returns the snapshot names written for each session key.
+    """
+    store = RawStore(root / "raw")
+    raw_dirs = {
+        session_key: root / "raw" / str(season) / f"round-{round_number:02d}"
+        for round_number, session_key in sessions.items()
+    }
+    written: dict[int, set[str]] = defaultdict(set)
+    for name, endpoint in OPENF1_SNAPSHOTS.items():
+        wanted = {
+            session_key for session_key, raw_dir in raw_dirs.items()
+            if refresh or not (raw_dir / f"{name}.provenance.json").exists()
+        }
+        if not wanted:
+            continue
+        try:
+            if endpoint == "sessions":
+                rows, provenance = openf1("sessions", year=season, session_name="Race")
+            else:
+                rows, provenance = openf1_session_range(endpoint, min(wanted), max(wanted))
+        except HTTPError as error:
+            if error.code != 404:
+                raise
+            continue
+        by_session: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            if row.get("session_key") is not None and int(row["session_key"]) in wanted:
+                by_session[int(row["session_key"])].append(row)
+        source = _source_provenance(provenance)
+        for session_key, session_rows in by_session.items():
+            raw_dirs[session_key].mkdir(parents=True, exist_ok=True)
+            _load_or_fetch(raw_dirs[session_key], name, lambda: (session_rows, source), True, store)
+            written[session_key].add(name)
+    return {session_key: frozenset(names) for session_key, names in written.items()}
+
+
+def _snapshot_checksums(raw_dir: Path, names: Iterable[str]) -> dict[str, str]:
+    """Checksums recorded when each snapshot was stored; legacy files are hashed."""
+    checksums: dict[str, str] = {}
+    for name in names:
+        provenance_path = raw_dir / f"{name}.provenance.json"
+        if not provenance_path.exists():
+            continue
+        digest = json.loads(provenance_path.read_text(encoding="utf-8")).get(PAYLOAD_HASH_FIELD)
+        if digest is None and (raw_dir / f"{name}.json").exists():
+            digest = sha256_file(raw_dir / f"{name}.json")
+        if digest is not None:
+            checksums[name] = digest
+    return checksums
+
+
+def _build_fingerprint(checksums: dict[str, str]) -> str:
+    """Identify one race build by its raw inputs, build code, and table schemas."""
+    material = {
+        "source_checksums_sha256": checksums,
+        "code_version": _code_version(),
+        "schema_version": CANONICAL_SCHEMA_VERSION,
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Package version plus a digest of the modules that shape canonical rows."""
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    package = Path(__file__).parent
+    for module in ("normalize.py", "pipeline.py", "validation.py"):
+        digest.update((package / module).read_bytes())
+    return f"{__version__}+{digest.hexdigest()[:16]}"
+
+
+def _unchanged_report(processed_dir: Path, fingerprint: str) -> dict[str, Any] | None:
+    """Return the previous report when its build inputs are identical.
+
+    Races that lost an optional source to a 404 are always rebuilt so newly
+    published OpenF1 data is picked up.
+    """
+    report_path = processed_dir / "validation_report.json"
+    if not report_path.exists():
+        return None
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    if report.get("build_fingerprint") != fingerprint:
+        return None
+    if any(issue.get("code") == "optional_source_unavailable" for issue in report.get("issues", [])):
+        return None
+    if any(rows and not (processed_dir / f"{name}.csv").exists()
+           for name, rows in report.get("table_rows", {}).items()):
+        return None
+    return report
+
+
+def _load_or_fetch(
+    raw_dir: Path, name: str, loader: Any, refresh: bool, store: RawStore | None = None,
+) -> tuple[Any, dict[str, str]]:
+    """Return a cached snapshot or fetch and store a new one.
+
+    The payload lives in ``store``; ``<name>.provenance.json`` records where it
+    came from, its content hash, and any HTTP validators. A refresh sends those
+    validators, and a 304 keeps the stored snapshot untouched. Snapshots
+    written before the store existed (a pretty-printed ``<name>.json``) remain
+    readable.
+    """
+    store = store or RawStore(raw_dir)
+    legacy_path = raw_dir / f"{name}.json"
     provenance_path = raw_dir / f"{name}.provenance.json"
-    if not refresh and payload_path.exists() and provenance_path.exists():
-        return (
-            json.loads(payload_path.read_text(encoding="utf-8")),
-            json.loads(provenance_path.read_text(encoding="utf-8")),
-        )
-    payload, provenance = loader()
-    _write_json(payload_path, payload)
-    _write_json(provenance_path, provenance)
-    return payload, provenance
+    stored = json.loads(provenance_path.read_text(encoding="utf-8")) if provenance_path.exists() else None
+    if stored is not None and stored.get(PAYLOAD_HASH_FIELD) is None and not legacy_path.exists():
+        stored = None
+    if stored is not None and not refresh:
+        return _stored_payload(store, legacy_path, stored), _source_provenance(stored)
+    try:
+        with conditional(stored):
+            payload, provenance = loader()
+    except NotModified:
+        return _stored_payload(store, legacy_path, stored), _source_provenance(stored)
+    digest = store.put(payload)
+    _write_json(provenance_path, {**provenance, PAYLOAD_HASH_FIELD: digest})
+    legacy_path.unlink(missing_ok=True)
+    return payload, _source_provenance(provenance)
+
+
+def _stored_payload(store: RawStore, legacy_path: Path, provenance: dict[str, Any]) -> Any:
+    digest = provenance.get(PAYLOAD_HASH_FIELD)
+    if digest is not None:
+        return store.get(digest)
+    return json.loads(legacy_path.read_text(encoding="utf-8"))
+
+
+def _source_provenance(provenance: dict[str, Any]) -> dict[str, str]:
+    """Keep only the fields canonical rows carry: source URL and retrieval time."""
+    return {
+        key: value for key, value in provenance.items()
+        if key != PAYLOAD_HASH_FIELD and key not in VALIDATOR_HEADERS
+    }
 
 
 def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
@@ -291,10 +471,6 @@ def _write_json(path: Path, payload: Any) -> None:
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
 
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def _pit_count_mismatches(jolpica_payload: dict[str, Any], openf1_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     races = jolpica_payload.get("MRData", {}).get("RaceTable", {}).get("Races", [])
     jolpica_rows = races[0].get("PitStops", []) if races else []
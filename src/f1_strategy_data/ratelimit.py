@@ -0,0 +1,145 @@
+"""Per-host request budgets shared by threads, tasks, and worker processes.
+
+Limiters hand out *reservations*: ``reserve(host)`` books the next request
+for a host and returns how many seconds the caller must wait before sending
+it. Callers sleep outside any lock, so synchronous threads and event-loop
+tasks can share one limiter without blocking each other.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Protocol
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+@dataclass(frozen=True)
+class HostBudget:
+    """Sustained request rate for one host plus the burst it tolerates."""
+
+    rate_per_second: float
+    burst: int = 1
+
+    @classmethod
+    def from_interval(cls, seconds: float, burst: int = 1) -> HostBudget:
+        return cls(1 / seconds if seconds > 0 else float("inf"), burst)
+
+
+class RateLimiter(Protocol):
+    def reserve(self, host: str) -> float:
+        """Book one request for ``host`` and return the required wait in seconds."""
+
+
+class TokenBucketLimiter:
+    """Thread-safe in-process token buckets, one per host.
+
+    A bucket holds at most ``burst`` tokens and refills at the host's rate.
+    Reservations may drive a bucket negative; the deficit is the queue of
+    callers already waiting, which keeps waits fair under contention.
+    """
+
+    def __init__(
+        self,
+        budgets: Mapping[str, HostBudget],
+        default: HostBudget,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.budgets = dict(budgets)
+        self.default = default
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, host: str) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, delay = _take(self.budgets.get(host, self.default), self._buckets.get(host), now)
+            self._buckets[host] = (tokens, now)
+        return delay
+
+
+class FileRateLimiter:
+    """Token buckets persisted in a locked JSON file shared between processes.
+
+    Every reservation takes an exclusive OS file lock, refills the host's
+    bucket from wall-clock time, books one token, and writes the state back,
+    so independent build processes on one machine share a single budget.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        budgets: Mapping[str, HostBudget],
+        default: HostBudget,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.budgets = dict(budgets)
+        self.default = default
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str) -> float:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self.path.open("a+", encoding="utf-8") as handle, _exclusive(handle):
+            handle.seek(0)
+            text = handle.read()
+            state: dict[str, list[float]] = json.loads(text) if text.strip() else {}
+            now = self._clock()
+            previous = state.get(host)
+            tokens, delay = _take(
+                self.budgets.get(host, self.default),
+                (previous[0], previous[1]) if previous else None,
+                now,
+            )
+            state[host] = [tokens, now]
+            handle.seek(0)
+            handle.truncate()
+            handle.write(json.dumps(state, sort_keys=True))
+            handle.flush()
+            os.fsync(handle.fileno())
+        return delay
+
+
+def _take(budget: HostBudget, bucket: tuple[float, float] | None, now: float) -> tuple[float, float]:
+    """Refill a bucket to ``now``, book one token, and return (tokens, wait)."""
+    if math.isinf(budget.rate_per_second):
+        return float(budget.burst), 0.0
+    if bucket is None:
+        tokens = float(budget.burst)
+    else:
+        tokens, updated = bucket
+        tokens = min(float(budget.burst), tokens + max(now - updated, 0.0) * budget.rate_per_second)
+    tokens -= 1
+    return tokens, (-tokens / budget.rate_per_second if tokens < 0 else 0.0)
+
+
+@contextmanager
+def _exclusive(handle: IO[str]) -> Iterator[None]:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return
+    handle.seek(0)  # pragma: no cover - Windows
+    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+    try:
+        yield
+    finally:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,61 @@
+"""Compressed, content-addressed storage for raw source payloads.
+
+Each payload is serialized once as compact JSON, hashed, and gzip-compressed
+into ``objects/<first two hex digits>/<sha256>.json.gz``. Identical payloads
+from different refreshes or races share one object, and the hash recorded in
+a snapshot's provenance sidecar is the checksum of its canonical bytes, so it
+never has to be recomputed by re-reading the file.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+class RawStore:
+    """Immutable gzip objects under ``root / "objects"`` keyed by SHA-256."""
+
+    def __init__(self, root: Path, compresslevel: int = 6) -> None:
+        self.root = root
+        self.compresslevel = compresslevel
+
+    def put(self, payload: Any) -> str:
+        """Store ``payload`` unless an identical one exists and return its hash."""
+        data = canonical_bytes(payload)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent builds may store the same object; a unique staging file
+        # and an atomic replace keep every reader on a complete object.
+        handle, staging = tempfile.mkstemp(dir=path.parent, prefix=f".{digest}.", suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self.compresslevel, mtime=0) as compressed:
+                    compressed.write(data)
+            os.replace(staging, path)
+        except BaseException:
+            Path(staging).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> Any:
+        with gzip.open(self.path(digest), "rb") as handle:
+            return json.loads(handle.read())
+
+    def path(self, digest: str) -> Path:
+        if len(digest) != 64 or any(char not in "0123456789abcdef" for char in digest):
+            raise ValueError(f"Invalid object hash: {digest!r}")
+        return self.root / "objects" / digest[:2] / f"{digest}.json.gz"
+
+
+def canonical_bytes(payload: Any) -> bytes:
+    """Compact UTF-8 JSON whose SHA-256 identifies a stored payload."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,234 @@
+"""Offline replay of source APIs for tests and throughput benchmarks.
+
+A :class:`Cassette` maps canonical source URLs to recorded responses. It can
+be loaded from a JSON cassette file or assembled from an existing ``raw/``
+snapshot tree. :class:`ReplayServer` serves a cassette over local HTTP with
+optional latency and injected 429/5xx failures, and :func:`replaying` points
+the synchronous source clients at it. Provenance keeps the canonical URLs,
+so builds against a replay produce the same snapshots as live builds.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from . import sources
+from .pipeline import PAYLOAD_HASH_FIELD
+from .rawstore import RawStore
+
+
+CASSETTE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """One recorded response for a canonical source URL."""
+
+    url: str
+    status: int
+    body: Any
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+class Cassette:
+    """Recorded responses keyed by canonical source URL."""
+
+    def __init__(self, interactions: Mapping[str, Interaction] | None = None) -> None:
+        self.interactions = dict(interactions or {})
+
+    def add(self, url: str, body: Any, status: int = 200, headers: Mapping[str, str] | None = None) -> None:
+        self.interactions[url] = Interaction(url, status, body, dict(headers or {}))
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        document = json.loads(path.read_text(encoding="utf-8"))
+        if document.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {document.get('version')!r}")
+        cassette = cls()
+        for item in document["interactions"]:
+            cassette.add(item["url"], item["body"], item.get("status", 200), item.get("headers"))
+        return cassette
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "version": CASSETTE_VERSION,
+            "interactions": [
+                {"url": item.url, "status": item.status, "headers": dict(item.headers), "body": item.body}
+                for item in sorted(self.interactions.values(), key=lambda item: item.url)
+            ],
+        }
+        path.write_text(json.dumps(document, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    @classmethod
+    def from_raw(cls, root: Path) -> Cassette:
+        """Rebuild source responses from the snapshots under ``root / "raw"``.
+
+        Snapshots sharing a source URL, such as season-batched OpenF1 rows,
+        are concatenated back into one response. Season discovery requests
+        are never snapshotted, so they are reconstructed from the per-race
+        Jolpica results and OpenF1 session snapshots.
+        """
+        raw = root / "raw"
+        store = RawStore(raw)
+        bodies: dict[str, Any] = {}
+        validators: dict[str, dict[str, str]] = {}
+        races: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        sessions: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for sidecar in sorted(raw.glob("**/*.provenance.json")):
+            name = sidecar.name.removesuffix(".provenance.json")
+            provenance = json.loads(sidecar.read_text(encoding="utf-8"))
+            digest = provenance.get(PAYLOAD_HASH_FIELD)
+            legacy = sidecar.with_name(f"{name}.json")
+            if digest is None and not legacy.exists():
+                continue
+            payload = store.get(digest) if digest is not None else json.loads(legacy.read_text(encoding="utf-8"))
+            url = provenance["source_url"]
+            if url in bodies and isinstance(bodies[url], list) and isinstance(payload, list):
+                bodies[url] = bodies[url] + payload
+            else:
+                bodies.setdefault(url, payload)
+            validators.setdefault(url, {
+                header: provenance[key] for key, (header, _) in sources.VALIDATOR_HEADERS.items() if provenance.get(key)
+            })
+            if name == "jolpica_results":
+                for race in payload.get("MRData", {}).get("RaceTable", {}).get("Races", []):
+                    races[int(race["season"])].append({**race, "Results": race.get("Results", [])[:1]})
+            elif name == "openf1_session":
+                for session in payload:
+                    sessions[int(session["year"])].append(session)
+        cassette = cls()
+        for url, body in bodies.items():
+            cassette.add(url, body, headers=validators.get(url))
+        for season, season_races in races.items():
+            url = sources._jolpica_season_results_url(season)
+            if url not in cassette.interactions:
+                ordered = sorted(season_races, key=lambda race: int(race["round"]))
+                cassette.add(url, {"MRData": {
+                    "limit": "100", "offset": "0", "total": str(len(ordered)),
+                    "RaceTable": {"season": str(season), "Races": ordered},
+                }})
+        for season, season_sessions in sessions.items():
+            url = sources._openf1_url("sessions", year=season, session_name="Race")
+            if url not in cassette.interactions:
+                cassette.add(url, sorted(season_sessions, key=lambda row: row["session_key"]))
+        return cassette
+
+
+@dataclass
+class FaultPlan:
+    """Latency and failure injection applied to every replayed request.
+
+    ``rate_limited`` and ``server_errors`` are probabilities drawn from a
+    seeded generator, so a benchmark run is reproducible.
+    """
+
+    latency_seconds: float = 0.0
+    rate_limited: float = 0.0
+    server_errors: float = 0.0
+    retry_after: str | None = "0"
+    seed: int = 0
+
+
+class ReplayServer:
+    """Serve a cassette on localhost for every canonical source origin."""
+
+    def __init__(self, cassette: Cassette, faults: FaultPlan | None = None) -> None:
+        self.cassette = cassette
+        self.faults = faults or FaultPlan()
+        self.counts: dict[int, int] = defaultdict(int)
+        self._responses = {_path(url): item for url, item in cassette.interactions.items()}
+        self._random = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def origin(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def origins(self) -> dict[str, str]:
+        """Canonical origin -> this server, for :func:`replaying` or ``AsyncSourceClient``."""
+        canonical = {
+            f"{parts.scheme}://{parts.netloc}"
+            for parts in (urlsplit(url) for url in (sources.JOLPICA_BASE_URL, sources.OPENF1_BASE_URL))
+        }
+        canonical.update(f"{parts.scheme}://{parts.netloc}" for parts in map(urlsplit, self.cassette.interactions))
+        return {origin: self.origin for origin in sorted(canonical)}
+
+    def __enter__(self) -> ReplayServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, path: str, if_none_match: str | None = None) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            roll = self._random.random()
+        if self.faults.latency_seconds > 0:
+            time.sleep(self.faults.latency_seconds)
+        if roll < self.faults.rate_limited:
+            status, headers, body = 429, {"Retry-After": self.faults.retry_after} if self.faults.retry_after else {}, {}
+        elif roll < self.faults.rate_limited + self.faults.server_errors:
+            status, headers, body = 503, {}, {}
+        elif path not in self._responses:
+            status, headers, body = 404, {}, {"detail": "No results found."}
+        else:
+            item = self._responses[path]
+            status, headers, body = item.status, dict(item.headers), item.body
+            if if_none_match is not None and item.headers.get("ETag") == if_none_match:
+                status, body = 304, None
+        with self._lock:
+            self.counts[status] += 1
+        return status, headers, b"" if status == 304 else json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+@contextmanager
+def replaying(server: ReplayServer) -> Iterator[ReplayServer]:
+    """Route the synchronous source clients to ``server`` for the duration."""
+    previous = sources.set_origins(server.origins)
+    try:
+        yield server
+    finally:
+        sources.set_origins(previous)
+
+
+def _handler(server: ReplayServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            status, headers, body = server.respond(self.path, self.headers.get("If-None-Match"))
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def _path(url: str) -> str:
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
@@ -0,0 +1,97 @@
+"""In-process memo of source responses with single-flight fetching.
+
+Within one build the same source URL is often requested more than once, for
+example a season's OpenF1 race sessions during discovery and again during a
+prefetch. :class:`ResponseCache` keeps recent response bodies in a
+size-bounded LRU and lets concurrent callers asking for the same URL share one
+in-flight request instead of racing each other to the network.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+
+Response = tuple[bytes, dict[str, str]]
+
+
+class ResponseCache:
+    """Byte-bounded LRU of ``(body, provenance)`` keyed by normalized URL."""
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self._entries: OrderedDict[str, Response] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[str, Future[Response]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get_or_fetch(self, url: str, fetch: Callable[[], Response]) -> tuple[Response, bool]:
+        """Return ``(response, from_cache)``, calling ``fetch`` at most once per URL.
+
+        Callers that arrive while the same URL is being fetched wait for that
+        result, or receive its exception. Failures are never cached.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, True
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                owner = True
+            else:
+                self.hits += 1
+                owner = False
+        if not owner:
+            return pending.result(), True
+        try:
+            response = fetch()
+        except BaseException as error:
+            with self._lock:
+                del self._inflight[key]
+            pending.set_exception(error)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._store(key, response)
+        pending.set_result(response)
+        return response, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _store(self, key: str, response: Response) -> None:
+        size = len(response[0])
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        self._entries[key] = response
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted[0])
+
+
+def normalize_url(url: str) -> str:
+    """Case-fold the origin and sort query parameters so equivalent URLs match."""
+    parts = urlsplit(url)
+    query = "&".join(sorted(parameter for parameter in parts.query.split("&") if parameter))
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path}" + (f"?{query}" if query else "")
@@ -8,63 +8,250 @@ from __future__ import annotations
 
 import json
 import socket
+import threading
 import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlencode, urlparse
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+from .ratelimit import HostBudget, RateLimiter, TokenBucketLimiter
+from .responsecache import ResponseCache
+
 
 USER_AGENT = "f1-strategy-weather-data/0.1 (+https://github.com/akashrane/F1-Pitstop-and-Driver-Position-Strategy)"
-_LAST_REQUEST_AT: dict[str, float] = {}
 _MIN_INTERVAL_SECONDS = {"api.openf1.org": 2.1, "api.jolpi.ca": 0.5}
+_BURST_REQUESTS = {"api.jolpi.ca": 4}
+_DEFAULT_INTERVAL_SECONDS = 0.25
+# Concurrent page requests per paginated fetch; the rate limiter still spaces them.
+_PAGE_WORKERS = 4
+JOLPICA_BASE_URL = "https://api.jolpi.ca/ergast/f1"
+OPENF1_BASE_URL = "https://api.openf1.org/v1"
+OPENF1_ENDPOINTS = frozenset({
+    "weather", "stints", "pit", "laps", "sessions", "meetings", "drivers",
+    "starting_grid", "session_result", "race_control",
+})
+
+
+# Provenance fields holding HTTP cache validators, and the conditional request
+# header each one is sent back in.
+VALIDATOR_HEADERS = {"etag": ("ETag", "If-None-Match"), "last_modified": ("Last-Modified", "If-Modified-Since")}
+
+
+class NotModified(Exception):
+    """The source answered 304: the caller's stored snapshot is still current."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"Not modified: {url}")
+        self.url = url
 
 
+@dataclass
+class RequestStats:
+    """Cumulative time one host spent waiting on the rate limiter and network."""
+
+    requests: int = 0
+    throttled_seconds: float = 0.0
+    network_seconds: float = 0.0
+    cache_hits: int = 0
+
+
+def default_rate_limiter() -> TokenBucketLimiter:
+    return TokenBucketLimiter(
+        {
+            host: HostBudget.from_interval(interval, _BURST_REQUESTS.get(host, 1))
+            for host, interval in _MIN_INTERVAL_SECONDS.items()
+        },
+        HostBudget.from_interval(_DEFAULT_INTERVAL_SECONDS),
+    )
+
+
+_RATE_LIMITER: RateLimiter = default_rate_limiter()
+_STATS: dict[str, RequestStats] = {}
+_STATS_LOCK = threading.Lock()
+_VALIDATORS: ContextVar[Mapping[str, str]] = ContextVar("validators", default={})
+_ORIGINS: dict[str, str] = {}
+_RESPONSE_CACHE: ResponseCache | None = None
+DEFAULT_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+@contextmanager
+def conditional(validators: Mapping[str, str] | None) -> Iterator[None]:
+    """Send stored validators with requests made in this context.
+
+    ``validators`` is a provenance mapping; its ``etag`` and ``last_modified``
+    fields become ``If-None-Match`` and ``If-Modified-Since``. A source that
+    answers 304 raises :class:`NotModified` instead of returning a payload.
+    """
+    token = _VALIDATORS.set({
+        field: str(validators[field]) for field in VALIDATOR_HEADERS if validators and validators.get(field)
+    })
+    try:
+        yield
+    finally:
+        _VALIDATORS.reset(token)
+
+
+def _conditional_headers() -> dict[str, str]:
+    return {VALIDATOR_HEADERS[field][1]: value for field, value in _VALIDATORS.get().items()}
+
+
+def set_rate_limiter(limiter: RateLimiter) -> RateLimiter:
+    """Install the limiter used by every source client and return the previous one.
+
+    Use a :class:`~f1_strategy_data.ratelimit.FileRateLimiter` when several
+    build processes must share one per-host budget.
+    """
+    global _RATE_LIMITER
+    previous, _RATE_LIMITER = _RATE_LIMITER, limiter
+    return previous
+
+
+def set_origins(origins: Mapping[str, str]) -> dict[str, str]:
+    """Send requests for canonical origins elsewhere and return the previous map.
+
+    Keys are canonical origins such as ``"https://api.openf1.org"``. Provenance
+    and rate limits still use the canonical URL; only the connection target
+    changes, which lets :mod:`replay` stand in for the live APIs.
+    """
+    global _ORIGINS
+    previous = _ORIGINS
+    _ORIGINS = {key.rstrip("/"): value.rstrip("/") for key, value in origins.items()}
+    return previous
+
+
+@contextmanager
+def response_cache(max_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES) -> Iterator[ResponseCache]:
+    """Memoize unconditional source responses for the duration of one run.
+
+    Identical URLs are fetched once, and concurrent callers share the
+    in-flight request. Conditional refresh requests always reach the source.
+    """
+    global _RESPONSE_CACHE
+    previous, _RESPONSE_CACHE = _RESPONSE_CACHE, ResponseCache(max_bytes)
+    try:
+        yield _RESPONSE_CACHE
+    finally:
+        _RESPONSE_CACHE = previous
+
+
+def _rewrite(url: str) -> str:
+    for canonical, replacement in _ORIGINS.items():
+        if url.startswith(canonical + "/"):
+            return replacement + url[len(canonical):]
+    return url
+
+
+def request_stats() -> dict[str, RequestStats]:
+    """Return a snapshot of per-host throttle and network time for this process."""
+    with _STATS_LOCK:
+        return {host: replace(stats) for host, stats in _STATS.items()}
+
+
+def reset_request_stats() -> None:
+    with _STATS_LOCK:
+        _STATS.clear()
+
+
+def _record(url: str, throttled: float = 0.0, network: float = 0.0, cache_hit: bool = False) -> None:
+    host = urlparse(url).hostname or ""
+    with _STATS_LOCK:
+        stats = _STATS.setdefault(host, RequestStats())
+        stats.throttled_seconds += throttled
+        stats.cache_hits += cache_hit
+        if network:
+            stats.requests += 1
+            stats.network_seconds += network
+
+
 def _get_json(url: str, timeout: int = 60, attempts: int = 8) -> tuple[Any, dict[str, str]]:
+    cache = _RESPONSE_CACHE
+    if cache is None or _VALIDATORS.get():
+        body, provenance = _fetch(url, timeout, attempts)
+    else:
+        (body, provenance), cached = cache.get_or_fetch(url, lambda: _fetch(url, timeout, attempts))
+        if cached:
+            _record(url, cache_hit=True)
+    return json.loads(body), dict(provenance)
+
+
+def _fetch(url: str, timeout: int, attempts: int) -> tuple[bytes, dict[str, str]]:
     for attempt in range(attempts):
         _throttle(url)
-        request = Request(url, headers={"User-Agent": USER_AGENT})
+        request = Request(_rewrite(url), headers={"User-Agent": USER_AGENT, **_conditional_headers()})
+        started = time.monotonic()
         try:
             with urlopen(request, timeout=timeout) as response:
-                payload = json.load(response)
+                body = response.read()
+                headers = response.headers
             break
         except HTTPError as error:
-            retryable = error.code == 429 or 500 <= error.code < 600
-            if not retryable or attempt == attempts - 1:
+            _record(url, network=time.monotonic() - started)
+            if error.code == 304:
+                raise NotModified(url) from None
+            if not _is_retryable(error.code) or attempt == attempts - 1:
                 raise
-            retry_after = error.headers.get("Retry-After")
-            try:
-                delay = float(retry_after) if retry_after else min(2 ** attempt, 60)
-            except ValueError:
-                delay = min(2 ** attempt, 60)
-            time.sleep(delay)
+            _backoff(url, _retry_delay(attempt, error.headers.get("Retry-After")))
         except (URLError, TimeoutError, socket.timeout):
+            _record(url, network=time.monotonic() - started)
             if attempt == attempts - 1:
                 raise
-            time.sleep(min(2 ** attempt, 60))
-    provenance = {
+            _backoff(url, _retry_delay(attempt))
+    _record(url, network=time.monotonic() - started)
+    return body, _provenance(url, headers)
+
+
+def _backoff(url: str, delay: float) -> None:
+    time.sleep(delay)
+    _record(url, throttled=delay)
+
+
+def _is_retryable(status: int) -> bool:
+    return status == 429 or 500 <= status < 600
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Honour a numeric Retry-After header, otherwise back off exponentially."""
+    try:
+        return float(retry_after) if retry_after else min(2 ** attempt, 60)
+    except ValueError:
+        return min(2 ** attempt, 60)
+
+
+def _provenance(url: str, headers: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Source URL and retrieval time, plus any cache validators the response sent."""
+    provenance = {
         "source_url": url,
         "retrieved_at_utc": datetime.now(UTC).isoformat(),
     }
-    return payload, provenance
+    for field, (header, _) in VALIDATOR_HEADERS.items():
+        if headers is not None and headers.get(header):
+            provenance[field] = headers[header]
+    return provenance
 
 
 def _throttle(url: str) -> None:
     """Stay below known free-tier request rates before a server returns 429."""
-    host = urlparse(url).hostname or ""
-    interval = _MIN_INTERVAL_SECONDS.get(host, 0.25)
-    now = time.monotonic()
-    wait = interval - (now - _LAST_REQUEST_AT.get(host, 0.0))
-    if wait > 0:
-        time.sleep(wait)
-    _LAST_REQUEST_AT[host] = time.monotonic()
+    delay = _reserve_slot(url)
+    if delay > 0:
+        time.sleep(delay)
+        _record(url, throttled=delay)
+
+
+def _reserve_slot(url: str) -> float:
+    """Book the next request for a URL's host and return the wait in seconds."""
+    return _RATE_LIMITER.reserve(urlparse(url).hostname or "")
 
 
 def jolpica_results(season: int, round_number: int) -> tuple[dict[str, Any], dict[str, str]]:
     """Fetch race classification data from the maintained Ergast successor."""
-    url = f"https://api.jolpi.ca/ergast/f1/{season}/{round_number}/results.json?limit=100"
-    return _get_json(url)
+    return _get_json(_jolpica_results_url(season, round_number))
 
 
 def jolpica_pit_stops(season: int, round_number: int) -> tuple[dict[str, Any], dict[str, str]]:
@@ -73,20 +260,19 @@ def jolpica_pit_stops(season: int, round_number: int) -> tuple[dict[str, Any], d
     An empty response means unavailable/unknown unless independently verified;
     it must never be converted automatically to zero stops.
     """
-    url = f"https://api.jolpi.ca/ergast/f1/{season}/{round_number}/pitstops.json?limit=2000"
-    return _get_json(url)
+    return _get_json(_jolpica_pit_stops_url(season, round_number))
 
 
 def openf1(endpoint: str, **filters: object) -> tuple[list[dict[str, Any]], dict[str, str]]:
     """Fetch session-timestamped OpenF1 data such as weather, stints, or pits."""
-    allowed = {"weather", "stints", "pit", "laps", "sessions", "meetings", "drivers", "starting_grid", "session_result", "race_control"}
-    if endpoint not in allowed:
-        raise ValueError(f"Unsupported OpenF1 endpoint: {endpoint}")
-    query = urlencode({key: value for key, value in filters.items() if value is not None})
-    url = f"https://api.openf1.org/v1/{endpoint}"
-    if query:
-        url = f"{url}?{query}"
-    return _get_json(url)
+    return _get_json(_openf1_url(endpoint, **filters))
+
+
+def openf1_session_range(
+    endpoint: str, first_session_key: int, last_session_key: int,
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    """Fetch an endpoint's rows for every session key in an inclusive range."""
+    return _get_json(_openf1_range_url(endpoint, first_session_key, last_session_key))
 
 
 def jolpica_season_results(season: int) -> tuple[dict[str, Any], dict[str, str]]:
@@ -97,44 +283,133 @@ def jolpica_season_results(season: int) -> tuple[dict[str, Any], dict[str, str]]
     gives us exactly one row per completed Grand Prix; the per-round builder
     subsequently fetches the complete classification.
     """
-    url = f"https://api.jolpi.ca/ergast/f1/{season}/results/1.json?limit=100"
-    return _get_json(url)
+    return _get_json(_jolpica_season_results_url(season))
 
 
 def jolpica_season_full_results(season: int) -> tuple[dict[str, Any], dict[str, str]]:
     """Fetch every classified driver result in a season for historical backfill."""
-    base = f"https://api.jolpi.ca/ergast/f1/{season}/results.json"
-    return _get_paginated_races(base, "Results")
+    return _get_paginated_races(_jolpica_season_full_results_url(season), "Results")
 
 
 def _get_paginated_races(base_url: str, row_key: str) -> tuple[dict[str, Any], dict[str, str]]:
-    """Collect Jolpica pages while preserving its race-grouped response shape."""
-    offset = 0
+    """Collect Jolpica pages while preserving its race-grouped response shape.
+
+    The first page reveals the total and the page size, so the remaining pages
+    are requested concurrently; each request still waits for the host's rate
+    budget. Pages are merged in offset order. A page shorter than expected
+    shifts every later offset, so the remainder is then walked sequentially.
+
+    Page validators cannot vouch for the combined payload, so pages are always
+    fetched unconditionally and the result carries none.
+    """
     races_by_round: dict[int, dict[str, Any]] = {}
-    provenance: dict[str, str] | None = None
-    total = 0
-    while offset == 0 or offset < total:
-        payload, page_provenance = _get_json(f"{base_url}?limit=100&offset={offset}")
-        provenance = provenance or page_provenance
-        mrdata = payload.get("MRData", {})
-        total = int(mrdata.get("total", 0))
-        page_races = mrdata.get("RaceTable", {}).get("Races", [])
-        page_count = 0
-        for race in page_races:
-            round_number = int(race["round"])
-            incoming = list(race.get(row_key, []))
-            page_count += len(incoming)
-            if round_number not in races_by_round:
-                races_by_round[round_number] = {**race, row_key: incoming}
-            else:
-                races_by_round[round_number][row_key].extend(incoming)
-        if page_count == 0:
-            break
+    payload, provenance = _get_page(base_url, 0)
+    total, offset = _merge_race_page(races_by_round, payload, row_key)
+    exhausted = offset == 0
+    offsets = [] if exhausted else _page_offsets(offset, total)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(offsets))) as executor:
+            pages = [page for page, _ in executor.map(lambda item: _get_page(base_url, item), offsets)]
+        offset, total, exhausted = _merge_pages(races_by_round, pages, row_key, offset, total)
+    while not exhausted and offset < total:
+        payload, _ = _get_page(base_url, offset)
+        total, page_count = _merge_race_page(races_by_round, payload, row_key)
+        exhausted = page_count == 0
+        offset += page_count
+    return _combined_races(races_by_round, offset, total), provenance
+
+
+def _get_page(base_url: str, offset: int) -> tuple[dict[str, Any], dict[str, str]]:
+    with conditional(None):
+        payload, provenance = _get_json(_page_url(base_url, offset))
+    return payload, _without_validators(provenance)
+
+
+def _page_offsets(page_size: int, total: int) -> list[int]:
+    """Offsets of the pages after the first, assuming every page is full."""
+    return list(range(page_size, total, page_size))
+
+
+def _merge_pages(
+    races_by_round: dict[int, dict[str, Any]],
+    pages: list[dict[str, Any]],
+    row_key: str,
+    offset: int,
+    total: int,
+) -> tuple[int, int, bool]:
+    """Merge concurrently fetched pages in order; return (offset, total, exhausted).
+
+    Merging stops after the first short page because the pages after it were
+    requested at offsets that no longer line up.
+    """
+    page_size = offset
+    for payload in pages:
+        total, page_count = _merge_race_page(races_by_round, payload, row_key)
         offset += page_count
-    combined = {
+        if page_count < min(page_size, total - offset + page_count):
+            return offset, total, page_count == 0
+    return offset, total, False
+
+
+def _without_validators(provenance: dict[str, str]) -> dict[str, str]:
+    return {key: value for key, value in provenance.items() if key not in VALIDATOR_HEADERS}
+
+
+def _page_url(base_url: str, offset: int) -> str:
+    return f"{base_url}?limit=100&offset={offset}"
+
+
+def _merge_race_page(
+    races_by_round: dict[int, dict[str, Any]], payload: dict[str, Any], row_key: str,
+) -> tuple[int, int]:
+    """Fold one page into ``races_by_round``; return the total and page row count."""
+    mrdata = payload.get("MRData", {})
+    page_count = 0
+    for race in mrdata.get("RaceTable", {}).get("Races", []):
+        round_number = int(race["round"])
+        incoming = list(race.get(row_key, []))
+        page_count += len(incoming)
+        if round_number not in races_by_round:
+            races_by_round[round_number] = {**race, row_key: incoming}
+        else:
+            races_by_round[round_number][row_key].extend(incoming)
+    return int(mrdata.get("total", 0)), page_count
+
+
+def _combined_races(races_by_round: dict[int, dict[str, Any]], limit: int, total: int) -> dict[str, Any]:
+    return {
         "MRData": {
-            "limit": str(offset), "offset": "0", "total": str(total),
+            "limit": str(limit), "offset": "0", "total": str(total),
             "RaceTable": {"Races": [races_by_round[key] for key in sorted(races_by_round)]},
         }
     }
-    return combined, provenance or {"source_url": base_url, "retrieved_at_utc": datetime.now(UTC).isoformat()}
+
+
+def _jolpica_results_url(season: int, round_number: int) -> str:
+    return f"{JOLPICA_BASE_URL}/{season}/{round_number}/results.json?limit=100"
+
+
+def _jolpica_pit_stops_url(season: int, round_number: int) -> str:
+    return f"{JOLPICA_BASE_URL}/{season}/{round_number}/pitstops.json?limit=2000"
+
+
+def _jolpica_season_results_url(season: int) -> str:
+    return f"{JOLPICA_BASE_URL}/{season}/results/1.json?limit=100"
+
+
+def _jolpica_season_full_results_url(season: int) -> str:
+    return f"{JOLPICA_BASE_URL}/{season}/results.json"
+
+
+def _openf1_url(endpoint: str, **filters: object) -> str:
+    if endpoint not in OPENF1_ENDPOINTS:
+        raise ValueError(f"Unsupported OpenF1 endpoint: {endpoint}")
+    query = urlencode({key: value for key, value in filters.items() if value is not None})
+    url = f"{OPENF1_BASE_URL}/{endpoint}"
+    return f"{url}?{query}" if query else url
+
+
+def _openf1_range_url(endpoint: str, first_session_key: int, last_session_key: int) -> str:
+    # OpenF1 reads comparison operators from the literal query string, so the
+    # filter is written out rather than passed through urlencode.
+    return f"{_openf1_url(endpoint)}?session_key>={int(first_session_key)}&session_key<={int(last_session_key)}"
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Mapping
+
+
+DRIVER_KEY = ("season", "round_number", "driver_id")
 
 
 @dataclass(frozen=True)
@@ -80,6 +84,64 @@ def stint_issues(rows: Iterable[Mapping[str, object]]) -> list[ValidationIssue]:
     return issues
 
 
+def cross_table_issues(
+    race_drivers: Iterable[Mapping[str, object]],
+    stints: Iterable[Mapping[str, object]],
+    pit_events: Iterable[Mapping[str, object]],
+) -> dict[str, list[ValidationIssue]]:
+    """Check driver references and pit-lap coverage between race tables.
+
+    Drivers and merged stint spans are indexed by :data:`DRIVER_KEY`, so each
+    table is read once. That works for a single race or for consolidated tables
+    spanning every season. Pit laps are only checked for drivers with stints.
+    Issues are keyed by the table whose row is at fault.
+    """
+    drivers = {_driver_key(row) for row in race_drivers}
+    issues: dict[str, list[ValidationIssue]] = {"stints": [], "pit_events": []}
+    spans: dict[tuple[str, ...], list[tuple[int, int]]] = {}
+    for index, row in enumerate(stints, start=2):
+        key = _driver_key(row)
+        if key not in drivers:
+            issues["stints"].append(ValidationIssue("error", "unknown_driver", f"Driver {key!r} is not in race_drivers", index))
+        start = _integer(row.get("lap_start"))
+        end = _integer(row.get("lap_end"))
+        if start is not None and end is not None and start <= end:
+            spans.setdefault(key, []).append((start, end))
+    coverage = {key: _merged_spans(driver_spans) for key, driver_spans in spans.items()}
+    for index, row in enumerate(pit_events, start=2):
+        key = _driver_key(row)
+        if key not in drivers:
+            issues["pit_events"].append(ValidationIssue("error", "unknown_driver", f"Driver {key!r} is not in race_drivers", index))
+        lap = _integer(row.get("lap_number"))
+        if lap is not None and key in coverage and not _covers(coverage[key], lap):
+            issues["pit_events"].append(ValidationIssue("warning", "pit_lap_without_stint", f"No stint for {key!r} covers pit lap {lap}", index))
+    return issues
+
+
+def _driver_key(row: Mapping[str, object]) -> tuple[str, ...]:
+    # Compare as text so CSV rows and in-memory rows index identically.
+    return tuple(str(row.get(field, "")) for field in DRIVER_KEY)
+
+
+def _merged_spans(spans: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Sorted, disjoint ``(starts, ends)`` covering the same laps as ``spans``."""
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in sorted(spans):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _covers(coverage: tuple[list[int], list[int]], lap: int) -> bool:
+    starts, ends = coverage
+    position = bisect_right(starts, lap) - 1
+    return position >= 0 and lap <= ends[position]
+
+
 def _number(value: object) -> float | None:
     if value in (None, ""):
         return None
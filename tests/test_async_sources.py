@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+
+import f1_strategy_data.sources as sources
+from f1_strategy_data.async_sources import AsyncSourceClient
+from f1_strategy_data.ratelimit import HostBudget, TokenBucketLimiter
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    responses: dict[str, list[tuple[int, object, dict[str, str]]]] = {}
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        type(self).connections.add(self.client_address[1])
+        status, payload, headers = type(self).responses[self.path].pop(0)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub(monkeypatch):
+    monkeypatch.setattr(sources, "_RATE_LIMITER", TokenBucketLimiter({}, HostBudget.from_interval(0)))
+    _StubHandler.connections = set()
+    _StubHandler.responses = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    origin = f"http://127.0.0.1:{server.server_address[1]}"
+    yield _StubHandler, {"https://api.openf1.org": origin, "https://api.jolpi.ca": origin}
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_to_one_host_reuse_a_keep_alive_connection(stub):
+    handler, origins = stub
+    handler.responses = {
+        "/v1/pit?session_key=1": [(200, [{"lap_number": 20}], {})],
+        "/v1/stints?session_key=1": [(200, [{"stint_number": 1}], {})],
+    }
+
+    async def fetch():
+        async with AsyncSourceClient(max_connections_per_host=1, origins=origins) as client:
+            pits = await client.openf1("pit", session_key=1)
+            stints = await client.openf1("stints", session_key=1)
+            return pits, stints, client.connections_opened
+
+    (pits, provenance), (stints, _), opened = asyncio.run(fetch())
+
+    assert pits == [{"lap_number": 20}]
+    assert stints == [{"stint_number": 1}]
+    assert provenance["source_url"] == "https://api.openf1.org/v1/pit?session_key=1"
+    assert opened == 1
+    assert len(handler.connections) == 1
+
+
+def test_retry_after_is_honoured_and_client_errors_are_raised(stub, monkeypatch):
+    handler, origins = stub
+    delays = []
+    monkeypatch.setattr(sources, "_retry_delay", lambda attempt, retry_after=None: delays.append(retry_after) or 0)
+    handler.responses = {
+        "/ergast/f1/2026/11/results.json?limit=100": [
+            (429, {}, {"Retry-After": "3"}),
+            (200, {"MRData": {"total": "1"}}, {}),
+        ],
+        "/ergast/f1/2026/11/pitstops.json?limit=2000": [(404, {}, {})],
+    }
+
+    async def fetch():
+        async with AsyncSourceClient(origins=origins) as client:
+            results = await client.jolpica_results(2026, 11)
+            with pytest.raises(HTTPError) as error:
+                await client.jolpica_pit_stops(2026, 11)
+            return results, error.value.code
+
+    (payload, _), code = asyncio.run(fetch())
+
+    assert payload == {"MRData": {"total": "1"}}
+    assert delays == ["3"]
+    assert code == 404
+
+
+def test_validators_are_recorded_and_sent_back_conditionally(stub, monkeypatch):
+    handler, origins = stub
+    seen = []
+    handler.responses = {
+        "/v1/weather?session_key=1": [
+            (200, [{"air_temperature": 20}], {"ETag": '"abc"', "Last-Modified": "Sun, 01 Mar 2026 00:00:00 GMT"}),
+            (304, None, {}),
+        ],
+    }
+    original = handler.do_GET
+
+    def record_and_reply(self):
+        seen.append(self.headers.get("If-None-Match"))
+        original(self)
+
+    monkeypatch.setattr(handler, "do_GET", record_and_reply)
+
+    async def fetch():
+        async with AsyncSourceClient(origins=origins) as client:
+            _, provenance = await client.openf1("weather", session_key=1)
+            with sources.conditional(provenance), pytest.raises(sources.NotModified):
+                await client.openf1("weather", session_key=1)
+            return provenance
+
+    provenance = asyncio.run(fetch())
+
+    assert provenance["etag"] == '"abc"'
+    assert provenance["last_modified"] == "Sun, 01 Mar 2026 00:00:00 GMT"
+    assert seen == [None, '"abc"']
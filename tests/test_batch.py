@@ -1,5 +1,6 @@
 import csv
 import json
+import tracemalloc
 from pathlib import Path
 
 import f1_strategy_data.batch as batch
@@ -32,7 +33,7 @@ def test_consolidate_combines_round_files(tmp_path: Path):
 
 
 def test_discovery_failure_is_recorded_without_aborting_manifest(tmp_path: Path, monkeypatch):
-    def fail_discovery(season):
+    def fail_discovery(season, **kwargs):
         raise RuntimeError("rate limited")
 
     monkeypatch.setattr(batch, "discover_completed_races", fail_discovery)
@@ -42,3 +43,103 @@ def test_discovery_failure_is_recorded_without_aborting_manifest(tmp_path: Path,
     assert manifest["runs"][0]["race_name"] == "season discovery"
     assert manifest["runs"][0]["reason"] == "RuntimeError: rate limited"
     assert (tmp_path / "processed" / "manifest_2023_2023.json").exists()
+
+
+def test_parallel_build_matches_serial_manifest(tmp_path: Path, monkeypatch):
+    def fake_historical(season, root, refresh=False):
+        return [{
+            "round_number": round_number, "race_name": f"{season}-{round_number}",
+            "status": "verified", "table_rows": {"race_drivers": 20}, "issues": [],
+        } for round_number in (1, 2)]
+
+    def fake_discovery(season, **kwargs):
+        if season == 2024:
+            raise RuntimeError("rate limited")
+        return [batch.RaceRef(season, round_number, f"GP {round_number}", "2023-03-05",
+                              None if round_number == 3 else 100 + round_number, "available")
+                for round_number in (1, 2, 3)]
+
+    def fake_race(season, round_number, session_key, root, refresh=False, **kwargs):
+        return {"status": "verified", "table_rows": {"stints": round_number}, "issues": []}
+
+    monkeypatch.setattr(batch, "build_historical_season", fake_historical)
+    monkeypatch.setattr(batch, "discover_completed_races", fake_discovery)
+    monkeypatch.setattr(batch, "build_reference_race", fake_race)
+    serial = batch.build_seasons(2021, 2025, tmp_path / "serial")
+    parallel = batch.build_seasons(2021, 2025, tmp_path / "parallel", workers=4)
+
+    assert parallel["runs"] == serial["runs"]
+    assert parallel["summary"] == serial["summary"] == {"verified": 8, "failed": 1, "unavailable": 2}
+
+
+def test_incremental_consolidate_only_reparses_changed_races(tmp_path: Path, monkeypatch):
+    for round_number in (1, 2, 3):
+        folder = tmp_path / "processed" / "2025" / f"round-{round_number:02d}"
+        folder.mkdir(parents=True)
+        with (folder / "stints.csv").open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["season", "driver_id", "compound"])
+            writer.writeheader()
+            writer.writerows({"season": 2025, "driver_id": f"d{round_number}-{index}", "compound": "SOFT, used"}
+                             for index in range(round_number))
+        (folder / "validation_report.json").write_text(json.dumps({"status": "verified", "issues": []}), encoding="utf-8")
+    consolidate(tmp_path, 2025, 2025)
+    changed = tmp_path / "processed" / "2025" / "round-02" / "stints.csv"
+    changed.write_text(changed.read_text(encoding="utf-8").replace("d2-1", "d2-9"), encoding="utf-8")
+    parsed = []
+    copy_rows = batch._copy_rows
+    monkeypatch.setattr(batch, "_copy_rows", lambda path, handle: parsed.append(path.parts[-2]) or copy_rows(path, handle))
+
+    counts = consolidate(tmp_path, 2025, 2025)
+    incremental = (tmp_path / "processed" / "consolidated_2025_2025" / "stints.csv").read_bytes()
+    consolidate(tmp_path, 2025, 2025, incremental=False)
+    full = (tmp_path / "processed" / "consolidated_2025_2025" / "stints.csv").read_bytes()
+
+    assert parsed[:1] == ["round-02"] and len(parsed) == 4
+    assert counts["stints"] == 6
+    assert incremental == full
+    assert b"d2-9" in full
+    index = json.loads((tmp_path / "processed" / "consolidated_2025_2025" / "segments.json").read_text(encoding="utf-8"))
+    assert [segment["rows"] for segment in index["tables"]["stints"]["segments"]] == [1, 2, 3]
+
+
+def test_consolidate_unifies_headers_and_streams_rows(tmp_path: Path):
+    columns = {1: ["season", "driver_id"], 2: ["season", "driver_id", "compound"]}
+    for round_number, fieldnames in columns.items():
+        folder = tmp_path / "processed" / "2025" / f"round-{round_number:02d}"
+        folder.mkdir(parents=True)
+        with (folder / "stints.csv").open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerow({"season": 2025, "driver_id": f"d{round_number}", "compound": "HARD\nused"})
+        (folder / "validation_report.json").write_text(json.dumps({"status": "verified", "issues": []}), encoding="utf-8")
+
+    counts = consolidate(tmp_path, 2025, 2025)
+
+    with (tmp_path / "processed" / "consolidated_2025_2025" / "stints.csv").open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert counts["stints"] == 2
+    assert rows == [
+        {"season": "2025", "driver_id": "d1", "compound": ""},
+        {"season": "2025", "driver_id": "d2", "compound": "HARD\nused"},
+    ]
+
+
+def test_consolidate_memory_does_not_grow_with_race_count(tmp_path: Path):
+    def peak_for(races: int) -> int:
+        root = tmp_path / str(races)
+        for round_number in range(1, races + 1):
+            folder = root / "processed" / str(2000 + round_number // 20) / f"round-{round_number % 20 + 1:02d}"
+            folder.mkdir(parents=True)
+            with (folder / "weather_observations.csv").open("w", encoding="utf-8", newline="") as handle:
+                writer = csv.DictWriter(handle, fieldnames=["session_key", "observed_at_utc", "air_temperature_c"])
+                writer.writeheader()
+                writer.writerows({"session_key": round_number, "observed_at_utc": f"minute-{minute}",
+                                  "air_temperature_c": 20.5} for minute in range(500))
+            (folder / "validation_report.json").write_text(json.dumps({"status": "verified", "issues": []}), encoding="utf-8")
+        tracemalloc.start()
+        consolidate(root, 2000, 2010, incremental=False)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    assert peak_for(40) < 2 * peak_for(10)
@@ -0,0 +1,36 @@
+import hashlib
+import json
+import os
+
+import f1_strategy_data.checksums as checksums
+from f1_strategy_data.checksums import CACHE_NAME, clear_memo, sha256_file
+
+
+def test_files_are_hashed_once_until_they_change(tmp_path, monkeypatch):
+    path = tmp_path / "snapshot.json"
+    path.write_bytes(b"x" * 3_000_000)
+    streamed = []
+    original = checksums._stream_sha256
+    monkeypatch.setattr(checksums, "_stream_sha256", lambda item: streamed.append(item) or original(item))
+
+    first = sha256_file(path)
+    clear_memo()
+    second = sha256_file(path)
+
+    assert first == second == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert streamed == [path]
+    assert json.loads((tmp_path / CACHE_NAME).read_text(encoding="utf-8"))["snapshot.json"]["sha256"] == first
+
+    stat = path.stat()
+    path.write_bytes(b"y" * 3_000_000)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert sha256_file(path) == hashlib.sha256(b"y" * 3_000_000).hexdigest()
+    assert len(streamed) == 2
+
+
+def test_unreadable_sidecar_is_ignored(tmp_path):
+    path = tmp_path / "pit_events.csv"
+    path.write_text("season\n2024\n", encoding="utf-8")
+    (tmp_path / CACHE_NAME).write_text("not json", encoding="utf-8")
+
+    assert sha256_file(path) == hashlib.sha256(path.read_bytes()).hexdigest()
@@ -0,0 +1,85 @@
+import csv
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from f1_strategy_data.columnar import column_types, export_parquet, read_parquet, write_parquet
+from f1_strategy_data.features import build_pre_race_feature_file
+
+
+def _write_csv(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _pit(season, round_number, driver="a", lap="12", duration="23.4"):
+    return {
+        "season": str(season), "round_number": str(round_number), "session_key": "",
+        "driver_id": driver, "stop_number": "1", "lap_number": lap,
+        "pit_duration_s": duration, "stop_duration_s": "", "driver_laps_completed": "",
+        "source": "jolpica", "source_url": "https://example.test", "retrieved_at_utc": "2026-01-01T00:00:00Z",
+        "validation_status": "verified",
+    }
+
+
+def test_schema_types_map_to_arrow_types():
+    types = column_types("pit_events")
+    assert types["season"] == "int64"
+    assert types["pit_duration_s"] == "float64"
+    assert types["driver_id"] == "string"
+
+
+def test_csv_strings_are_written_with_declared_types_and_nulls(tmp_path):
+    path = tmp_path / "pit_events.parquet"
+    count = write_parquet([_pit(2024, 1), _pit(2024, 2, duration="")], path, "pit_events")
+
+    table = read_parquet(path)
+
+    assert count == 2
+    assert table.schema.field("lap_number").type == pa.int64()
+    assert table.schema.field("pit_duration_s").type == pa.float64()
+    assert table.column("pit_duration_s").to_pylist() == [23.4, None]
+
+
+def test_reads_project_columns_and_skip_other_seasons(tmp_path):
+    path = tmp_path / "pit_events.parquet"
+    rows = [_pit(season, round_number) for season in (2022, 2023, 2024) for round_number in (1, 2)]
+    write_parquet(rows, path, "pit_events")
+
+    table = read_parquet(path, columns=["season", "round_number"], seasons=[2023])
+
+    assert table.column_names == ["season", "round_number"]
+    assert table.column("season").to_pylist() == [2023, 2023]
+    assert pq.ParquetFile(path).num_row_groups == 3
+
+
+def test_export_mirrors_processed_and_consolidated_tables_once(tmp_path):
+    race = tmp_path / "processed" / "2024" / "round-01" / "pit_events.csv"
+    consolidated = tmp_path / "processed" / "consolidated_2024_2024" / "pit_events.csv"
+    _write_csv(race, [_pit(2024, 1)])
+    _write_csv(consolidated, [_pit(2024, 1)])
+    (consolidated.parent / "coverage.csv").write_text("table\npit_events\n", encoding="utf-8")
+
+    assert export_parquet(tmp_path, 2024, 2024) == 2
+    assert export_parquet(tmp_path, 2024, 2024) == 0
+    assert read_parquet(consolidated.with_suffix(".parquet")).num_rows == 1
+    assert not (consolidated.parent / "coverage.parquet").exists()
+
+
+def test_feature_file_is_written_as_parquet_for_parquet_suffix(tmp_path):
+    source = tmp_path / "race_drivers.csv"
+    _write_csv(source, [{
+        "season": "2024", "round_number": "1", "session_key": "", "driver_id": "a",
+        "constructor_id": "x", "grid_position": "3", "classified_position": "2", "status": "Finished",
+    }])
+    output = tmp_path / "features" / "pre_race_finishing_position.parquet"
+
+    assert build_pre_race_feature_file(source, output) == 1
+    table = read_parquet(output)
+    assert table.schema.field("grid_position").type == pa.int64()
+    assert table.column("driver_prior_avg_finish").to_pylist() == [None]
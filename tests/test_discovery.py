@@ -1,4 +1,5 @@
-from datetime import UTC, datetime
+import json
+from datetime import UTC, date, datetime
 
 import f1_strategy_data.discovery as discovery
 
@@ -34,3 +35,86 @@ def test_local_race_date_can_match_next_utc_day(monkeypatch):
 
     assert refs[0].session_key == 9644
 
+
+
+def _calendar(monkeypatch, calls: list[str], sessions: list[dict]) -> None:
+    def results(season):
+        calls.append("jolpica")
+        return {"MRData": {"RaceTable": {"Races": [
+            {"round": "1", "raceName": "Opener", "date": "2026-03-08"},
+        ]}}}, {}
+
+    def openf1(endpoint, **filters):
+        calls.append("openf1")
+        return sessions, {}
+
+    monkeypatch.setattr(discovery, "jolpica_season_results", results)
+    monkeypatch.setattr(discovery, "openf1", openf1)
+
+
+def test_current_season_discovery_is_reused_until_next_race_ends(tmp_path, monkeypatch):
+    calls: list[str] = []
+    _calendar(monkeypatch, calls, [
+        {"date_start": "2026-03-08T04:00:00+00:00", "date_end": "2026-03-08T06:00:00+00:00", "session_key": 1},
+        {"date_start": "2026-03-22T05:00:00+00:00", "date_end": "2026-03-22T07:00:00+00:00", "session_key": 2},
+    ])
+
+    first = discovery.discover_completed_races(2026, datetime(2026, 3, 10, tzinfo=UTC), tmp_path)
+    again = discovery.discover_completed_races(2026, datetime(2026, 3, 22, 6, tzinfo=UTC), tmp_path)
+    assert again == first
+    assert calls == ["jolpica", "openf1"]
+
+    discovery.discover_completed_races(2026, datetime(2026, 3, 22, 7, tzinfo=UTC), tmp_path)
+    assert calls == ["jolpica", "openf1"] * 2
+    discovery.discover_completed_races(2026, datetime(2026, 3, 22, 8, tzinfo=UTC), tmp_path, refresh=True)
+    assert len(calls) == 6
+
+
+def test_closed_season_discovery_is_cached_permanently(tmp_path, monkeypatch):
+    calls: list[str] = []
+    _calendar(monkeypatch, calls, [
+        {"date_start": "2026-03-08T04:00:00+00:00", "date_end": "2026-03-08T06:00:00+00:00", "session_key": 1},
+    ])
+
+    discovery.discover_completed_races(2026, datetime(2027, 1, 1, tzinfo=UTC), tmp_path)
+    refs = discovery.discover_completed_races(2026, datetime(2030, 1, 1, tzinfo=UTC), tmp_path)
+
+    assert refs[0].session_key == 1
+    assert calls == ["jolpica", "openf1"]
+    assert json.loads((tmp_path / "2026.json").read_text(encoding="utf-8"))["expires_at_utc"] is None
+
+
+def test_unpublished_results_and_failed_session_lookups_are_not_kept(tmp_path, monkeypatch):
+    calls: list[str] = []
+    _calendar(monkeypatch, calls, [
+        {"date_start": "2026-03-08T04:00:00+00:00", "date_end": "2026-03-08T06:00:00+00:00", "session_key": 1},
+        {"date_start": "2026-03-22T05:00:00+00:00", "date_end": "2026-03-22T07:00:00+00:00", "session_key": 2},
+    ])
+    as_of = datetime(2026, 3, 23, tzinfo=UTC)
+    discovery.discover_completed_races(2026, as_of, tmp_path)
+    cached = json.loads((tmp_path / "2026.json").read_text(encoding="utf-8"))
+    assert cached["expires_at_utc"] == (as_of + discovery.PROVISIONAL_TTL).isoformat()
+
+    def unavailable(endpoint, **filters):
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(discovery, "openf1", unavailable)
+    refs = discovery.discover_completed_races(2025, as_of, tmp_path)
+    assert refs[0].session_key is None
+    assert not (tmp_path / "2025.json").exists()
+
+
+def test_session_index_prefers_single_exact_day_and_rejects_ambiguous_neighbours():
+    sessions = [
+        {"date_start": "2024-11-22T06:00:00+00:00", "session_key": 1},
+        {"date_start": "2024-11-23T06:00:00+00:00", "session_key": 2},
+        {"date_start": "2024-11-24T06:00:00+00:00", "session_key": 3},
+    ]
+    by_day = discovery._index_sessions(sessions)
+
+    assert discovery._match_session_date("2024-11-23", by_day)["session_key"] == 2
+    assert discovery._match_session_date("2024-11-21", by_day)["session_key"] == 1
+    assert discovery._match_session_date("2024-11-25", by_day)["session_key"] == 3
+    assert discovery._match_session_date("2024-11-26", by_day) is None
+    del by_day[date(2024, 11, 23)]
+    assert discovery._match_session_date("2024-11-23", by_day) is None
@@ -0,0 +1,95 @@
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from f1_strategy_data import feature_frames
+from f1_strategy_data.features import (
+    build_next_pit_feature_file,
+    build_next_pit_features,
+    build_pit_count_features,
+    build_pre_race_finishing_features,
+)
+
+
+STINT_FIELDS = [
+    "season", "round_number", "driver_id", "stint_number", "compound", "lap_start", "lap_end",
+    "tyre_age_at_start_laps",
+]
+
+
+def _history(seed):
+    """Shuffled canonical-shaped rows with gaps, overlaps, and missing values."""
+    generator = random.Random(seed)
+    races, pits, stints, contexts = [], [], [], []
+    for season in (2024, 2025):
+        for round_number in range(1, 5):
+            key = {"season": str(season), "round_number": str(round_number)}
+            if generator.random() < 0.8:
+                contexts.append({
+                    **key, "circuit_key": generator.choice(["", "7", "9"]),
+                    "start_air_temperature_c": generator.choice(["", "21.5"]), "start_rainfall": generator.choice(["", "True", "0"]),
+                    "winner_laps_completed": generator.choice(["", "57"]), "safety_car_deployments": generator.choice(["0", "2"]),
+                    "virtual_safety_car_deployments": generator.choice(["", "1"]),
+                })
+            for driver in generator.sample("abcdef", generator.randint(1, 6)):
+                races.append({
+                    **key, "session_key": generator.choice(["", str(round_number)]), "driver_id": driver,
+                    "constructor_id": generator.choice(["", "red", "blue"]),
+                    "grid_position": generator.choice(["", "0", "3", "11"]),
+                    "classified_position": str(generator.randint(1, 20)),
+                    "status": generator.choice(["Finished", "+1 Lap", "Collision"]),
+                    "laps_completed": generator.choice(["", "0", str(generator.randint(1, 10))]),
+                })
+                for _ in range(generator.randint(0, 3)):
+                    pits.append({**key, "driver_id": driver, "lap_number": str(generator.randint(1, 12))})
+                lap = 1
+                for stint_number in range(1, generator.randint(0, 3) + 1):
+                    start = max(1, lap + generator.randint(-2, 1))
+                    end = start + generator.randint(0, 4)
+                    stints.append({
+                        **key, "driver_id": driver, "stint_number": str(generator.choice([stint_number, 1])),
+                        "compound": generator.choice(["", "SOFT", "HARD"]), "lap_start": str(start),
+                        "lap_end": str(end), "tyre_age_at_start_laps": generator.choice(["", "2"]),
+                    })
+                    lap = end + 1
+    for rows in (races, pits, stints):
+        generator.shuffle(rows)
+    return races, pits, stints, contexts
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_columnar_engine_matches_reference_features(seed):
+    races, pits, stints, contexts = _history(seed)
+    frames = (pd.DataFrame(races), pd.DataFrame(pits), pd.DataFrame(stints, columns=STINT_FIELDS))
+    context_frame = pd.DataFrame(contexts) if contexts else None
+
+    assert feature_frames.records(
+        feature_frames.pre_race_finishing_frame(frames[0], 2025, context_frame)
+    ) == build_pre_race_finishing_features(races, 2025, contexts)
+    assert feature_frames.records(
+        feature_frames.pit_count_frame(*frames, 2025, context_frame)
+    ) == build_pit_count_features(races, pits, stints, 2025, contexts)
+    assert feature_frames.records(
+        feature_frames.next_pit_frame(*frames, 2025)
+    ) == build_next_pit_features(races, pits, stints, 2025)
+
+
+def test_columnar_engine_writes_identical_feature_files(tmp_path: Path):
+    races, pits, stints, _ = _history(0)
+    paths = []
+    for name, rows, columns in (("races", races, None), ("pits", pits, None), ("stints", stints, STINT_FIELDS)):
+        paths.append(tmp_path / f"{name}.csv")
+        pd.DataFrame(rows, columns=columns).to_csv(paths[-1], index=False)
+
+    build_next_pit_feature_file(*paths, tmp_path / "python.csv", 2025)
+    build_next_pit_feature_file(*paths, tmp_path / "pandas.csv", 2025, engine="pandas")
+
+    assert (tmp_path / "pandas.csv").read_bytes() == (tmp_path / "python.csv").read_bytes()
+
+
+def test_columnar_engine_rejects_invalid_targets():
+    races = pd.DataFrame([{"season": "2025", "round_number": "1", "driver_id": "a", "classified_position": "0"}])
+    with pytest.raises(ValueError, match="classified_position"):
+        feature_frames.pre_race_finishing_frame(races)
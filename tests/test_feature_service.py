@@ -0,0 +1,90 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from f1_strategy_data.feature_service import PreRaceFeatureService
+from f1_strategy_data.features import (
+    PIT_COUNT_COLUMNS,
+    PRE_RACE_COLUMNS,
+    build_pit_count_feature_file,
+    build_pit_count_features,
+    build_pre_race_feature_file,
+    build_pre_race_finishing_features,
+)
+
+
+def _race(round_number, driver, constructor, grid, finish):
+    return {
+        "season": "2025", "round_number": str(round_number), "session_key": str(round_number * 10),
+        "driver_id": driver, "constructor_id": constructor, "grid_position": str(grid),
+        "classified_position": str(finish), "status": "Finished" if finish < 3 else "Engine",
+    }
+
+
+RACES = [
+    _race(round_number, driver, constructor, grid, (grid + round_number) % 3 + 1)
+    for round_number in (1, 2, 3)
+    for driver, constructor, grid in (("a", "x", 1), ("b", "x", 2), ("c", "y", 3))
+]
+PITS = [
+    {"season": "2025", "round_number": str(round_number), "driver_id": driver}
+    for round_number, driver in ((1, "a"), (1, "b"), (1, "b"), (2, "c"), (3, "a"))
+]
+CONTEXTS = [
+    {"season": "2025", "round_number": str(round_number), "circuit_key": str(key), "start_rainfall": rain,
+     "winner_laps_completed": "57", "safety_car_deployments": str(round_number % 2)}
+    for round_number, key, rain in ((1, 7, "true"), (2, 9, "false"), (3, 7, "false"))
+]
+
+
+def _write_rows(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _service(tmp_path: Path):
+    """A service over checkpoints that end after round 2."""
+    earlier = lambda rows: [row for row in rows if row["round_number"] != "3"]
+    races = _write_rows(tmp_path / "race_drivers.csv", earlier(RACES))
+    pits = _write_rows(tmp_path / "pit_events.csv", earlier(PITS))
+    stints = _write_rows(tmp_path / "stints.csv", earlier(PITS))
+    contexts = _write_rows(tmp_path / "race_context.csv", earlier(CONTEXTS))
+    finishing, pit_count = tmp_path / "finishing.csv", tmp_path / "pit_count.csv"
+    build_pre_race_feature_file(races, finishing, 2025, contexts, incremental=True)
+    build_pit_count_feature_file(races, pits, stints, pit_count, 2025, contexts, incremental=True)
+    return PreRaceFeatureService.load(finishing, pit_count)
+
+
+def test_service_matches_batch_features_for_the_next_race(tmp_path: Path):
+    service = _service(tmp_path)
+    grid = [row for row in RACES if row["round_number"] == "3"]
+    before = service.finishing.as_dict()
+
+    finishing = service.finishing_features(grid, 2025, 3, CONTEXTS[2])
+    pit_count = service.pit_count_features(grid, 2025, 3, CONTEXTS[2])
+
+    expected_finishing = build_pre_race_finishing_features(RACES, 2025, CONTEXTS)[-3:]
+    expected_pit_count = build_pit_count_features(RACES, PITS, PITS, 2025, CONTEXTS)[-3:]
+    assert finishing == [{**row, "classified_position": None} for row in expected_finishing]
+    assert pit_count == [{**row, "pit_stop_count": None} for row in expected_pit_count]
+    assert tuple(finishing[0]) == PRE_RACE_COLUMNS
+    assert tuple(pit_count[0]) == PIT_COUNT_COLUMNS
+    assert service.finishing.as_dict() == before
+
+
+def test_service_handles_new_drivers_and_rejects_processed_races(tmp_path: Path):
+    service = _service(tmp_path)
+
+    rookie = service.finishing_features([{"driver_id": "z", "constructor_id": "new"}], 2026, 1)[0]
+
+    assert rookie["driver_prior_starts"] == 0
+    assert rookie["constructor_prior_starts"] == 0
+    assert rookie["circuit_key"] is None
+    assert rookie["dataset_split"] == "test"
+    assert "z" not in service.finishing.drivers
+    with pytest.raises(ValueError, match="last processed race"):
+        service.pit_count_features([{"driver_id": "a"}], 2025, 2)
@@ -1,4 +1,16 @@
-from f1_strategy_data.features import PRE_RACE_COLUMNS, build_pre_race_finishing_features
+import csv
+import json
+import random
+from pathlib import Path
+from statistics import fmean
+
+from f1_strategy_data.features import (
+    PRE_RACE_COLUMNS,
+    RunningHistory,
+    build_pre_race_feature_file,
+    build_pre_race_finishing_features,
+    feature_state_path,
+)
 
 
 def _row(season, round_number, driver, constructor, grid, finish, status="Finished"):
@@ -64,3 +76,60 @@ def test_race_context_uses_current_weather_but_only_prior_circuit_outcomes():
     assert result[1]["circuit_prior_avg_winner_laps"] == 50.0
     assert result[1]["circuit_prior_avg_safety_cars"] == 1.0
     assert result[1]["circuit_prior_rain_rate"] == 1.0
+
+
+def test_running_history_matches_rounded_fmean_of_full_history():
+    generator = random.Random(7)
+    history = RunningHistory({"zero": lambda record: record["value"] == 0})
+    values: list[float] = []
+    for _ in range(2000):
+        value = generator.choice([0.0, 0.1, 1e16, -1e16, generator.uniform(-50, 50), 3.0])
+        history.append({"value": value, "missing": None})
+        values.append(value)
+
+        assert history.average("value") == round(fmean(values), 6)
+        assert history.recent_average("value") == round(fmean(values[-5:]), 6)
+    assert history.average("missing") is None
+    assert history.rate("zero") == round(values.count(0.0) / len(values), 6)
+    assert len(history) == 2000
+
+
+def _write_rows(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_incremental_build_appends_only_new_races(tmp_path: Path):
+    rows = [
+        _row(2025, round_number, driver, constructor, grid, finish)
+        for round_number in (1, 2, 3)
+        for driver, constructor, grid, finish in (("a", "x", 1, 2), ("b", "x", 2, 1), ("c", "", 3, 3))
+    ]
+    source, output, full = tmp_path / "race_drivers.csv", tmp_path / "features.csv", tmp_path / "full.csv"
+    _write_rows(source, rows[:6])
+    assert build_pre_race_feature_file(source, output, incremental=True) == 6
+    _write_rows(source, rows)
+    assert build_pre_race_feature_file(source, output, incremental=True) == 3
+    assert build_pre_race_feature_file(source, output, incremental=True) == 0
+    build_pre_race_feature_file(source, full)
+
+    assert output.read_bytes() == full.read_bytes()
+    assert json.loads(feature_state_path(output).read_text(encoding="utf-8"))["last_race"] == [2025, 3]
+
+
+def test_running_history_round_trips_through_json():
+    history = RunningHistory({"zero": lambda record: record["value"] == 0})
+    for value in (0.0, 0.1, 1e16, 2.5, -1e16, 0.0, None):
+        history.append({"value": value})
+    restored = RunningHistory.from_dict(
+        json.loads(json.dumps(history.as_dict())), {"zero": lambda record: record["value"] == 0}
+    )
+    restored.append({"value": 0.3})
+    history.append({"value": 0.3})
+
+    assert restored.as_dict() == history.as_dict()
+    assert restored.average("value") == history.average("value")
+    assert restored.recent_average("value") == history.recent_average("value")
+    assert restored.rate("zero") == history.rate("zero")
@@ -0,0 +1,59 @@
+import csv
+from pathlib import Path
+
+import pandas as pd
+
+from f1_strategy_data import frame_validation, validation
+
+
+WEATHER = [
+    {"weather_source": "openf1", "observed_at_utc": "2026-03-08T05:02:00Z", "humidity_pct": 101, "wind_speed_ms": -1, "track_temperature_c": 40},
+    {"weather_source": "open_meteo", "observed_at_utc": "2026-03-08T05:03:00+01:00", "humidity_pct": "nan", "wind_speed_ms": None, "track_temperature_c": "31.5"},
+    {"weather_source": "openf1", "observed_at_utc": "", "humidity_pct": "", "wind_speed_ms": "calm", "track_temperature_c": None},
+    {"weather_source": "openf1", "observed_at_utc": "2026-02-30T05:04:00+00:00", "humidity_pct": 55, "wind_speed_ms": 2.5, "track_temperature_c": 39},
+]
+PIT_EVENTS = [
+    {"lap_number": 20, "driver_laps_completed": 12},
+    {"lap_number": "0", "driver_laps_completed": ""},
+    {"lap_number": 2.5, "driver_laps_completed": 30},
+    {"lap_number": None, "driver_laps_completed": 30},
+]
+STINTS = [
+    {"session_key": 1, "driver_id": "b", "lap_start": 10, "lap_end": 20},
+    {"session_key": 1, "driver_id": "a", "lap_start": 1, "lap_end": 20},
+    {"session_key": 1, "driver_id": "a", "lap_start": 20, "lap_end": 30},
+    {"session_key": 1, "driver_id": "b", "lap_start": 1, "lap_end": 10},
+    {"session_key": 1, "driver_id": "b", "lap_start": 25, "lap_end": 21},
+    {"session_key": 2, "driver_id": "a", "lap_start": None, "lap_end": 5},
+]
+TABLES = {"weather_observations": WEATHER, "pit_events": PIT_EVENTS, "stints": STINTS}
+ROW_VALIDATORS = {
+    "weather_observations": validation.weather_issues,
+    "pit_events": validation.pit_stop_issues,
+    "stints": validation.stint_issues,
+}
+
+
+def test_frame_validators_match_row_validators_on_pipeline_rows():
+    for table, rows in TABLES.items():
+        expected = ROW_VALIDATORS[table](rows)
+
+        assert expected
+        assert frame_validation.table_issues(table, pd.DataFrame(rows)) == expected
+
+
+def test_frame_validators_match_row_validators_on_csv_files(tmp_path: Path):
+    for table, rows in TABLES.items():
+        path = tmp_path / f"{table}.csv"
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        with path.open(encoding="utf-8", newline="") as handle:
+            expected = ROW_VALIDATORS[table](list(csv.DictReader(handle)))
+
+        assert frame_validation.table_issues(table, frame_validation.read_table(path)) == expected
+
+
+def test_tables_without_field_rules_have_no_frame_issues():
+    assert frame_validation.table_issues("race_drivers", pd.DataFrame([{"driver_id": "a"}])) == []
@@ -39,3 +39,16 @@ def test_next_pit_rows_skip_uncovered_laps_and_apply_holdout():
     result = build_next_pit_features(races, [], stints, holdout_season=2026)
     assert [row["lap_number"] for row in result] == [2, 3]
     assert {row["dataset_split"] for row in result} == {"test"}
+
+
+def test_overlapping_stints_resolve_to_lowest_stint_number():
+    races = [{"season": "2025", "round_number": "1", "session_key": "11", "driver_id": "a", "laps_completed": "5"}]
+    pits = [{"season": "2025", "round_number": "1", "driver_id": "a", "lap_number": "2"}]
+    stints = [
+        {"season": "2025", "round_number": "1", "driver_id": "a", "stint_number": "2", "compound": "HARD", "lap_start": "2", "lap_end": "9", "tyre_age_at_start_laps": ""},
+        {"season": "2025", "round_number": "1", "driver_id": "a", "stint_number": "1", "compound": "SOFT", "lap_start": "1", "lap_end": "3", "tyre_age_at_start_laps": "0"},
+    ]
+    result = build_next_pit_features(races, pits, stints)
+    assert [row["current_compound"] for row in result] == ["SOFT", "SOFT", "SOFT", "HARD", "HARD"]
+    assert [row["pit_stops_completed"] for row in result] == [0, 0, 1, 1, 1]
+    assert [row["laps_since_last_pit"] for row in result] == [0, 1, 1, 2, 3]
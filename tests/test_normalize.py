@@ -1,4 +1,7 @@
+from datetime import UTC, datetime, timedelta
+
 from f1_strategy_data.normalize import (
+    WeatherTimeline,
     completed_laps_for_pit_validation,
     count_shared_stint_boundaries,
     driver_number_map,
@@ -98,6 +101,19 @@ def test_shared_single_lap_stint_is_omitted_when_no_exclusive_lap_remains():
     assert [row["stint_number"] for row in rows] == [1, 3]
 
 
+def test_zero_lap_stint_is_omitted_when_replaced_by_a_moved_boundary():
+    source_rows = [
+        {"session_key": 1, "driver_number": 4, "stint_number": 1, "compound": "MEDIUM", "lap_start": 1, "lap_end": 5, "tyre_age_at_start": 0},
+        {"session_key": 1, "driver_number": 4, "stint_number": 2, "compound": "HARD", "lap_start": 5, "lap_end": 10, "tyre_age_at_start": 0},
+        {"session_key": 1, "driver_number": 4, "stint_number": 3, "compound": "SOFT", "lap_start": 6, "lap_end": 5, "tyre_age_at_start": 0},
+        {"session_key": 1, "driver_number": 4, "stint_number": 4, "compound": "SOFT", "lap_start": 5, "lap_end": 4, "tyre_age_at_start": 0},
+    ]
+
+    rows = normalize_stints(source_rows, {4: "norris"}, 2026, 1, **PROVENANCE)
+
+    assert [(row["stint_number"], row["lap_start"], row["lap_end"]) for row in rows] == [(1, 1, 5), (2, 6, 10), (4, 5, 4)]
+
+
 def test_disqualified_driver_laps_are_unknown_for_pit_validation():
     rows = [
         {"driver_id": "driver-a", "laps_completed": 0, "status": "Disqualified"},
@@ -155,6 +171,22 @@ def test_race_context_uses_nearest_start_weather_and_counts_safety_cars():
     assert row["winner_laps_completed"] == 70
 
 
+def test_weather_timeline_breaks_distance_ties_by_source_order():
+    rows = [
+        {"date": "2026-07-26T13:05:00+00:00", "label": "after"},
+        {"date": "2026-07-26T12:55:00+00:00", "label": "before"},
+        {"date": "2026-07-26T12:55:00Z", "label": "before-duplicate"},
+        {"date": "2026-07-26T13:20:00+00:00", "label": "late"},
+    ]
+    timeline = WeatherTimeline(rows)
+    start = datetime(2026, 7, 26, 13, tzinfo=UTC)
+
+    assert timeline.nearest(start, timedelta(minutes=15))["label"] == "after"
+    assert timeline.nearest(start - timedelta(minutes=5), timedelta(minutes=15))["label"] == "before"
+    assert timeline.nearest(start + timedelta(minutes=35), timedelta(minutes=15))["label"] == "late"
+    assert timeline.nearest(start + timedelta(minutes=36), timedelta(minutes=15)) is None
+
+
 def test_historical_context_preserves_circuit_without_telemetry():
     race = {
         **RACE,
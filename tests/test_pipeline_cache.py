@@ -1,6 +1,12 @@
+import gzip
+import json
 from pathlib import Path
 
-from f1_strategy_data.pipeline import _load_or_fetch
+import f1_strategy_data.pipeline as pipeline
+from f1_strategy_data.checksums import sha256_file
+from f1_strategy_data.pipeline import _load_or_fetch, _snapshot_checksums
+from f1_strategy_data.rawstore import RawStore
+from f1_strategy_data.sources import NotModified, _conditional_headers
 
 
 def test_raw_snapshot_cache_avoids_repeat_download(tmp_path: Path):
@@ -31,3 +37,128 @@ def test_refresh_replaces_cached_snapshot(tmp_path: Path):
 
     assert calls == 2
     assert payload == [{"value": 2}]
+
+
+def test_unchanged_historical_round_is_not_rebuilt(tmp_path: Path, monkeypatch):
+    race = {
+        "season": "1960", "round": "1", "raceName": "Argentine Grand Prix", "date": "1960-02-07",
+        "Circuit": {"circuitId": "galvez", "circuitName": "Galvez", "Location": {"country": "Argentina"}},
+        "Results": [{
+            "number": "24", "position": "1", "grid": "2", "laps": "80", "status": "Finished",
+            "Driver": {"driverId": "mclaren", "givenName": "Bruce", "familyName": "McLaren"},
+            "Constructor": {"constructorId": "cooper"},
+        }],
+    }
+    monkeypatch.setattr(pipeline, "jolpica_season_full_results", lambda season: (
+        {"MRData": {"RaceTable": {"Races": [race]}}},
+        {"source_url": "https://example.test/1960", "retrieved_at_utc": "2026-01-01T00:00:00+00:00"},
+    ))
+    writes = []
+    original_write = pipeline._write_csv
+    monkeypatch.setattr(pipeline, "_write_csv", lambda path, rows: writes.append(path.name) or original_write(path, rows))
+
+    first = pipeline.build_historical_season(1960, tmp_path)
+    second = pipeline.build_historical_season(1960, tmp_path)
+    assert len(writes) == 2
+    assert second == first
+
+    race["Results"][0]["status"] = "+1 Lap"
+    third = pipeline.build_historical_season(1960, tmp_path, refresh=True)
+    assert len(writes) == 4
+    assert third[0]["build_fingerprint"] != first[0]["build_fingerprint"]
+
+
+def test_snapshots_are_compressed_deduplicated_and_hashed_once(tmp_path: Path):
+    store = RawStore(tmp_path / "raw")
+    race_dir = tmp_path / "raw" / "2025" / "round-01"
+    race_dir.mkdir(parents=True)
+
+    def loader():
+        return [{"value": 1}], {"source_url": "https://example.test", "retrieved_at_utc": "now"}
+
+    payload, provenance = _load_or_fetch(race_dir, "sample", loader, refresh=False, store=store)
+    _load_or_fetch(race_dir, "sample", loader, refresh=True, store=store)
+    _load_or_fetch(race_dir, "other", loader, refresh=False, store=store)
+
+    objects = list((tmp_path / "raw" / "objects").rglob("*.json.gz"))
+    assert len(objects) == 1
+    assert json.loads(gzip.decompress(objects[0].read_bytes())) == payload
+    assert provenance == {"source_url": "https://example.test", "retrieved_at_utc": "now"}
+    assert _snapshot_checksums(race_dir, ["sample", "other"]) == {
+        "sample": objects[0].name.removesuffix(".json.gz"),
+        "other": objects[0].name.removesuffix(".json.gz"),
+    }
+    assert not (race_dir / "sample.json").exists()
+
+
+def test_legacy_pretty_printed_snapshots_remain_readable(tmp_path: Path):
+    (tmp_path / "sample.json").write_text(json.dumps([{"value": 1}], indent=2) + "\n", encoding="utf-8")
+    (tmp_path / "sample.provenance.json").write_text(
+        json.dumps({"source_url": "https://example.test", "retrieved_at_utc": "then"}), encoding="utf-8"
+    )
+
+    payload, provenance = _load_or_fetch(tmp_path, "sample", lambda: 1 / 0, refresh=False)
+
+    assert payload == [{"value": 1}]
+    assert provenance["retrieved_at_utc"] == "then"
+    assert _snapshot_checksums(tmp_path, ["sample"]) == {"sample": sha256_file(tmp_path / "sample.json")}
+
+
+def test_refresh_sends_stored_validators_and_keeps_snapshot_on_304(tmp_path: Path):
+    sent = []
+
+    def changed():
+        return [{"value": 1}], {
+            "source_url": "https://example.test", "retrieved_at_utc": "first", "etag": '"v1"',
+        }
+
+    def not_modified():
+        sent.append(_conditional_headers())
+        raise NotModified("https://example.test")
+
+    _, provenance = _load_or_fetch(tmp_path, "sample", changed, refresh=False)
+    sidecar = (tmp_path / "sample.provenance.json").read_bytes()
+    payload, refreshed = _load_or_fetch(tmp_path, "sample", not_modified, refresh=True)
+
+    assert sent == [{"If-None-Match": '"v1"'}]
+    assert payload == [{"value": 1}]
+    assert refreshed == provenance == {"source_url": "https://example.test", "retrieved_at_utc": "first"}
+    assert (tmp_path / "sample.provenance.json").read_bytes() == sidecar
+    assert json.loads(sidecar)["etag"] == '"v1"'
+
+
+def test_season_prefetch_partitions_rows_into_race_snapshots(tmp_path: Path, monkeypatch):
+    requests = []
+
+    def fake_range(endpoint, first, last):
+        requests.append((endpoint, first, last))
+        rows = [] if endpoint == "race_control" else [
+            {"session_key": 9001, "endpoint": endpoint},
+            {"session_key": 9002, "endpoint": endpoint},
+            {"session_key": 9003, "endpoint": endpoint},
+        ]
+        return rows, {"source_url": f"https://example.test/{endpoint}", "retrieved_at_utc": "now", "etag": "x"}
+
+    def fake_openf1(endpoint, **filters):
+        requests.append((endpoint, filters))
+        return [{"session_key": 9001}, {"session_key": 9003}], {"source_url": "https://example.test/s", "retrieved_at_utc": "now"}
+
+    monkeypatch.setattr(pipeline, "openf1_session_range", fake_range)
+    monkeypatch.setattr(pipeline, "openf1", fake_openf1)
+
+    written = pipeline.prefetch_openf1_season(2025, {1: 9001, 2: 9003}, tmp_path)
+    store = RawStore(tmp_path / "raw")
+
+    assert len(requests) == 6
+    assert ("weather", 9001, 9003) in requests
+    assert ("sessions", {"year": 2025, "session_name": "Race"}) in requests
+    assert written[9001] == written[9003] == frozenset(pipeline.OPENF1_SNAPSHOTS) - {"openf1_race_control"}
+    round_two = tmp_path / "raw" / "2025" / "round-02"
+    assert not (round_two / "openf1_race_control.provenance.json").exists()
+    payload, provenance = _load_or_fetch(round_two, "openf1_weather", lambda: 1 / 0, False, store)
+    assert payload == [{"session_key": 9003, "endpoint": "weather"}]
+    assert provenance == {"source_url": "https://example.test/weather", "retrieved_at_utc": "now"}
+
+    requests.clear()
+    assert pipeline.prefetch_openf1_season(2025, {1: 9001, 2: 9003}, tmp_path) == {}
+    assert requests == [("race_control", 9001, 9003)]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from urllib.response import addinfourl
+
+import pytest
+
+import f1_strategy_data.sources as sources
+from f1_strategy_data.ratelimit import FileRateLimiter, HostBudget, TokenBucketLimiter
+
+
+class _Clock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_a_burst_then_spaces_requests():
+    clock = _Clock()
+    limiter = TokenBucketLimiter({"api.jolpi.ca": HostBudget(2.0, burst=3)}, HostBudget(1.0), clock)
+
+    assert [limiter.reserve("api.jolpi.ca") for _ in range(5)] == pytest.approx([0, 0, 0, 0.5, 1.0])
+    clock.now = 10.0
+    assert limiter.reserve("api.jolpi.ca") == 0
+    assert limiter.reserve("other.test") == 0
+
+
+def test_file_limiter_shares_one_budget_between_instances(tmp_path: Path):
+    clock = _Clock(1000.0)
+    path = tmp_path / "budget.json"
+    budgets = {"api.openf1.org": HostBudget.from_interval(2.0)}
+    first = FileRateLimiter(path, budgets, HostBudget(1.0), clock)
+    second = FileRateLimiter(path, budgets, HostBudget(1.0), clock)
+
+    assert first.reserve("api.openf1.org") == 0
+    assert second.reserve("api.openf1.org") == pytest.approx(2.0)
+    assert first.reserve("api.openf1.org") == pytest.approx(4.0)
+    assert json.loads(path.read_text(encoding="utf-8"))["api.openf1.org"] == [-2.0, 1000.0]
+
+
+def test_request_stats_separate_throttle_and_network_time(monkeypatch):
+    clock = iter([10.0, 10.75])
+    monkeypatch.setattr(sources, "_RATE_LIMITER", TokenBucketLimiter({}, HostBudget(1.0), lambda: 0.0))
+    monkeypatch.setattr(sources.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(sources.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(sources, "urlopen", lambda request, timeout: addinfourl(io.BytesIO(b"[]"), {}, request.full_url))
+    sources.reset_request_stats()
+    sources._RATE_LIMITER.reserve("api.openf1.org")
+
+    payload, _ = sources._get_json("https://api.openf1.org/v1/pit")
+    stats = sources.request_stats()["api.openf1.org"]
+
+    assert payload == []
+    assert stats.requests == 1
+    assert stats.throttled_seconds == pytest.approx(1.0)
+    assert stats.network_seconds == pytest.approx(0.75)
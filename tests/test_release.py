@@ -4,7 +4,7 @@ from pathlib import Path
 
 from f1_strategy_data.batch import TABLES
 from scripts.prepare_kaggle_release import prepare_release
-from scripts.validate_release import validate_manifest
+from scripts.validate_release import consolidated_table_errors, validate_manifest
 
 
 def test_release_gate_rejects_failed_build(tmp_path: Path):
@@ -117,3 +117,34 @@ def test_prepare_release_copies_tables_manifest_and_metadata(tmp_path: Path):
     classified = next(row for row in dictionary if row["table"] == "race_drivers" and row["column"] == "classified_position")
     assert classified["feature_time"] == "post_race"
     assert classified["target"] == "True"
+
+
+def test_release_gate_rechecks_consolidated_tables(tmp_path: Path):
+    path = tmp_path / "manifest_2026_2026.json"
+    path.write_text(json.dumps({"start_year": 2026, "end_year": 2026}), encoding="utf-8")
+    consolidated = tmp_path / "consolidated_2026_2026"
+    consolidated.mkdir()
+    (consolidated / "stints.csv").write_text(
+        "session_key,driver_id,lap_start,lap_end\n1,driver,1,20\n1,driver,20,30\n", encoding="utf-8"
+    )
+    (consolidated / "pit_events.csv").write_text("lap_number,driver_laps_completed\n3,40\n", encoding="utf-8")
+
+    assert consolidated_table_errors(path) == ["consolidated table stints has 1 error(s): overlapping_stints"]
+
+
+def test_release_gate_rejects_pit_events_for_unpublished_drivers(tmp_path: Path):
+    path = tmp_path / "manifest_2026_2026.json"
+    path.write_text(json.dumps({"start_year": 2026, "end_year": 2026}), encoding="utf-8")
+    consolidated = tmp_path / "consolidated_2026_2026"
+    consolidated.mkdir()
+    (consolidated / "race_drivers.csv").write_text("season,round_number,driver_id\n2026,1,norris\n", encoding="utf-8")
+    (consolidated / "stints.csv").write_text(
+        "season,round_number,driver_id,lap_start,lap_end\n2026,1,norris,1,40\n", encoding="utf-8"
+    )
+    (consolidated / "pit_events.csv").write_text(
+        "season,round_number,driver_id,lap_number\n2026,1,norris,20\n2026,2,norris,20\n", encoding="utf-8"
+    )
+
+    assert consolidated_table_errors(path) == [
+        "consolidated table pit_events has 1 row(s) whose driver is missing from race_drivers"
+    ]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import f1_strategy_data.sources as sources
+from f1_strategy_data.pipeline import _load_or_fetch
+from f1_strategy_data.ratelimit import HostBudget, TokenBucketLimiter
+from f1_strategy_data.rawstore import RawStore
+from f1_strategy_data.replay import Cassette, FaultPlan, ReplayServer, replaying
+
+
+@pytest.fixture()
+def unthrottled(monkeypatch):
+    monkeypatch.setattr(sources, "_RATE_LIMITER", TokenBucketLimiter({}, HostBudget.from_interval(0)))
+    monkeypatch.setattr(sources.time, "sleep", lambda seconds: None)
+
+
+def _snapshot(root: Path, season: int, round_number: int, name: str, url: str, payload):
+    raw_dir = root / "raw" / str(season) / f"round-{round_number:02d}"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    _load_or_fetch(raw_dir, name, lambda: (payload, {
+        "source_url": url, "retrieved_at_utc": "2026-01-01T00:00:00+00:00", "etag": f'"{name}-{round_number}"',
+    }), False, RawStore(root / "raw"))
+
+
+def test_raw_snapshots_replay_with_synthesized_discovery(tmp_path: Path, unthrottled):
+    for round_number, session_key in ((1, 9001), (2, 9002)):
+        race = {"season": "2025", "round": str(round_number), "raceName": f"GP {round_number}",
+                "date": f"2025-03-0{round_number}", "Results": [{"position": "1"}, {"position": "2"}]}
+        _snapshot(tmp_path, 2025, round_number, "jolpica_results",
+                  sources._jolpica_results_url(2025, round_number), {"MRData": {"RaceTable": {"Races": [race]}}})
+        _snapshot(tmp_path, 2025, round_number, "openf1_session",
+                  sources._openf1_url("sessions", session_key=session_key), [{"session_key": session_key, "year": 2025}])
+
+    with ReplayServer(Cassette.from_raw(tmp_path)) as server, replaying(server):
+        results, provenance = sources.jolpica_results(2025, 2)
+        discovery, _ = sources.jolpica_season_results(2025)
+        sessions, _ = sources.openf1("sessions", year=2025, session_name="Race")
+        with sources.conditional(provenance), pytest.raises(sources.NotModified):
+            sources.jolpica_results(2025, 2)
+        with pytest.raises(sources.HTTPError) as missing:
+            sources.openf1("pit", session_key=9001)
+
+    assert provenance["source_url"] == "https://api.jolpi.ca/ergast/f1/2025/2/results.json?limit=100"
+    assert provenance["etag"] == '"jolpica_results-2"'
+    assert results["MRData"]["RaceTable"]["Races"][0]["raceName"] == "GP 2"
+    assert [race["round"] for race in discovery["MRData"]["RaceTable"]["Races"]] == ["1", "2"]
+    assert [row["session_key"] for row in sessions] == [9001, 9002]
+    assert missing.value.code == 404
+    assert server.counts == {200: 3, 304: 1, 404: 1}
+    assert sources._ORIGINS == {}
+
+
+def test_injected_failures_exercise_retries(tmp_path: Path, unthrottled):
+    cassette = Cassette()
+    cassette.add("https://api.openf1.org/v1/pit?session_key=1", [{"lap_number": 12}])
+    path = tmp_path / "cassette.json"
+    cassette.save(path)
+    faults = FaultPlan(rate_limited=0.15, server_errors=0.15, seed=3)
+
+    with ReplayServer(Cassette.load(path), faults) as server, replaying(server):
+        payloads = [sources.openf1("pit", session_key=1)[0] for _ in range(10)]
+
+    assert payloads == [[{"lap_number": 12}]] * 10
+    assert server.counts[429] > 0 and server.counts[503] > 0
@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import f1_strategy_data.sources as sources
+from f1_strategy_data.responsecache import ResponseCache, normalize_url
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    cache = ResponseCache(1024)
+    calls = []
+    started, release = threading.Event(), threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b"[1]", {"source_url": "https://example.test/a"}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get_or_fetch, "https://example.test/a?b=2&a=1", fetch) for _ in range(4)]
+        started.wait(5)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(cached for _, cached in results) == [False, True, True, True]
+    assert cache.get_or_fetch("https://EXAMPLE.test/a?a=1&b=2", fetch) == ((b"[1]", {"source_url": "https://example.test/a"}), True)
+
+
+def test_cache_is_bounded_by_bytes_and_never_caches_failures():
+    cache = ResponseCache(10)
+    cache.get_or_fetch("u1", lambda: (b"12345", {}))
+    cache.get_or_fetch("u2", lambda: (b"12345", {}))
+    cache.get_or_fetch("u1", lambda: (b"", {}))
+    cache.get_or_fetch("u3", lambda: (b"123", {}))
+
+    assert cache.size_bytes == 8
+    assert cache.get_or_fetch("u2", lambda: (b"fresh", {}))[1] is False
+
+    def fail():
+        raise OSError("offline")
+
+    with pytest.raises(OSError):
+        cache.get_or_fetch("u4", fail)
+    assert cache.get_or_fetch("u4", lambda: (b"ok", {}))[1] is False
+
+
+def test_sources_reuse_responses_only_inside_a_cache_scope(monkeypatch):
+    fetched = []
+    monkeypatch.setattr(sources, "_fetch", lambda url, timeout, attempts: fetched.append(url) or (b'{"n": 1}', {
+        "source_url": url, "retrieved_at_utc": "now",
+    }))
+    url = "https://api.jolpi.ca/ergast/f1/2025/results/1.json?limit=100"
+
+    with sources.response_cache() as cache:
+        first, _ = sources._get_json(url)
+        first["n"] = 2
+        second, _ = sources._get_json(url)
+        with sources.conditional({"etag": '"x"'}):
+            sources._get_json(url)
+    sources._get_json(url)
+
+    assert second == {"n": 1}
+    assert cache.hits == 1
+    assert len(fetched) == 3
+    assert normalize_url(url) == url
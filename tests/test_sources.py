@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 import f1_strategy_data.sources as sources
+from f1_strategy_data.ratelimit import HostBudget, TokenBucketLimiter
 
 
 def test_full_season_results_follow_jolpica_pagination(monkeypatch):
@@ -24,3 +30,64 @@ def test_full_season_results_follow_jolpica_pagination(monkeypatch):
     assert len(calls) == 2
     assert [race["round"] for race in payload["MRData"]["RaceTable"]["Races"]] == ["1", "2"]
     assert payload["MRData"]["total"] == "3"
+
+
+def test_throttle_spaces_concurrent_requests_per_host(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(sources, "_RATE_LIMITER", TokenBucketLimiter(
+        {"api.openf1.org": HostBudget.from_interval(2.1)}, HostBudget.from_interval(0.25), clock=lambda: 100.0,
+    ))
+    monkeypatch.setattr(sources.time, "sleep", sleeps.append)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(sources._throttle, ["https://api.openf1.org/v1/pit"] * 4))
+
+    assert sorted(sleeps) == pytest.approx([2.1, 4.2, 6.3])
+
+
+def _results_page(url, total, rows_by_offset):
+    offset = int(url.rsplit("offset=", 1)[1])
+    rows = rows_by_offset[offset]
+    races = [{"round": str(round_number), "Results": [{"position": str(position)}]} for round_number, position in rows]
+    return {"MRData": {"total": str(total), "RaceTable": {"Races": races}}}, {"source_url": url, "retrieved_at_utc": "now"}
+
+
+def test_pages_after_the_first_are_fetched_concurrently_and_merged_in_order(monkeypatch):
+    rows = [(round_number, position) for round_number in (1, 2, 3, 4) for position in (1, 2, 3)]
+    pages = {offset: rows[offset:offset + 3] for offset in range(0, len(rows), 3)}
+    calls = []
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_get(url):
+        calls.append(url)
+        if "offset=0" not in url:
+            barrier.wait()
+        return _results_page(url, len(rows), pages)
+
+    monkeypatch.setattr(sources, "_get_json", fake_get)
+    payload, provenance = sources.jolpica_season_full_results(1975)
+
+    races = payload["MRData"]["RaceTable"]["Races"]
+    assert len(calls) == 4
+    assert [race["round"] for race in races] == ["1", "2", "3", "4"]
+    assert [len(race["Results"]) for race in races] == [3, 3, 3, 3]
+    assert provenance["source_url"].endswith("offset=0")
+
+
+def test_short_page_falls_back_to_sequential_offsets(monkeypatch):
+    rows = [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3), (3, 1)]
+    calls = []
+
+    def fake_get(url):
+        calls.append(url)
+        offset = int(url.rsplit("offset=", 1)[1])
+        # The server caps the second page at two rows, shifting later pages.
+        served = rows[offset:offset + (2 if offset == 3 else 3)]
+        return _results_page(url, len(rows), {offset: served})
+
+    monkeypatch.setattr(sources, "_get_json", fake_get)
+    payload, _ = sources.jolpica_season_full_results(1975)
+
+    races = payload["MRData"]["RaceTable"]["Races"]
+    assert [(race["round"], len(race["Results"])) for race in races] == [("1", 3), ("2", 3), ("3", 1)]
+    assert sorted(int(url.rsplit("offset=", 1)[1]) for url in calls) == [0, 3, 5, 6]
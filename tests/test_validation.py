@@ -1,4 +1,4 @@
-from f1_strategy_data.validation import duplicate_key_issues, pit_stop_issues, stint_issues, weather_issues
+from f1_strategy_data.validation import cross_table_issues, duplicate_key_issues, pit_stop_issues, stint_issues, weather_issues
 
 
 def test_duplicate_primary_key_is_reported():
@@ -28,4 +28,27 @@ def test_stints_cannot_overlap():
         {"session_key": 1, "driver_id": "driver", "lap_start": 1, "lap_end": 20},
         {"session_key": 1, "driver_id": "driver", "lap_start": 20, "lap_end": 30},
     ]
-    assert [issue.code for issue in stint_issues(rows)] == ["overlapping_stints"]
\ No newline at end of file
+    assert [issue.code for issue in stint_issues(rows)] == ["overlapping_stints"]
+
+
+def test_cross_table_checks_driver_references_and_pit_lap_coverage():
+    drivers = [{"season": 2026, "round_number": 1, "driver_id": "norris"}]
+    stints = [
+        {"season": 2026, "round_number": 1, "driver_id": "norris", "lap_start": 1, "lap_end": 20},
+        {"season": 2026, "round_number": 1, "driver_id": "norris", "lap_start": 21, "lap_end": 30},
+        {"season": 2026, "round_number": 1, "driver_id": "norris", "lap_start": 40, "lap_end": 50},
+        {"season": 2026, "round_number": 2, "driver_id": "norris", "lap_start": 1, "lap_end": 50},
+    ]
+    pit_events = [
+        {"season": "2026", "round_number": "1", "driver_id": "norris", "lap_number": "21"},
+        {"season": 2026, "round_number": 1, "driver_id": "norris", "lap_number": 35},
+        {"season": 2026, "round_number": 1, "driver_id": "piastri", "lap_number": 35},
+    ]
+
+    issues = cross_table_issues(drivers, stints, pit_events)
+
+    assert [(issue.code, issue.row_number) for issue in issues["stints"]] == [("unknown_driver", 5)]
+    assert [(issue.severity, issue.code, issue.row_number) for issue in issues["pit_events"]] == [
+        ("warning", "pit_lap_without_stint", 3),
+        ("error", "unknown_driver", 4),
+    ]